@@ -1,13 +1,11 @@
 import json
-import requests
 from datetime import datetime
 from collections import Counter
+import os
+import sys
 
-def load_json_remote(url):
-    """Load JSON data from a remote URL."""
-    response = requests.get(url)
-    response.raise_for_status()
-    return response.json()
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from graph_core.fetch import load_json_remote  # noqa: E402
 
 def find_workgroups(obj, workgroup_keys=("workgroup", "workgroups")):
     """
@@ -1,12 +1,10 @@
 import json
-import requests
 from datetime import datetime
+import os
+import sys
 
-def load_json_remote(url):
-    """Load JSON data from a remote URL."""
-    response = requests.get(url)
-    response.raise_for_status()
-    return response.json()
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from graph_core.fetch import load_json_remote  # noqa: E402
 
 def infer_schema(data, level=0):
     """
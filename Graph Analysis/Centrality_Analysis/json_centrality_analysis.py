@@ -1,58 +1,27 @@
+import argparse
 import json
-import requests
 import networkx as nx
-from itertools import combinations
 from datetime import datetime
 import statistics
 import os
+import sys
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from graph_core.snapshot import open_structure  # noqa: E402
+from graph_core.graphs import build_field_graph  # noqa: E402
+from graph_core.shortest_paths import shared_shortest_paths  # noqa: E402
 
-def load_json_remote(url):
-    """Load JSON data from a remote URL."""
-    response = requests.get(url)
-    response.raise_for_status()
-    return response.json()
 
+GRAPH = "fields"
+DEFAULT_OUTPUT = os.path.join("reports", "centrality_analysis_report.md")
 
-def find_field_combinations(obj):
-    """Recursively find sets of co-occurring JSON field names."""
-    results = []
 
-    if isinstance(obj, dict):
-        keys = set(obj.keys())
-        if len(keys) > 1:
-            results.append(keys)
-        for value in obj.values():
-            results.extend(find_field_combinations(value))
-
-    elif isinstance(obj, list):
-        for item in obj:
-            results.extend(find_field_combinations(item))
-
-    return results
-
-
-def build_field_graph(data):
-    """Build a field co-occurrence graph."""
-    G = nx.Graph()
-    cooccurrence_sets = find_field_combinations(data)
-
-    for field_set in cooccurrence_sets:
-        for field in field_set:
-            G.add_node(field)
-        for u, v in combinations(field_set, 2):
-            if G.has_edge(u, v):
-                G[u][v]["weight"] += 1
-            else:
-                G.add_edge(u, v, weight=1)
-    return G
-
-
-def compute_centrality_measures(G):
-    """Compute various centrality metrics for each node."""
+def compute_centrality_measures(G, workers=1):
+    """Compute various centrality metrics for each node (one BFS per source over ``workers`` processes)."""
     degree = nx.degree_centrality(G)
-    betweenness = nx.betweenness_centrality(G)
-    closeness = nx.closeness_centrality(G)
+    paths = shared_shortest_paths(G, workers)
+    betweenness = paths.betweenness()
+    closeness = paths.closeness()
     try:
         eigenvector = nx.eigenvector_centrality(G, max_iter=1000)
     except nx.PowerIterationFailedConvergence:
@@ -131,7 +100,24 @@ def write_markdown_report(G, centrality, output_file):
     print(f"✅ Centrality analysis report saved to: {output_file}")
 
 
+def run(G, output_file=DEFAULT_OUTPUT, workers=1):
+    """Compute centrality measures on the field graph and write the report."""
+    print("📈 Computing centrality measures...")
+    centrality = compute_centrality_measures(G, workers)
+
+    write_markdown_report(G, centrality, output_file)
+
+
 def main():
+    parser = argparse.ArgumentParser(description="JSON field centrality report")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used for the shortest-path sweep behind betweenness and closeness",
+    )
+    args = parser.parse_args()
+
     url = (
         "https://raw.githubusercontent.com/SingularityNET-Archive/"
         "SingularityNET-Archive/refs/heads/main/Data/Snet-Ambassador-Program/"
@@ -142,17 +128,12 @@ def main():
     output_file = os.path.join(output_dir, "centrality_analysis_report.md")
 
     print("📡 Fetching JSON data...")
-    data = load_json_remote(url)
-    print("✅ JSON file downloaded.")
-
-    print("🔍 Building field co-occurrence graph...")
-    G = build_field_graph(data)
+    with open_structure(url) as records:
+        print("🔍 Building field co-occurrence graph...")
+        G = build_field_graph(records)
     print(f"📊 Graph contains {len(G.nodes)} fields and {len(G.edges)} relationships.")
 
-    print("📈 Computing centrality measures...")
-    centrality = compute_centrality_measures(G)
-
-    write_markdown_report(G, centrality, output_file)
+    run(G, output_file, args.workers)
 
 
 if __name__ == "__main__":
@@ -1,54 +1,25 @@
 import json
-import requests
-import networkx as nx
-from itertools import combinations
 from datetime import datetime
 import statistics
 import os
+import sys
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from graph_core.snapshot import open_structure  # noqa: E402
+from graph_core.graphs import build_field_graph  # noqa: E402
+from graph_core.triangles import triangle_stats  # noqa: E402
 
-def load_json_remote(url):
-    """Load JSON data from a remote URL."""
-    response = requests.get(url)
-    response.raise_for_status()
-    return response.json()
-
-
-def find_field_combinations(obj):
-    """Recursively find sets of co-occurring JSON field names."""
-    results = []
-    if isinstance(obj, dict):
-        keys = set(obj.keys())
-        if len(keys) > 1:
-            results.append(keys)
-        for value in obj.values():
-            results.extend(find_field_combinations(value))
-    elif isinstance(obj, list):
-        for item in obj:
-            results.extend(find_field_combinations(item))
-    return results
-
-
-def build_field_graph(data):
-    """Build a field co-occurrence graph."""
-    G = nx.Graph()
-    cooccurrence_sets = find_field_combinations(data)
-    for field_set in cooccurrence_sets:
-        for field in field_set:
-            G.add_node(field)
-        for u, v in combinations(field_set, 2):
-            if G.has_edge(u, v):
-                G[u][v]["weight"] += 1
-            else:
-                G.add_edge(u, v, weight=1)
-    return G
+
+GRAPH = "fields"
+DEFAULT_OUTPUT = os.path.join("reports", "clustering_analysis_report.md")
 
 
 def clustering_analysis(G):
-    """Compute clustering coefficients."""
-    local_clustering = nx.clustering(G, weight="weight")
-    avg_clustering = nx.average_clustering(G, weight="weight")
-    transitivity = nx.transitivity(G)  # global measure
+    """Compute clustering coefficients from one triangle count."""
+    stats = triangle_stats(G, weight="weight")
+    local_clustering = stats["weighted_clustering"]
+    avg_clustering = stats["average_weighted_clustering"]
+    transitivity = stats["transitivity"]  # global measure
     return local_clustering, avg_clustering, transitivity
 
 
@@ -107,6 +78,14 @@ def write_markdown_report(G, local_clustering, avg_clustering, transitivity, out
     print(f"✅ Clustering coefficient report saved to: {output_file}")
 
 
+def run(G, output_file=DEFAULT_OUTPUT):
+    """Compute clustering coefficients of the field graph and write the report."""
+    print("📈 Computing clustering coefficients...")
+    local_clustering, avg_clustering, transitivity = clustering_analysis(G)
+
+    write_markdown_report(G, local_clustering, avg_clustering, transitivity, output_file)
+
+
 def main():
     url = (
         "https://raw.githubusercontent.com/SingularityNET-Archive/"
@@ -118,17 +97,12 @@ def main():
     output_file = os.path.join(output_dir, "clustering_analysis_report.md")
 
     print("📡 Fetching JSON data...")
-    data = load_json_remote(url)
-    print("✅ JSON data successfully loaded.")
-
-    print("🔍 Building co-occurrence graph...")
-    G = build_field_graph(data)
+    with open_structure(url) as records:
+        print("🔍 Building co-occurrence graph...")
+        G = build_field_graph(records)
     print(f"📊 Graph contains {len(G.nodes)} fields and {len(G.edges)} edges.")
 
-    print("📈 Computing clustering coefficients...")
-    local_clustering, avg_clustering, transitivity = clustering_analysis(G)
-
-    write_markdown_report(G, local_clustering, avg_clustering, transitivity, output_file)
+    run(G, output_file)
 
 
 if __name__ == "__main__":
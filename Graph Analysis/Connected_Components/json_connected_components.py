@@ -1,51 +1,22 @@
 import json
-import requests
-import networkx as nx
-from itertools import combinations
 from datetime import datetime
 import os
+import sys
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from graph_core.snapshot import open_structure  # noqa: E402
+from graph_core.components import DisjointSet  # noqa: E402
+from graph_core.graphs import build_field_graph  # noqa: E402
+from graph_core.shortest_paths import shared_shortest_paths  # noqa: E402
 
-def load_json_remote(url):
-    """Load JSON data from a remote URL."""
-    response = requests.get(url)
-    response.raise_for_status()
-    return response.json()
-
-
-def find_field_combinations(obj):
-    """Recursively find sets of co-occurring JSON field names."""
-    results = []
-    if isinstance(obj, dict):
-        keys = set(obj.keys())
-        if len(keys) > 1:
-            results.append(keys)
-        for value in obj.values():
-            results.extend(find_field_combinations(value))
-    elif isinstance(obj, list):
-        for item in obj:
-            results.extend(find_field_combinations(item))
-    return results
-
-
-def build_field_graph(data):
-    """Build a field co-occurrence graph."""
-    G = nx.Graph()
-    cooccurrence_sets = find_field_combinations(data)
-    for field_set in cooccurrence_sets:
-        for field in field_set:
-            G.add_node(field)
-        for u, v in combinations(field_set, 2):
-            if G.has_edge(u, v):
-                G[u][v]["weight"] += 1
-            else:
-                G.add_edge(u, v, weight=1)
-    return G
+
+GRAPH = "fields"
+DEFAULT_OUTPUT = os.path.join("reports", "connected_components_report.md")
 
 
 def connected_components_analysis(G):
-    """Find all connected components (clusters) in the graph."""
-    components = list(nx.connected_components(G))
+    """Find all connected components (clusters) in the graph, by union-find over its edges."""
+    components = DisjointSet.from_graph(G).components()
     component_sizes = [len(c) for c in components]
     num_components = len(components)
     largest_component = max(component_sizes) if component_sizes else 0
@@ -53,6 +24,11 @@ def connected_components_analysis(G):
     return components, num_components, largest_component, avg_size
 
 
+def path_length_analysis(G):
+    """Average shortest path, diameter and distance histogram over connected pairs."""
+    return shared_shortest_paths(G).summary()
+
+
 def interpret_connected_components(num_components, largest_component, avg_size):
     """Interpretation narrative for connected components analysis."""
     interpretation = [
@@ -73,7 +49,7 @@ def interpret_connected_components(num_components, largest_component, avg_size):
     return "\n".join(interpretation)
 
 
-def write_markdown_report(G, components, num_components, largest_component, avg_size, output_file):
+def write_markdown_report(G, components, num_components, largest_component, avg_size, output_file, path_lengths=None):
     """Write connected component results and interpretation to a Markdown file."""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
@@ -94,12 +70,32 @@ def write_markdown_report(G, components, num_components, largest_component, avg_
             f.write(f"### Component {i} ({len(comp)} fields)\n")
             f.write(", ".join(sorted(comp)) + "\n\n")
 
+        if path_lengths:
+            f.write("## Shortest Paths\n")
+            f.write(f"- Connected Field Pairs: {path_lengths['connected_pairs']}\n")
+            f.write(f"- Average Shortest Path Length: {path_lengths['average_shortest_path_length']:.3f}\n")
+            f.write(f"- Diameter (longest shortest path in any component): {path_lengths['diameter']}\n\n")
+            f.write("| Distance | Field Pairs |\n|----------|-------------|\n")
+            for distance, pairs in path_lengths["distance_histogram"]:
+                f.write(f"| {distance} | {pairs} |\n")
+            f.write("\n")
+
         interpretation = interpret_connected_components(num_components, largest_component, avg_size)
         f.write(interpretation)
 
     print(f"✅ Connected Components report saved to: {output_file}")
 
 
+def run(G, output_file=DEFAULT_OUTPUT):
+    """Find the connected components of the field graph and write the report."""
+    print("🔗 Identifying connected components...")
+    components, num_components, largest_component, avg_size = connected_components_analysis(G)
+    print(f"✅ Found {num_components} connected components.")
+    path_lengths = path_length_analysis(G)
+
+    write_markdown_report(G, components, num_components, largest_component, avg_size, output_file, path_lengths)
+
+
 def main():
     url = (
         "https://raw.githubusercontent.com/SingularityNET-Archive/"
@@ -111,18 +107,12 @@ def main():
     output_file = os.path.join(output_dir, "connected_components_report.md")
 
     print("📡 Fetching JSON data...")
-    data = load_json_remote(url)
-    print("✅ JSON data successfully loaded.")
-
-    print("🔍 Building field co-occurrence graph...")
-    G = build_field_graph(data)
+    with open_structure(url) as records:
+        print("🔍 Building field co-occurrence graph...")
+        G = build_field_graph(records)
     print(f"📊 Graph contains {len(G.nodes)} fields and {len(G.edges)} edges.")
 
-    print("🔗 Identifying connected components...")
-    components, num_components, largest_component, avg_size = connected_components_analysis(G)
-    print(f"✅ Found {num_components} connected components.")
-
-    write_markdown_report(G, components, num_components, largest_component, avg_size, output_file)
+    run(G, output_file)
 
 
 if __name__ == "__main__":
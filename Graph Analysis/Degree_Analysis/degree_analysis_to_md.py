@@ -1,49 +1,15 @@
 import json
-import requests
-import networkx as nx
-from itertools import combinations
 from datetime import datetime
+import os
+import sys
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from graph_core.snapshot import open_structure  # noqa: E402
+from graph_core.graphs import build_field_graph  # noqa: E402
 
-def load_json_remote(url):
-    """Load JSON data from a remote URL."""
-    response = requests.get(url)
-    response.raise_for_status()
-    return response.json()
 
-
-def find_field_combinations(obj):
-    """Recursively extract co-occurring field names (keys)."""
-    cooccurrences = []
-
-    if isinstance(obj, dict):
-        keys = set(obj.keys())
-        if len(keys) > 1:
-            cooccurrences.append(keys)
-        for value in obj.values():
-            cooccurrences.extend(find_field_combinations(value))
-
-    elif isinstance(obj, list):
-        for item in obj:
-            cooccurrences.extend(find_field_combinations(item))
-
-    return cooccurrences
-
-
-def build_field_graph(data):
-    """Build a graph where nodes = field names and edges = co-occurrence in the same object."""
-    G = nx.Graph()
-    cooccurrence_sets = find_field_combinations(data)
-
-    for field_set in cooccurrence_sets:
-        for field in field_set:
-            G.add_node(field)
-        for u, v in combinations(field_set, 2):
-            if G.has_edge(u, v):
-                G[u][v]["weight"] += 1
-            else:
-                G.add_edge(u, v, weight=1)
-    return G
+GRAPH = "fields"
+DEFAULT_OUTPUT = "json_field_degree_report.md"
 
 
 def degree_analysis(G):
@@ -74,6 +40,12 @@ def write_markdown_report(degree_dict, output_file):
     print(f"✅ Markdown report saved to: {output_file}")
 
 
+def run(G, output_file=DEFAULT_OUTPUT):
+    """Compute field degrees and write the report."""
+    degree_dict = degree_analysis(G)
+    write_markdown_report(degree_dict, output_file)
+
+
 def main():
     url = (
         "https://raw.githubusercontent.com/SingularityNET-Archive/"
@@ -83,15 +55,12 @@ def main():
     output_file = "json_field_degree_report.md"
 
     print("📡 Fetching JSON from remote source...")
-    data = load_json_remote(url)
-    print("✅ JSON file downloaded.")
-
-    print("🔍 Building field co-occurrence graph...")
-    G = build_field_graph(data)
+    with open_structure(url) as records:
+        print("🔍 Building field co-occurrence graph...")
+        G = build_field_graph(records)
     print(f"📊 Built graph with {len(G.nodes)} fields and {len(G.edges)} relationships.\n")
 
-    degree_dict = degree_analysis(G)
-    write_markdown_report(degree_dict, output_file)
+    run(G, output_file)
 
 
 if __name__ == "__main__":
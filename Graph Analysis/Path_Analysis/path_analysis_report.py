@@ -1,71 +1,23 @@
+import argparse
 import json
-import requests
-import networkx as nx
-from collections import Counter
 from datetime import datetime
 import os
+import sys
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from graph_core.snapshot import open_structure  # noqa: E402
+from graph_core.path_trie import PATH_MODES, PathTrie  # noqa: E402
 
-def load_json_remote(url):
-    """Load JSON data from a remote URL."""
-    response = requests.get(url)
-    response.raise_for_status()
-    return response.json()
-
-
-def extract_json_paths(obj, prefix=""):
-    """
-    Recursively extract all JSON paths in dot notation.
-    Example: {"a": {"b": 1}} -> ["a", "a.b"]
-    """
-    paths = []
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            path = f"{prefix}.{k}" if prefix else k
-            paths.append(path)
-            paths.extend(extract_json_paths(v, path))
-    elif isinstance(obj, list):
-        for i, item in enumerate(obj):
-            path = f"{prefix}[{i}]"
-            paths.append(path)
-            paths.extend(extract_json_paths(item, path))
-    return paths
-
-
-def build_path_graph(paths):
-    """Build a directed graph from JSON paths (parent → child relationships)."""
-    G = nx.DiGraph()
-    for path in paths:
-        if "." in path:
-            parent = path.rsplit(".", 1)[0]
-            G.add_edge(parent, path)
-        elif "[" in path:
-            parent = path.rsplit("[", 1)[0]
-            G.add_edge(parent, path)
-        else:
-            G.add_node(path)
-    return G
-
-
-def path_analysis(paths):
-    """Compute path metrics and structural statistics."""
-    depths = [p.count(".") + p.count("[") for p in paths]
-    max_depth = max(depths) if depths else 0
-    avg_depth = sum(depths) / len(depths) if depths else 0
-
-    # Find deepest paths
-    deepest_paths = [p for p, d in zip(paths, depths) if d == max_depth]
-
-    # Count parent prefixes
-    parent_counts = Counter([p.rsplit(".", 1)[0] if "." in p else p for p in paths])
-
-    return {
-        "total_paths": len(paths),
-        "max_depth": max_depth,
-        "avg_depth": avg_depth,
-        "deepest_paths": deepest_paths[:10],
-        "parent_counts": parent_counts.most_common(10),
-    }
+
+GRAPH = "paths"
+DEFAULT_OUTPUT = os.path.join("reports", "path_analysis_report.md")
+
+
+def path_analysis(trie):
+    """Compute path metrics and structural statistics from a PathTrie."""
+    metrics = trie.metrics(top=10, deepest=10)
+    metrics["parent_counts"] = metrics.pop("parent_top")
+    return metrics
 
 
 def write_markdown_report(analysis, output_file):
@@ -81,7 +33,17 @@ def write_markdown_report(analysis, output_file):
         f.write("## Summary Statistics\n")
         f.write(f"- Total Unique Paths: {analysis['total_paths']}\n")
         f.write(f"- Maximum Depth: {analysis['max_depth']}\n")
-        f.write(f"- Average Depth: {analysis['avg_depth']:.2f}\n\n")
+        f.write(f"- Average Depth: {analysis['avg_depth']:.2f}\n")
+        if analysis["path_mode"] == "template":
+            f.write("- Path Mode: template (array indices collapsed to `[*]`)\n")
+            f.write(f"- Path Occurrences: {analysis['occurrences']}\n")
+        f.write("\n")
+
+        f.write("## Depth Distribution\n")
+        f.write("| Depth | Paths |\n|-------|-------|\n")
+        for depth, count in analysis["depth_histogram"]:
+            f.write(f"| {depth} | {count} |\n")
+        f.write("\n")
 
         f.write("## Deepest JSON Paths\n")
         for p in analysis["deepest_paths"]:
@@ -94,6 +56,19 @@ def write_markdown_report(analysis, output_file):
             f.write(f"| {i} | `{parent}` | {count} |\n")
         f.write("\n")
 
+        if analysis["path_mode"] == "template":
+            f.write("## Most Frequent Template Paths\n")
+            f.write("| Rank | Template Path | Occurrences |\n|------|---------------|-------------|\n")
+            for i, (path, count) in enumerate(analysis["frequent_paths"], 1):
+                f.write(f"| {i} | `{path}` | {count} |\n")
+            f.write("\n")
+
+            f.write("## Array Lengths\n")
+            f.write("| Array Path | Occurrences | Min | Max | Avg |\n|------------|-------------|-----|-----|-----|\n")
+            for path, seen, low, high, avg in analysis["array_lengths"]:
+                f.write(f"| `{path}` | {seen} | {low} | {high} | {avg:.2f} |\n")
+            f.write("\n")
+
         f.write("## Interpretation\n")
         f.write(
             "This report analyzes the structural complexity of the JSON file. "
@@ -105,7 +80,28 @@ def write_markdown_report(analysis, output_file):
     print(f"✅ Path analysis report saved to: {output_file}")
 
 
+def run(trie, output_file=DEFAULT_OUTPUT):
+    """Analyse the paths in ``trie`` and write the report."""
+    print("🔧 Performing path analysis...")
+    analysis = path_analysis(trie)
+
+    print("🧩 Building path graph...")
+    G = trie.to_digraph()
+    print(f"✅ Graph built with {len(G.nodes)} nodes and {len(G.edges)} edges.")
+
+    write_markdown_report(analysis, output_file)
+
+
 def main():
+    parser = argparse.ArgumentParser(description="JSON path structure report")
+    parser.add_argument(
+        "--path-mode",
+        choices=PATH_MODES,
+        default="instance",
+        help="instance: one path per array index; template: collapse indices to [*] and report occurrences and array lengths",
+    )
+    args = parser.parse_args()
+
     url = (
         "https://raw.githubusercontent.com/SingularityNET-Archive/"
         "SingularityNET-Archive/refs/heads/main/Data/Snet-Ambassador-Program/"
@@ -116,21 +112,14 @@ def main():
     output_file = os.path.join(output_dir, "path_analysis_report.md")
 
     print("📡 Fetching JSON data from remote source...")
-    data = load_json_remote(url)
-    print("✅ JSON file downloaded.")
-
     print("🔍 Extracting all JSON paths...")
-    all_paths = extract_json_paths(data)
-    print(f"📊 Extracted {len(all_paths)} unique paths.")
+    trie = PathTrie(template=args.path_mode == "template")
+    with open_structure(url) as records:
+        for i, record in enumerate(records):
+            trie.add(record, i if records.is_array else None)
+    print(f"📊 Extracted {len(trie)} unique paths.")
 
-    print("🔧 Performing path analysis...")
-    analysis = path_analysis(all_paths)
-
-    print("🧩 Building path graph...")
-    G = build_path_graph(all_paths)
-    print(f"✅ Graph built with {len(G.nodes)} nodes and {len(G.edges)} edges.")
-
-    write_markdown_report(analysis, output_file)
+    run(trie, output_file)
 
 
 if __name__ == "__main__":
@@ -1,15 +1,74 @@
 import argparse
-import json
 import os
+import sys
+import time
 import urllib.parse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from itertools import combinations
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import networkx as nx
-import requests
 from collections import Counter
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from graph_core.centrality import (  # noqa: E402
+    CENTRALITY_MODES,
+    DEFAULT_PIVOTS,
+    compute_centrality,
+    describe_centrality,
+    describe_convergence,
+    spectral_centrality,
+)
+from graph_core.assets import ASSET_DIR, compact_graph, read_positions, write_json_asset  # noqa: E402
+from graph_core.components import DisjointSet  # noqa: E402
+from graph_core.fetch import print_cache_stats  # noqa: E402
+from graph_core.graphs import (  # noqa: E402
+    FieldPairCounts,
+    build_graphs,
+)
+from graph_core.incidence import CoAttendanceMatrix  # noqa: E402
+from graph_core.incremental import AnalysisState  # noqa: E402
+from graph_core.layout import DEFAULT_ITERATIONS, force_layout  # noqa: E402
+from graph_core.lod import FULL_EDGE_LIMIT, TOP_EDGES, communities, community_graph, strongest_edges  # noqa: E402
+from graph_core.path_trie import PATH_MODES, PathTrie, PathTrieCollector  # noqa: E402
+from graph_core.shards import (  # noqa: E402
+    ShardCollector,
+    first_appearances,
+    merge_attendance,
+    merge_components,
+    merge_field_sets,
+    merge_paths,
+    merge_timelines,
+    shard_slug,
+    split_by_workgroup,
+)
+from graph_core.shortest_paths import ShortestPaths, shared_shortest_paths  # noqa: E402
+from graph_core.snapshot import Snapshot  # noqa: E402
+from graph_core.sources import (  # noqa: E402
+    DEFAULT_MAX_PER_HOST,
+    DEFAULT_WORKERS,
+    open_sources,
+    print_source_report,
+)
+from graph_core.temporal import (  # noqa: E402
+    DEFAULT_WINDOW_DAYS,
+    DEFAULT_WINDOW_STEP,
+    WINDOW_KINDS,
+    TimelineCollector,
+    day_ordinal,
+    describe_window,
+    temporal_series,
+)
+from graph_core.triangles import triangle_stats  # noqa: E402
+from graph_core.visitor import (  # noqa: E402
+    FieldSetCollector,
+    ParticipantCollector,
+    iter_field_combinations,
+    iter_json_paths,
+    visit_records,
+)
+from graph_core.warm_start import WarmStart, resolve_warm_start  # noqa: E402
+
 
 DEFAULT_INPUT = (
     "https://raw.githubusercontent.com/SingularityNET-Archive/"
@@ -18,19 +77,6 @@ DEFAULT_INPUT = (
 )
 
 
-def is_url(source: str) -> bool:
-    return source.startswith("http://") or source.startswith("https://")
-
-
-def load_json(source: str) -> Any:
-    if is_url(source):
-        resp = requests.get(source)
-        resp.raise_for_status()
-        return resp.json()
-    with open(source, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
 # ---------------- Utility ----------------
 
 def _truncate_label(text: str, max_len: int = 80) -> str:
@@ -70,22 +116,6 @@ def extract_participants(record: Dict[str, Any]) -> List[str]:
     return deduped
 
 
-def build_coattendance_graph(records: Iterable[Any]) -> nx.Graph:
-    G = nx.Graph()
-    for rec in records:
-        participants = extract_participants(rec)
-        if len(participants) < 2:
-            continue
-        for p in participants:
-            G.add_node(p)
-        for u, v in combinations(participants, 2):
-            if G.has_edge(u, v):
-                G[u][v]["weight"] += 1
-            else:
-                G.add_edge(u, v, weight=1)
-    return G
-
-
 def degree_analysis(G: nx.Graph) -> Tuple[Dict[str, int], Counter]:
     degree_dict = dict(G.degree())
     degree_counts = Counter(degree_dict.values())
@@ -95,77 +125,13 @@ def degree_analysis(G: nx.Graph) -> Tuple[Dict[str, int], Counter]:
 # ---------------- JSON Path Structure ----------------
 
 def extract_json_paths(obj: Any, prefix: str = "") -> List[str]:
-    paths: List[str] = []
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            path = f"{prefix}.{k}" if prefix else k
-            paths.append(path)
-            paths.extend(extract_json_paths(v, path))
-    elif isinstance(obj, list):
-        for i, item in enumerate(obj):
-            path = f"{prefix}[{i}]"
-            paths.append(path)
-            paths.extend(extract_json_paths(item, path))
-    return paths
-
-
-def path_metrics(paths: List[str]) -> Dict[str, Any]:
-    depths = [p.count(".") + p.count("[") for p in paths]
-    max_depth = max(depths) if depths else 0
-    avg_depth = (sum(depths) / len(depths)) if depths else 0.0
-    deepest_paths = [p for p, d in zip(paths, depths) if d == max_depth]
-    parent_counts = Counter([p.rsplit(".", 1)[0] if "." in p else p for p in paths])
-    return {
-        "total_paths": len(paths),
-        "max_depth": max_depth,
-        "avg_depth": avg_depth,
-        "deepest_paths": deepest_paths,
-        "parent_counts": parent_counts,
-    }
-
-
-def build_path_graph(paths: List[str]) -> nx.DiGraph:
-    G = nx.DiGraph()
-    for path in paths:
-        if "." in path:
-            parent = path.rsplit(".", 1)[0]
-            G.add_edge(parent, path)
-        elif "[" in path:
-            parent = path.rsplit("[", 1)[0]
-            G.add_edge(parent, path)
-        else:
-            G.add_node(path)
-    return G
+    return list(iter_json_paths(obj, prefix))
 
 
 # ---------------- Field Co-occurrence (Degree, Centrality, Clustering, Components) ----------------
 
-def find_field_combinations(obj: Any) -> List[set]:
-    results: List[set] = []
-    if isinstance(obj, dict):
-        keys = set(obj.keys())
-        if len(keys) > 1:
-            results.append(keys)
-        for v in obj.values():
-            results.extend(find_field_combinations(v))
-    elif isinstance(obj, list):
-        for item in obj:
-            results.extend(find_field_combinations(item))
-    return results
-
-
-def build_field_graph(data: Any) -> nx.Graph:
-    G = nx.Graph()
-    sets = find_field_combinations(data)
-    for s in sets:
-        for k in s:
-            G.add_node(k)
-        for u, v in combinations(s, 2):
-            if G.has_edge(u, v):
-                G[u][v]["weight"] += 1
-            else:
-                G.add_edge(u, v, weight=1)
-    return G
+def find_field_combinations(obj: Any) -> List[List[str]]:
+    return list(iter_field_combinations(obj))
 
 
 def field_degree(G: nx.Graph) -> Tuple[Dict[str, int], Counter]:
@@ -174,43 +140,41 @@ def field_degree(G: nx.Graph) -> Tuple[Dict[str, int], Counter]:
     return degree_dict, degree_counts
 
 
-def compute_centrality_measures(G: nx.Graph) -> Dict[str, Dict[str, float]]:
-    degree = nx.degree_centrality(G) if G.number_of_nodes() else {}
-    betweenness = nx.betweenness_centrality(G) if G.number_of_nodes() else {}
-    closeness = nx.closeness_centrality(G) if G.number_of_nodes() else {}
-    try:
-        eigenvector = nx.eigenvector_centrality(G, max_iter=1000) if G.number_of_nodes() else {}
-    except nx.PowerIterationFailedConvergence:
-        eigenvector = {n: 0.0 for n in G.nodes()}
-    return {
-        "degree": degree,
-        "betweenness": betweenness,
-        "closeness": closeness,
-        "eigenvector": eigenvector,
-    }
-
-
-def clustering_metrics(G: nx.Graph, top: int) -> Tuple[float, List[Tuple[str, float]]]:
+def clustering_metrics(G: nx.Graph, top: int, stats: Optional[Dict[str, Any]] = None) -> Tuple[float, List[Tuple[str, float]]]:
     if G.number_of_nodes() == 0:
         return 0.0, []
-    avg = nx.average_clustering(G)
-    per_node = nx.clustering(G)
+    stats = stats or triangle_stats(G, weight=None)
+    avg = stats["average_clustering"]
+    per_node = stats["clustering"]
     top_nodes = sorted(per_node.items(), key=lambda x: x[1], reverse=True)[:top]
     return avg, top_nodes
 
 
-def connected_components_info(G: nx.Graph, top: int) -> Dict[str, Any]:
-    if G.number_of_nodes() == 0:
-        return {"component_count": 0, "component_sizes": [], "largest_component_sample": []}
-    components = sorted(nx.connected_components(G), key=len, reverse=True)
-    sizes = [len(c) for c in components]
-    largest = list(components[0]) if components else []
-    sample = largest[:top]
-    return {"component_count": len(components), "component_sizes": sizes, "largest_component_sample": sample}
+def connected_components_info(
+    G: nx.Graph, top: int, paths: Optional[ShortestPaths] = None, components: Optional[DisjointSet] = None
+) -> Dict[str, Any]:
+    """Component summary from the union-find filled during ingestion (or, failing that, from ``G``'s edges)."""
+    if components is None:
+        components = DisjointSet.from_graph(G)
+    info = components.summary(top)
+    if paths is not None:
+        info["path_lengths"] = paths.summary()
+    return info
+
+
+def spectral_top(scores: Dict[str, Dict[str, float]], top: int) -> List[Tuple[str, float, float]]:
+    """(node, eigenvector, pagerank) rows for the ``top`` people by PageRank."""
+    pagerank, eigenvector = scores["pagerank"], scores["eigenvector"]
+    ranked = sorted(pagerank.items(), key=lambda x: x[1], reverse=True)[:top]
+    return [(node, eigenvector.get(node, 0.0), pr) for node, pr in ranked]
 
 
 # ---------------- Report Writer ----------------
 
+def window_leaders(leaders: List[Tuple[str, int]]) -> str:
+    return ", ".join(f"{_truncate_label(node, 30)} ({deg})" for node, deg in leaders)
+
+
 def write_report(
     output_file: str,
     summary: Dict[str, Any],
@@ -225,11 +189,17 @@ def write_report(
     centrality: Dict[str, Dict[str, float]],
     clustering: Tuple[float, List[Tuple[str, float]]],
     components: Dict[str, Any],
+    centrality_info: Optional[Dict[str, Any]] = None,
+    attend_spectral: Optional[Tuple[Dict[str, Dict[str, float]], List[Dict[str, Any]]]] = None,
+    triangles: Optional[Dict[str, Dict[str, Any]]] = None,
+    temporal: Optional[Dict[str, Any]] = None,
+    workgroups: Optional[List[Dict[str, Any]]] = None,
+    title: str = "Unified Graph Analysis Report",
 ) -> None:
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     with open(output_file, "w", encoding="utf-8") as f:
-        f.write("# Unified Graph Analysis Report\n")
+        f.write(f"# {title}\n")
         f.write(f"**Generated on:** {timestamp}\n\n")
 
         # Summary
@@ -239,6 +209,21 @@ def write_report(
             f.write(f"- {k}: {v}\n")
         f.write("\n")
 
+        if workgroups:
+            f.write("## Workgroups\n")
+            f.write(
+                "Each workgroup's meetings were analysed on their own; the graphs above merge what the workgroups counted. "
+                "A person who attends several workgroups appears in each of their graphs.\n\n"
+            )
+            f.write("| Workgroup | Meetings | People | Edges | Field nodes | Top person (degree) | Report |\n")
+            f.write("|-----------|----------|--------|-------|-------------|---------------------|--------|\n")
+            for row in workgroups:
+                f.write(
+                    f"| {_truncate_label(row['workgroup'], 40)} | {row['meetings']} | {row['people']} | {row['edges']} | "
+                    f"{row['field_nodes']} | {window_leaders(row['top'])} | [{row['slug']}]({row['report']}) |\n"
+                )
+            f.write("\n")
+
         # Participant-only Degree (Co-attendance)
         f.write("## Degree (Co-attendance) Analysis\n")
         f.write("People are connected if they attend the same meeting; a person's degree is how many unique people they co-attended with.\n\n")
@@ -255,6 +240,46 @@ def write_report(
         for d, c in attend_dist:
             f.write(f"| {d} | {c} |\n")
         f.write("\n")
+        if attend_spectral:
+            scores, diagnostics = attend_spectral
+            f.write("### Top People by PageRank\n")
+            f.write("Weighted by co-attendance counts: PageRank and eigenvector centrality favour people who meet often with other well-connected people.\n\n")
+            f.write("| Rank | Node | PageRank | Eigenvector |\n|------|------|----------|-------------|\n")
+            for i, (node, eig, pr) in enumerate(spectral_top(scores, len(attend_top)), 1):
+                label = _truncate_label(node, 80)
+                f.write(f"| {i} | {label} | {pr:.4f} | {eig:.4f} |\n")
+            f.write("\n")
+            f.write("### Convergence Diagnostics\n")
+            f.write("Start vector, iterations, final L1 change between iterates and runtime of each iterative solver; warm starts reuse the previous run's scores.\n\n")
+            f.write("| Measure | Method | Start | Iterations | Converged | Residual | Time |\n")
+            f.write("|---------|--------|-------|------------|-----------|----------|------|\n")
+            for row in describe_convergence(diagnostics):
+                f.write("| " + " | ".join(row) + " |\n")
+            f.write("\n")
+        attend_triangles = (triangles or {}).get("attendance")
+        if attend_triangles:
+            f.write("### Clustering\n")
+            f.write("How often two people who share meetings with someone also share a meeting with each other; the weighted coefficient counts triangles of frequent co-attendance more.\n\n")
+            f.write(f"- Average Clustering Coefficient: {attend_triangles['average_clustering']:.3f}\n")
+            f.write(f"- Average Weighted Clustering Coefficient: {attend_triangles['average_weighted_clustering']:.3f}\n")
+            f.write(f"- Transitivity: {attend_triangles['transitivity']:.3f}\n")
+            f.write(f"- Triangles: {sum(attend_triangles['triangles'].values()) // 3}\n\n")
+
+        # Temporal Co-attendance
+        if temporal:
+            f.write("## Temporal Co-attendance\n")
+            f.write("The co-attendance graph of each time window by meeting date: who was active, how densely they met and whether they split into separate groups.\n\n")
+            f.write(f"- Windows: {len(temporal['windows'])} {describe_window(temporal)}\n")
+            f.write(f"- Dated Meetings: {temporal['dated_meetings']}\n")
+            f.write(f"- Meetings Without a Date: {temporal['undated_meetings']}\n\n")
+            f.write("| Window | Start | End | Meetings | People | Edges | Density | Components | Degree Leaders |\n")
+            f.write("|--------|-------|-----|----------|--------|-------|---------|------------|----------------|\n")
+            for w in temporal["windows"]:
+                f.write(
+                    f"| {w['label']} | {w['start']} | {w['end']} | {w['meetings']} | {w['people']} | "
+                    f"{w['edges']} | {w['density']:.3f} | {w['components']} | {window_leaders(w['leaders'])} |\n"
+                )
+            f.write("\n")
 
         # JSON Field Degree Analysis
         f.write("## JSON Field Degree Analysis\n")
@@ -278,7 +303,18 @@ def write_report(
         f.write("Each JSON path represents a unique nested route (keys/array indices); depth shows how deeply information is nested.\n\n")
         f.write(f"- Total Unique Paths: {path_info['total_paths']}\n")
         f.write(f"- Maximum Depth: {path_info['max_depth']}\n")
-        f.write(f"- Average Depth: {path_info['avg_depth']:.2f}\n\n")
+        f.write(f"- Average Depth: {path_info['avg_depth']:.2f}\n")
+        if path_info.get("path_mode") == "template":
+            f.write("- Path Mode: template (array indices collapsed to `[*]`)\n")
+            f.write(f"- Path Occurrences: {path_info['occurrences']}\n")
+        f.write("\n")
+        if path_info.get("depth_histogram"):
+            f.write("### Depth Distribution\n")
+            f.write("How many paths sit at each nesting depth.\n\n")
+            f.write("| Depth | Count of Paths |\n|-------|----------------|\n")
+            for d, c in path_info["depth_histogram"]:
+                f.write(f"| {d} | {c} |\n")
+            f.write("\n")
         f.write("### Deepest JSON Paths (sample)\n")
         f.write("The deepest examples indicate where the data structure is most nested.\n\n")
         for p in path_info["deepest_paths"][:10]:
@@ -290,6 +326,19 @@ def write_report(
         for i, (parent, cnt) in enumerate(parent_top, 1):
             f.write(f"| {i} | `{parent}` | {cnt} |\n")
         f.write("\n")
+        if path_info.get("path_mode") == "template":
+            f.write("### Most Frequent Template Paths\n")
+            f.write("How many times each schema path occurs across all records and array items.\n\n")
+            f.write("| Rank | Template Path | Occurrences |\n|------|---------------|-------------|\n")
+            for i, (path, cnt) in enumerate(path_info["frequent_paths"], 1):
+                f.write(f"| {i} | `{path}` | {cnt} |\n")
+            f.write("\n")
+            f.write("### Array Lengths\n")
+            f.write("Length of each array across its occurrences.\n\n")
+            f.write("| Array Path | Occurrences | Min | Max | Avg |\n|------------|-------------|-----|-----|-----|\n")
+            for path, seen, low, high, avg in path_info["array_lengths"]:
+                f.write(f"| `{path}` | {seen} | {low} | {high} | {avg:.2f} |\n")
+            f.write("\n")
 
         # Centrality
         f.write("## Field Centrality (Co-occurrence)\n")
@@ -307,12 +356,23 @@ def write_report(
                 f"{metrics['eigenvector'].get(node, 0):.3f} |\n"
             )
         f.write("\n")
+        if centrality_info:
+            f.write("### Centrality Method\n")
+            f.write("How the scores above were computed; approximate mode samples pivot sources instead of running a search from every node.\n\n")
+            f.write("| Setting | Value |\n|---------|-------|\n")
+            for label, value in describe_centrality(centrality_info):
+                f.write(f"| {label} | {value} |\n")
+            f.write("\n")
 
         # Clustering
         avg_clust, top_clust_nodes = clustering
         f.write("## Clustering (Field Co-occurrence Graph)\n")
         f.write("Clustering measures how tightly a field's neighbors are connected to each other (higher means more triads).\n\n")
-        f.write(f"- Average Clustering Coefficient: {avg_clust:.3f}\n\n")
+        f.write(f"- Average Clustering Coefficient: {avg_clust:.3f}\n")
+        field_triangles = (triangles or {}).get("fields")
+        if field_triangles:
+            f.write(f"- Transitivity: {field_triangles['transitivity']:.3f}\n")
+        f.write("\n")
         f.write("### Top Nodes by Clustering Coefficient\n")
         f.write("Fields whose immediate neighborhoods are most tightly interlinked.\n\n")
         f.write("| Rank | Field | Clustering |\n|------|-------|------------|\n")
@@ -329,14 +389,17 @@ def write_report(
         for n in components["largest_component_sample"][:10]:
             f.write(f"  - {n}\n")
         f.write("\n")
-
-
-def ensure_iterable_records(data: Any) -> List[Any]:
-    if isinstance(data, list):
-        return data
-    if isinstance(data, dict):
-        return [data]
-    return []
+        path_lengths = components.get("path_lengths")
+        if path_lengths:
+            f.write("### Shortest Paths\n")
+            f.write("Distances between fields in the same component, from the BFS sweep that also produced betweenness and closeness.\n\n")
+            f.write(f"- Connected Field Pairs: {path_lengths['connected_pairs']}\n")
+            f.write(f"- Average Shortest Path Length: {path_lengths['average_shortest_path_length']:.3f}\n")
+            f.write(f"- Diameter: {path_lengths['diameter']}\n\n")
+            f.write("| Distance | Field Pairs |\n|----------|-------------|\n")
+            for distance, pairs in path_lengths["distance_histogram"]:
+                f.write(f"| {distance} | {pairs} |\n")
+            f.write("\n")
 
 
 # ---------------- HTML Report Writer ----------------
@@ -397,8 +460,52 @@ def write_html_report(
     centrality: Dict[str, Dict[str, float]],
     clustering: Tuple[float, List[Tuple[str, float]]],
     components: Dict[str, Any],
-) -> None:
+    centrality_info: Optional[Dict[str, Any]] = None,
+    attend_spectral: Optional[Tuple[Dict[str, Dict[str, float]], List[Dict[str, Any]]]] = None,
+    triangles: Optional[Dict[str, Dict[str, Any]]] = None,
+    temporal: Optional[Dict[str, Any]] = None,
+    workgroups: Optional[List[Dict[str, Any]]] = None,
+    positions: Optional[Dict[str, Tuple[float, float]]] = None,
+    communities: Optional[List[List[str]]] = None,
+    top_edges: int = TOP_EDGES,
+    full_limit: int = FULL_EDGE_LIMIT,
+) -> Dict[str, Tuple[int, int]]:
+    """Write the dashboard page and its data assets; return each asset's size and gzipped size."""
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    # The graph and series are fetched by script.js when their tab opens, not parsed with the page.
+    asset_dir = os.path.join(os.path.dirname(output_file), ASSET_DIR)
+    assets = {"coattendance.json": write_json_asset(os.path.join(asset_dir, "coattendance.json"), compact_graph(attend_graph, positions))}
+    people, ties = attend_graph.number_of_nodes(), attend_graph.number_of_edges()
+    levels = [(f"{ASSET_DIR}/coattendance.json", f"Everyone ({people} people, {ties} ties)")]
+    initial = levels[0][0]
+    if communities:
+        # Levels of detail (graph_core/lod.py): a bounded community overview first, then
+        # everyone's strongest ties, one asset per community and the whole graph on request.
+        community_dir = os.path.join(asset_dir, "communities")
+        if os.path.isdir(community_dir):
+            # The number of communities changes with the data: drop the last run's files.
+            for name in os.listdir(community_dir):
+                if name.startswith("community-"):
+                    os.remove(os.path.join(community_dir, name))
+        names = [f"communities/community-{c:03d}.json" for c in range(1, len(communities) + 1)]
+        overview = community_graph(attend_graph, communities, positions, [f"{ASSET_DIR}/{name}" for name in names])
+        assets["coattendance-communities.json"] = write_json_asset(os.path.join(asset_dir, "coattendance-communities.json"), overview)
+        strongest = strongest_edges(attend_graph, top_edges)
+        assets["coattendance-strongest.json"] = write_json_asset(
+            os.path.join(asset_dir, "coattendance-strongest.json"), compact_graph(attend_graph, positions, edges=strongest)
+        )
+        for name, group in zip(names, communities):
+            members = attend_graph.subgraph(group).edges(data="weight", default=1)
+            assets[name] = write_json_asset(os.path.join(asset_dir, name), compact_graph(attend_graph, positions, nodes=group, edges=members))
+        levels = [
+            (f"{ASSET_DIR}/coattendance-communities.json", f"Communities ({len(communities)} groups, {len(overview['edges']) // 3} links)"),
+            (f"{ASSET_DIR}/coattendance-strongest.json", f"Strongest ties ({people} people, {len(strongest)} of {ties} ties)"),
+        ] + levels
+        if ties > full_limit:
+            initial = levels[0][0]
+    if temporal:
+        series = {key: [w[key] for w in temporal["windows"]] for key in ("label", "meetings", "people", "edges", "density", "components")}
+        assets["temporal.json"] = write_json_asset(os.path.join(asset_dir, "temporal.json"), series)
     
     with open(output_file, "w", encoding="utf-8") as f:
         f.write("""<!DOCTYPE html>
@@ -418,6 +525,14 @@ def write_html_report(
             background-color: #ffffff;
             margin: 20px 0;
         }
+        #coattendance-levels {
+            margin-top: 20px;
+            color: #586069;
+        }
+        #coattendance-levels select {
+            margin: 0 10px;
+            padding: 4px 8px;
+        }
     </style>
 </head>
 <body>
@@ -430,7 +545,8 @@ def write_html_report(
         <div class="tabs">
             <button class="tab-button active" onclick="showTab('summary')">Summary</button>
             <button class="tab-button" onclick="showTab('coattendance')">Co-attendance Degree</button>
-            <button class="tab-button" onclick="showTab('field-degree')">Field Degree</button>
+""" + ("""            <button class="tab-button" onclick="showTab('temporal')">Temporal</button>
+""" if temporal else "") + """            <button class="tab-button" onclick="showTab('field-degree')">Field Degree</button>
             <button class="tab-button" onclick="showTab('path-structure')">Path Structure</button>
             <button class="tab-button" onclick="showTab('centrality')">Centrality</button>
             <button class="tab-button" onclick="showTab('clustering')">Clustering</button>
@@ -448,7 +564,27 @@ def write_html_report(
         for k, v in summary.items():
             f.write(f"                    <li><strong>{k}:</strong> {v}</li>\n")
         f.write("""                </ul>
-            </div>
+""")
+        if workgroups:
+            f.write("""
+                <h3>Workgroups</h3>
+                <p class="explanation">Each workgroup's meetings were analysed on their own; the graphs in this report merge what the workgroups counted. A person who attends several workgroups appears in each of their graphs.</p>
+                <table>
+                    <thead>
+                        <tr><th>Workgroup</th><th>Meetings</th><th>People</th><th>Edges</th><th>Field nodes</th><th>Top person (degree)</th></tr>
+                    </thead>
+                    <tbody>
+""")
+            for row in workgroups:
+                f.write(
+                    f"                        <tr><td>{_truncate_label(row['workgroup'], 40)}</td><td>{row['meetings']}</td>"
+                    f"<td>{row['people']}</td><td>{row['edges']}</td><td>{row['field_nodes']}</td>"
+                    f"<td>{window_leaders(row['top'])}</td></tr>\n"
+                )
+            f.write("""                    </tbody>
+                </table>
+""")
+        f.write("""            </div>
 
             <!-- Co-attendance Degree Tab -->
             <div id="coattendance" class="tab-pane">
@@ -460,8 +596,26 @@ def write_html_report(
                     Visual representation of the co-attendance graph. <strong>Nodes represent people</strong>, with size and color indicating degree (number of connections) - larger, darker nodes have more connections. <strong>Edges represent co-attendance</strong> - thicker, darker edges indicate more frequent co-attendance. 
                     <br><br>
                     <strong>Interactions:</strong> Use mouse wheel to zoom, click and drag to pan, drag nodes to reposition. Hover over nodes or edges to see detailed information. Click on a node to highlight its connections.
-                </p>
-                <div id="coattendance-network"></div>
+""")
+        if communities:
+            f.write(f"""                    <br><br>
+                    <strong>Levels of detail:</strong> Large graphs open on their communities: each node is a group of people who often meet together, sized by its members, and edges add up the co-attendance between groups. Click a community to see its members and all their ties, and click the background to go back. The menu switches to everyone with only the ties among either person's {top_edges} strongest ({top_edges} × people edges at most; a popular person can keep more than {top_edges}), or to the whole graph.
+""")
+        f.write("""                </p>
+""")
+        if communities:
+            f.write("""                <div id="coattendance-levels">
+                    <label for="coattendance-level">Level of detail:</label>
+                    <select id="coattendance-level" onchange="showCoattendanceLevel(this.value)">
+""")
+            for src, caption in levels:
+                selected = " selected" if src == initial else ""
+                f.write(f"""                        <option value="{src}"{selected}>{caption}</option>\n""")
+            f.write("""                    </select>
+                    <span id="coattendance-level-info"></span>
+                </div>
+""")
+        f.write(f"""                <div id="coattendance-network" data-src="{initial}"></div>
                 
                 <h3>Top Nodes by Degree</h3>
                 <p class="explanation">These are the people connected to the most unique others across meetings.</p>
@@ -489,9 +643,86 @@ def write_html_report(
             f.write(f"                        <tr><td>{d}</td><td>{c}</td></tr>\n")
         f.write("""                    </tbody>
                 </table>
-                """ + _review_form("coattendance") + """
-            </div>
+""")
+        if attend_spectral:
+            scores, diagnostics = attend_spectral
+            f.write("""
+                <h3>Top People by PageRank</h3>
+                <p class="explanation">Weighted by co-attendance counts: PageRank and eigenvector centrality favour people who meet often with other well-connected people.</p>
+                <table>
+                    <thead>
+                        <tr><th>Rank</th><th>Node</th><th>PageRank</th><th>Eigenvector</th></tr>
+                    </thead>
+                    <tbody>
+""")
+            for i, (node, eig, pr) in enumerate(spectral_top(scores, len(attend_top)), 1):
+                label = _truncate_label(node, 80)
+                f.write(f"                        <tr><td>{i}</td><td>{label}</td><td>{pr:.4f}</td><td>{eig:.4f}</td></tr>\n")
+            f.write("""                    </tbody>
+                </table>
 
+                <h3>Convergence Diagnostics</h3>
+                <p class="explanation">Start vector, iterations, final L1 change between iterates and runtime of each iterative solver; warm starts reuse the previous run's scores.</p>
+                <table>
+                    <thead>
+                        <tr><th>Measure</th><th>Method</th><th>Start</th><th>Iterations</th><th>Converged</th><th>Residual</th><th>Time</th></tr>
+                    </thead>
+                    <tbody>
+""")
+            for row in describe_convergence(diagnostics):
+                f.write("                        <tr>" + "".join(f"<td>{v}</td>" for v in row) + "</tr>\n")
+            f.write("""                    </tbody>
+                </table>
+""")
+        attend_triangles = (triangles or {}).get("attendance")
+        if attend_triangles:
+            f.write("""
+                <h3>Clustering</h3>
+                <p class="explanation">How often two people who share meetings with someone also share a meeting with each other; the weighted coefficient counts triangles of frequent co-attendance more.</p>
+                <ul class="summary-list">
+""")
+            f.write(f"                    <li><strong>Average Clustering Coefficient:</strong> {attend_triangles['average_clustering']:.3f}</li>\n")
+            f.write(f"                    <li><strong>Average Weighted Clustering Coefficient:</strong> {attend_triangles['average_weighted_clustering']:.3f}</li>\n")
+            f.write(f"                    <li><strong>Transitivity:</strong> {attend_triangles['transitivity']:.3f}</li>\n")
+            f.write(f"                    <li><strong>Triangles:</strong> {sum(attend_triangles['triangles'].values()) // 3}</li>\n")
+            f.write("""                </ul>
+""")
+        f.write("""                """ + _review_form("coattendance") + """
+            </div>
+""")
+        if temporal:
+            f.write("""
+            <!-- Temporal Co-attendance Tab -->
+            <div id="temporal" class="tab-pane">
+                <h2>Temporal Co-attendance</h2>
+                <p class="explanation">The co-attendance graph of each time window by meeting date: who was active, how densely they met and whether they split into separate groups.</p>
+                <ul class="summary-list">
+""")
+            f.write(f"                    <li><strong>Windows:</strong> {len(temporal['windows'])} {describe_window(temporal)}</li>\n")
+            f.write(f"                    <li><strong>Dated Meetings:</strong> {temporal['dated_meetings']}</li>\n")
+            f.write(f"                    <li><strong>Meetings Without a Date:</strong> {temporal['undated_meetings']}</li>\n")
+            f.write("""                </ul>
+""")
+            f.write(f"""                <canvas id="temporal-chart" height="110" data-src="{ASSET_DIR}/temporal.json"></canvas>
+""")
+            f.write("""
+                <table>
+                    <thead>
+                        <tr><th>Window</th><th>Start</th><th>End</th><th>Meetings</th><th>People</th><th>Edges</th><th>Density</th><th>Components</th><th>Degree Leaders</th></tr>
+                    </thead>
+                    <tbody>
+""")
+            for w in temporal["windows"]:
+                f.write(
+                    f"                        <tr><td>{w['label']}</td><td>{w['start']}</td><td>{w['end']}</td>"
+                    f"<td>{w['meetings']}</td><td>{w['people']}</td><td>{w['edges']}</td><td>{w['density']:.3f}</td>"
+                    f"<td>{w['components']}</td><td>{window_leaders(w['leaders'])}</td></tr>\n"
+                )
+            f.write("""                    </tbody>
+                </table>
+            </div>
+""")
+        f.write("""
             <!-- Field Degree Tab -->
             <div id="field-degree" class="tab-pane">
                 <h2>JSON Field Degree Analysis</h2>
@@ -535,8 +766,28 @@ def write_html_report(
                     <li><strong>Total Unique Paths:</strong> """ + str(path_info['total_paths']) + """</li>
                     <li><strong>Maximum Depth:</strong> """ + str(path_info['max_depth']) + """</li>
                     <li><strong>Average Depth:</strong> """ + f"{path_info['avg_depth']:.2f}" + """</li>
-                </ul>
-
+""")
+        if path_info.get("path_mode") == "template":
+            f.write("                    <li><strong>Path Mode:</strong> template (array indices collapsed to <code>[*]</code>)</li>\n")
+            f.write(f"                    <li><strong>Path Occurrences:</strong> {path_info['occurrences']}</li>\n")
+        f.write("""                </ul>
+""")
+        if path_info.get("depth_histogram"):
+            f.write("""
+                <h3>Depth Distribution</h3>
+                <p class="explanation">How many paths sit at each nesting depth.</p>
+                <table>
+                    <thead>
+                        <tr><th>Depth</th><th>Count of Paths</th></tr>
+                    </thead>
+                    <tbody>
+""")
+            for d, c in path_info["depth_histogram"]:
+                f.write(f"                        <tr><td>{d}</td><td>{c}</td></tr>\n")
+            f.write("""                    </tbody>
+                </table>
+""")
+        f.write("""
                 <h3>Deepest JSON Paths (sample)</h3>
                 <p class="explanation">The deepest examples indicate where the data structure is most nested.</p>
                 <ul class="path-list">
@@ -557,7 +808,39 @@ def write_html_report(
             f.write(f"                        <tr><td>{i}</td><td><code>{parent}</code></td><td>{cnt}</td></tr>\n")
         f.write("""                    </tbody>
                 </table>
-                """ + _review_form("path-structure") + """
+""")
+        if path_info.get("path_mode") == "template":
+            f.write("""
+                <h3>Most Frequent Template Paths</h3>
+                <p class="explanation">How many times each schema path occurs across all records and array items.</p>
+                <table>
+                    <thead>
+                        <tr><th>Rank</th><th>Template Path</th><th>Occurrences</th></tr>
+                    </thead>
+                    <tbody>
+""")
+            for i, (path, cnt) in enumerate(path_info["frequent_paths"], 1):
+                f.write(f"                        <tr><td>{i}</td><td><code>{path}</code></td><td>{cnt}</td></tr>\n")
+            f.write("""                    </tbody>
+                </table>
+
+                <h3>Array Lengths</h3>
+                <p class="explanation">Length of each array across its occurrences.</p>
+                <table>
+                    <thead>
+                        <tr><th>Array Path</th><th>Occurrences</th><th>Min</th><th>Max</th><th>Avg</th></tr>
+                    </thead>
+                    <tbody>
+""")
+            for path, seen, low, high, avg in path_info["array_lengths"]:
+                f.write(
+                    f"                        <tr><td><code>{path}</code></td><td>{seen}</td>"
+                    f"<td>{low}</td><td>{high}</td><td>{avg:.2f}</td></tr>\n"
+                )
+            f.write("""                    </tbody>
+                </table>
+""")
+        f.write("""                """ + _review_form("path-structure") + """
             </div>
 
             <!-- Centrality Tab -->
@@ -583,7 +866,23 @@ def write_html_report(
             )
         f.write("""                    </tbody>
                 </table>
-                """ + _review_form("centrality") + """
+""")
+        if centrality_info:
+            f.write("""
+                <h3>Centrality Method</h3>
+                <p class="explanation">How the scores above were computed; approximate mode samples pivot sources instead of running a search from every node.</p>
+                <table>
+                    <thead>
+                        <tr><th>Setting</th><th>Value</th></tr>
+                    </thead>
+                    <tbody>
+""")
+            for label, value in describe_centrality(centrality_info):
+                f.write(f"                        <tr><td>{label}</td><td>{value}</td></tr>\n")
+            f.write("""                    </tbody>
+                </table>
+""")
+        f.write("""                """ + _review_form("centrality") + """
             </div>
 
             <!-- Clustering Tab -->
@@ -595,7 +894,11 @@ def write_html_report(
         avg_clust, top_clust_nodes = clustering
         f.write(f"{avg_clust:.3f}")
         f.write("""</p>
-
+""")
+        field_triangles = (triangles or {}).get("fields")
+        if field_triangles:
+            f.write(f"                <p><strong>Transitivity:</strong> {field_triangles['transitivity']:.3f}</p>\n")
+        f.write("""
                 <h3>Top Nodes by Clustering Coefficient</h3>
                 <p class="explanation">Fields whose immediate neighborhoods are most tightly interlinked.</p>
                 <table>
@@ -627,7 +930,29 @@ def write_html_report(
         for n in components["largest_component_sample"][:10]:
             f.write(f"                    <li>{n}</li>\n")
         f.write("""                </ul>
-                """ + _review_form("components") + """
+""")
+        path_lengths = components.get("path_lengths")
+        if path_lengths:
+            f.write("""
+                <h3>Shortest Paths</h3>
+                <p class="explanation">Distances between fields in the same component, from the BFS sweep that also produced betweenness and closeness.</p>
+                <ul class="summary-list">
+                    <li><strong>Connected Field Pairs:</strong> """ + str(path_lengths["connected_pairs"]) + """</li>
+                    <li><strong>Average Shortest Path Length:</strong> """ + f"{path_lengths['average_shortest_path_length']:.3f}" + """</li>
+                    <li><strong>Diameter:</strong> """ + str(path_lengths["diameter"]) + """</li>
+                </ul>
+                <table>
+                    <thead>
+                        <tr><th>Distance</th><th>Field Pairs</th></tr>
+                    </thead>
+                    <tbody>
+""")
+            for distance, pairs in path_lengths["distance_histogram"]:
+                f.write(f"                        <tr><td>{distance}</td><td>{pairs}</td></tr>\n")
+            f.write("""                    </tbody>
+                </table>
+""")
+        f.write("""                """ + _review_form("components") + """
             </div>
 
             <!-- Audit Tab -->
@@ -641,42 +966,248 @@ def write_html_report(
         </div>
     </div>
 
-    <script type="text/javascript">
-        // Convert co-attendance graph to vis-network format
-        const coattendanceGraphData = {
-            nodes: """ + json.dumps([
-                {
-                    "id": node,
-                    "label": _truncate_label(node, 30),
-                    "value": deg,
-                    "title": f"{node} - Degree: {deg}"
-                }
-                for node, deg in attend_graph.degree()
-            ], ensure_ascii=False) + """,
-            edges: """ + json.dumps([
-                {
-                    "from": u,
-                    "to": v,
-                    "value": attend_graph[u][v].get("weight", 1),
-                    "title": f"Co-attended {attend_graph[u][v].get('weight', 1)} time(s)"
-                }
-                for u, v in attend_graph.edges()
-            ], ensure_ascii=False) + """
-        };
-    </script>
     <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
     <script src="script.js"></script>
 </body>
 </html>
 """)
+    return assets
+
+
+def analyze(
+    G_attend: nx.Graph,
+    G_fields: nx.Graph,
+    path_trie: PathTrie,
+    field_components: DisjointSet,
+    args: argparse.Namespace,
+    warm: Optional[WarmStart] = None,
+    timeline: Optional[TimelineCollector] = None,
+    workers: int = 1,
+    verbose: bool = True,
+) -> Dict[str, Any]:
+    """Run every analysis on the built graphs; return the keyword arguments shared by both report writers."""
+    attend_deg_dict, attend_deg_counts = degree_analysis(G_attend)
+    attend_top = sorted(attend_deg_dict.items(), key=lambda x: x[1], reverse=True)[: args.limit_top]
+    attend_dist = sorted(attend_deg_counts.items(), key=lambda x: x[0])
+    attend_scores, attend_diagnostics = spectral_centrality(G_attend, warm=warm)
+    if verbose:
+        print(
+            "📈 Co-attendance PageRank/eigenvector: "
+            + ", ".join(f"{d['measure']} {d['iterations']} it{'' if d['converged'] else ' (not converged)'}" for d in attend_diagnostics)
+        )
+
+    temporal = None
+    if timeline is not None:
+        # Windows slide by adding entering and subtracting leaving meetings' pairs.
+        temporal = temporal_series(
+            timeline.meetings, args.temporal, args.window_days, args.window_step, undated=timeline.undated
+        )
+        if verbose:
+            print(
+                f"🕒 Temporal co-attendance: {len(temporal['windows'])} {describe_window(temporal)}, "
+                f"{temporal['pair_updates']} pair updates ({temporal['rebuild_pairs']} if rebuilt per window), "
+                f"{temporal['seconds']:.2f}s"
+            )
+
+    # Path analysis
+    pmetrics = path_trie.metrics(top=args.limit_top)
+    parent_top = pmetrics["parent_top"]
+    G_paths = path_trie.to_digraph()
+
+    # Field degree (JSON Field Degree Analysis)
+    fdeg_dict, fdeg_counts = field_degree(G_fields)
+    field_top = sorted(fdeg_dict.items(), key=lambda x: x[1], reverse=True)[: args.limit_top]
+    field_dist = sorted(fdeg_counts.items(), key=lambda x: x[0])
+
+    # Centrality on field graph
+    centrality, centrality_info = compute_centrality(
+        G_fields,
+        mode=args.centrality_mode,
+        k=args.centrality_pivots,
+        seed=args.centrality_seed,
+        workers=workers,
+        warm=warm,
+    )
+    if verbose:
+        print(f"📈 Centrality: {centrality_info['mode']} mode, {sum(centrality_info['runtime'].values()):.2f}s")
+    if warm:
+        warm.save()
+        saved = sum(d.get("iterations_saved", 0) for d in attend_diagnostics + [centrality_info["eigenvector"]])
+        print(f"🔧 Warm start: {saved} power iterations saved; scores kept in {warm.path}")
+
+    # Clustering & components on field graph
+    # Triangles are counted once per graph; every clustering number is read from them.
+    field_triangles = triangle_stats(G_fields, weight=None)
+    attend_triangles = triangle_stats(G_attend)
+    avg_clust, top_clust_nodes = clustering_metrics(G_fields, args.limit_top, field_triangles)
+    # Exact centrality already ran the all-pairs BFS; its path lengths come for free.
+    paths = shared_shortest_paths(G_fields, workers) if centrality_info["mode"] == "exact" else None
+    components = connected_components_info(G_fields, args.limit_top, paths, field_components)
+
+    summary = {
+        "Co-attendance graph (nodes)": len(G_attend.nodes),
+        "Co-attendance graph (edges)": len(G_attend.edges),
+        "Path graph (nodes)": len(G_paths.nodes),
+        "Path graph (edges)": len(G_paths.edges),
+        "Field graph (nodes)": len(G_fields.nodes),
+        "Field graph (edges)": len(G_fields.edges),
+    }
+
+    return {
+        "summary": summary,
+        "attend_deg": (attend_deg_dict, attend_deg_counts),
+        "attend_top": attend_top,
+        "attend_dist": attend_dist,
+        "field_deg": (fdeg_dict, fdeg_counts),
+        "field_top": field_top,
+        "field_dist": field_dist,
+        "path_info": pmetrics,
+        "parent_top": parent_top,
+        "centrality": centrality,
+        "clustering": (avg_clust, top_clust_nodes),
+        "components": components,
+        "centrality_info": centrality_info,
+        "attend_spectral": (attend_scores, attend_diagnostics),
+        "triangles": {"fields": field_triangles, "attendance": attend_triangles},
+        "temporal": temporal,
+    }
+
+
+def analyze_shard(
+    name: str, slug: str, shard: List[Tuple[int, Any]], is_array: bool, args: argparse.Namespace, report_file: str
+) -> Dict[str, Any]:
+    """Build and analyse one workgroup's graphs, write its report, and return its aggregates for the global merge."""
+    start = time.perf_counter()
+    indices = [index for index, _ in shard]
+    trie = PathTrie(template=args.path_mode == "template")
+    shard_info = ShardCollector(trie)
+    field_components = DisjointSet()
+    attendance = ParticipantCollector()
+    timeline = TimelineCollector() if args.temporal else None
+    collectors = [
+        shard_info,
+        attendance,
+        FieldSetCollector(shard_info.add_set),
+        FieldSetCollector(field_components.union_all),
+        PathTrieCollector(trie),
+    ]
+    # Records keep their index in the whole input, so "[i]" paths match the global ones.
+    visit_records(
+        (record for _, record in shard), collectors + ([timeline] if timeline else []), is_array=is_array, indices=indices
+    )
+    matrix = CoAttendanceMatrix.from_participants(attendance.participants)
+    G_attend = matrix.to_networkx()
+    G_fields = shard_info.field_counts().to_networkx()
+    report = analyze(G_attend, G_fields, trie, field_components, args, timeline=timeline, verbose=False)
+    write_report(output_file=report_file, title=f"Workgroup Graph Analysis: {name}", **report)
+    return {
+        "row": {
+            "workgroup": name,
+            "slug": slug,
+            "meetings": len(shard),
+            "people": len(G_attend),
+            "edges": G_attend.number_of_edges(),
+            "field_nodes": len(G_fields),
+            "top": report["attend_top"][:1],
+            "seconds": time.perf_counter() - start,
+        },
+        "people": first_appearances(indices, attendance.participants),
+        "attendance": matrix,
+        "field_sets": list(shard_info.field_sets.values()),
+        "components": field_components,
+        "trie": trie,
+        "trie_marks": shard_info.trie_marks,
+        "timeline": timeline,
+    }
+
+
+def analyze_workgroups(shards: Dict[str, List[Tuple[int, Any]]], is_array: bool, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Run ``analyze_shard`` for every workgroup across ``--shard-workers`` processes, largest shard first.
+
+    Returns the shards' results in workgroup order and writes the index of their reports.
+    """
+    report_dir = args.workgroup_dir or os.path.join(os.path.dirname(args.output), "workgroups")
+    taken: set = set()
+    jobs = [(name, shard_slug(name, taken), shard) for name, shard in shards.items()]
+    report_files = {name: os.path.join(report_dir, f"{slug}.md") for name, slug, _ in jobs}
+    # The largest shard bounds the wall time, so it starts first.
+    jobs.sort(key=lambda job: len(job[2]), reverse=True)
+    workers = min(args.shard_workers, len(jobs)) or 1
+    start = time.perf_counter()
+    results: Dict[str, Dict[str, Any]] = {}
+    if workers == 1:
+        for name, slug, shard in jobs:
+            results[name] = analyze_shard(name, slug, shard, is_array, args, report_files[name])
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                name: pool.submit(analyze_shard, name, slug, shard, is_array, args, report_files[name])
+                for name, slug, shard in jobs
+            }
+            results = {name: future.result() for name, future in futures.items()}
+    wall = time.perf_counter() - start
+    parts = [results[name] for name in shards]
+    for part in parts:
+        part["row"]["report"] = os.path.relpath(report_files[part["row"]["workgroup"]], os.path.dirname(args.output) or ".")
+    rows = [part["row"] for part in parts]
+    write_workgroup_index(os.path.join(report_dir, "index.md"), rows, workers, wall)
+    largest = max((row["seconds"] for row in rows), default=0.0)
+    print(
+        f"🌐 Workgroups: {len(rows)} shards on {workers} process{'es' if workers > 1 else ''}, "
+        f"{wall:.2f}s wall (largest shard {largest:.2f}); reports in {report_dir}"
+    )
+    return parts
+
+
+def write_workgroup_index(output_file: str, rows: List[Dict[str, Any]], workers: int, wall: float) -> None:
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write("# Workgroup Reports\n")
+        f.write(f"**Generated on:** {timestamp}\n\n")
+        f.write("One report per workgroup, each built from that workgroup's meetings only.\n\n")
+        f.write("| Workgroup | Meetings | People | Edges | Field nodes | Top person (degree) | Report | Time (s) |\n")
+        f.write("|-----------|----------|--------|-------|-------------|---------------------|--------|----------|\n")
+        for row in rows:
+            f.write(
+                f"| {_truncate_label(row['workgroup'], 40)} | {row['meetings']} | {row['people']} | {row['edges']} | "
+                f"{row['field_nodes']} | {window_leaders(row['top'])} | [{row['slug']}.md]({row['slug']}.md) | "
+                f"{row['seconds']:.2f} |\n"
+            )
+        f.write("\n")
+        f.write(f"- Workgroups: {len(rows)}\n")
+        f.write(f"- Worker processes: {workers}\n")
+        f.write(f"- Largest shard: {max((row['seconds'] for row in rows), default=0.0):.2f}s\n")
+        f.write(f"- Wall time for all shards: {wall:.2f}s\n")
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Unified Graph Analysis")
     parser.add_argument(
         "--input",
-        default=DEFAULT_INPUT,
-        help="Local JSON file path or HTTP(S) URL",
+        nargs="+",
+        default=[DEFAULT_INPUT],
+        help=(
+            "One or more sources: local JSON paths, HTTP(S) URLs, years or year ranges "
+            "(e.g. 2024 or 2023-2025), or @manifest.txt listing one source per line"
+        ),
+    )
+    parser.add_argument(
+        "--source-template",
+        default=None,
+        help="URL template used to expand years, with a {year} placeholder",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Number of sources fetched concurrently",
+    )
+    parser.add_argument(
+        "--max-per-host",
+        type=int,
+        default=DEFAULT_MAX_PER_HOST,
+        help="Maximum simultaneous connections per host",
     )
     parser.add_argument(
         "--output",
@@ -699,85 +1230,311 @@ def main() -> None:
         default="docs/index.html",
         help="HTML report output path",
     )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        default=None,
+        help="Use only the local HTTP cache; fail fast if the input is not cached",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the local HTTP cache and always download",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="HTTP cache directory (default: GRAPH_CACHE_DIR or .cache/http)",
+    )
+    parser.add_argument(
+        "--path-mode",
+        choices=PATH_MODES,
+        default=None,
+        help=(
+            "instance: one path per array index; template: collapse indices to [*] and report occurrences "
+            "and array lengths (default: instance, or template with --state-dir)"
+        ),
+    )
+    parser.add_argument(
+        "--snapshot",
+        default=os.environ.get("GRAPH_SNAPSHOT"),
+        help="Read meetings from a binary snapshot (see graph_core/snapshot.py) instead of --input",
+    )
+    parser.add_argument(
+        "--centrality-mode",
+        choices=CENTRALITY_MODES,
+        default="auto",
+        help="exact: search from every node; approx: sample --centrality-pivots sources; auto: approx only for large graphs",
+    )
+    parser.add_argument(
+        "--centrality-pivots",
+        type=int,
+        default=DEFAULT_PIVOTS,
+        help="Number of sampled pivot sources (k) in approximate centrality mode",
+    )
+    parser.add_argument(
+        "--centrality-seed",
+        type=int,
+        default=0,
+        help="Random seed for pivot sampling",
+    )
+    parser.add_argument(
+        "--centrality-workers",
+        type=int,
+        default=1,
+        help="Processes used for exact betweenness (sources are split between them)",
+    )
+    parser.add_argument(
+        "--state-dir",
+        default=os.environ.get("GRAPH_STATE_DIR"),
+        help="Keep aggregated counts in this directory and only re-analyse added, removed or edited meetings",
+    )
+    parser.add_argument(
+        "--reset-state",
+        action="store_true",
+        help="Discard the --state-dir contents and rebuild them from every meeting",
+    )
+    parser.add_argument(
+        "--warm-start",
+        help="JSON file of centrality scores from the previous run, used as start vectors for eigenvector "
+        "centrality and PageRank and updated afterwards (default: GRAPH_WARM_START, or centrality.json "
+        "in --state-dir)",
+    )
+    parser.add_argument(
+        "--temporal",
+        choices=WINDOW_KINDS,
+        default=None,
+        help="Also report co-attendance per time window of meeting dates (rolling: --window-days long, every --window-step days)",
+    )
+    parser.add_argument(
+        "--window-days",
+        type=int,
+        default=DEFAULT_WINDOW_DAYS,
+        help="Length of rolling windows in days",
+    )
+    parser.add_argument(
+        "--window-step",
+        type=int,
+        default=DEFAULT_WINDOW_STEP,
+        help="Days between the ends of consecutive rolling windows",
+    )
+    parser.add_argument(
+        "--by-workgroup",
+        action="store_true",
+        help="Analyse each workgroup's meetings in parallel, write one report per workgroup plus an index, "
+        "and merge their counts into the global report",
+    )
+    parser.add_argument(
+        "--workgroup-dir",
+        default=None,
+        help="Directory for the per-workgroup reports (default: workgroups/ next to --output)",
+    )
+    parser.add_argument(
+        "--shard-workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes analysing workgroups concurrently with --by-workgroup",
+    )
+    parser.add_argument(
+        "--layout-seed",
+        type=int,
+        default=0,
+        help="Random seed of the co-attendance network layout computed for --html",
+    )
+    parser.add_argument(
+        "--layout-iterations",
+        type=int,
+        default=DEFAULT_ITERATIONS,
+        help="Force-directed layout iterations (0 leaves the layout to the browser's physics simulation)",
+    )
+    parser.add_argument(
+        "--relayout",
+        action="store_true",
+        help="Lay the network out from scratch instead of keeping the positions of people already in the last report",
+    )
+    parser.add_argument(
+        "--top-edges",
+        type=int,
+        default=TOP_EDGES,
+        help="Co-attendance edges among either endpoint's N heaviest are kept in the dashboard's strongest-ties level (at most N x people)",
+    )
+    parser.add_argument(
+        "--full-graph-limit",
+        type=int,
+        default=FULL_EDGE_LIMIT,
+        help="Co-attendance edges up to which the dashboard opens on the whole graph instead of its communities",
+    )
     args = parser.parse_args()
-
-    data = load_json(args.input)
-    records = ensure_iterable_records(data)
-
-    # Participant-only co-attendance
-    G_attend = build_coattendance_graph(records)
-    attend_deg_dict, attend_deg_counts = degree_analysis(G_attend)
-    attend_top = sorted(attend_deg_dict.items(), key=lambda x: x[1], reverse=True)[: args.limit_top]
-    attend_dist = sorted(attend_deg_counts.items(), key=lambda x: x[0])
-
-    # Path analysis
-    all_paths = extract_json_paths(data)
-    pmetrics = path_metrics(all_paths)
-    parent_top = pmetrics["parent_counts"].most_common(args.limit_top)
-    G_paths = build_path_graph(all_paths)
-
-    # Field co-occurrence graph
-    G_fields = build_field_graph(data)
-
-    # Field degree (JSON Field Degree Analysis)
-    fdeg_dict, fdeg_counts = field_degree(G_fields)
-    field_top = sorted(fdeg_dict.items(), key=lambda x: x[1], reverse=True)[: args.limit_top]
-    field_dist = sorted(fdeg_counts.items(), key=lambda x: x[0])
-
-    # Centrality on field graph
-    centrality = compute_centrality_measures(G_fields)
-
-    # Clustering & components on field graph
-    avg_clust, top_clust_nodes = clustering_metrics(G_fields, args.limit_top)
-    components = connected_components_info(G_fields, args.limit_top)
-
-    summary = {
-        "Co-attendance graph (nodes)": len(G_attend.nodes),
-        "Co-attendance graph (edges)": len(G_attend.edges),
-        "Path graph (nodes)": len(G_paths.nodes),
-        "Path graph (edges)": len(G_paths.edges),
-        "Field graph (nodes)": len(G_fields.nodes),
-        "Field graph (edges)": len(G_fields.edges),
-    }
-
-    write_report(
-        output_file=args.output,
-        summary=summary,
-        attend_deg=(attend_deg_dict, attend_deg_counts),
-        attend_top=attend_top,
-        attend_dist=attend_dist,
-        field_deg=(fdeg_dict, fdeg_counts),
-        field_top=field_top,
-        field_dist=field_dist,
-        path_info=pmetrics,
-        parent_top=parent_top,
-        centrality=centrality,
-        clustering=(avg_clust, top_clust_nodes),
-        components=components,
+    if args.by_workgroup and (args.state_dir or args.snapshot):
+        parser.error("--by-workgroup reads --input directly and cannot be combined with --state-dir or --snapshot")
+    if args.shard_workers < 1:
+        parser.error("--shard-workers must be at least 1")
+    if args.state_dir:
+        if args.snapshot:
+            parser.error("--state-dir hashes the original JSON records and cannot read --snapshot")
+        if args.path_mode == "instance":
+            parser.error("--state-dir keeps index-free path counts; use --path-mode template")
+        args.path_mode = "template"
+    elif args.path_mode is None:
+        args.path_mode = "instance"
+    if args.temporal == "rolling" and (args.window_days < 1 or args.window_step < 1):
+        parser.error("--window-days and --window-step must be at least 1")
+
+    G_attend = nx.Graph()
+    G_fields = nx.Graph()
+    # Paths go into a trie as they are extracted; metrics and the path graph
+    # are read from its parent pointers instead of re-parsing path strings.
+    path_trie = PathTrie(template=args.path_mode == "template")
+    # Meeting days and participants for --temporal, gathered during ingestion.
+    timeline = TimelineCollector() if args.temporal else None
+    # Per-workgroup summary rows for --by-workgroup.
+    workgroups = None
+    if args.state_dir:
+        # Only records whose content hash is new are analysed; removed or
+        # edited ones are retracted from the stored counts.
+        state = AnalysisState(args.state_dir)
+        if args.reset_state:
+            state.clear()
+        with open_sources(
+            args.input,
+            template=args.source_template,
+            workers=args.workers,
+            max_per_host=args.max_per_host,
+            offline=args.offline,
+            cache_dir=args.cache_dir,
+            use_cache=False if args.no_cache else None,
+        ) as records:
+            delta = state.update(timeline.tap(records) if timeline else records, is_array=records.is_array)
+        print_source_report(records)
+        state.save()
+        print(
+            f"🧩 Incremental update: {delta['added']} added, {delta['removed']} removed, "
+            f"{delta['unchanged']} unchanged of {delta['records']} meetings ({state.state_dir})"
+        )
+        G_attend = state.attendance_graph()
+        G_fields = state.field_graph()
+        field_components = state.field_components
+        path_trie = state.path_trie()
+    elif args.snapshot:
+        # Memory-mapped snapshot: participants, paths and key sets are read
+        # straight from its integer arrays, with no JSON decoding.
+        with Snapshot(args.snapshot) as snap:
+            G_attend = CoAttendanceMatrix.from_snapshot(snap).to_networkx()
+            field_counts = FieldPairCounts()
+            field_components = DisjointSet()
+            dates = snap.column("date")
+            for i in range(len(snap)):
+                path_trie.add(snap.skeleton(i), i if snap.is_array else None)
+                if timeline is not None:
+                    timeline.add(day_ordinal(dates[i]), snap.participants(i), i)
+                for keys in snap.field_sets(i):
+                    field_counts.add(keys)
+                    field_components.union_all(keys)
+            G_fields = field_counts.to_networkx()
+            print(f"📦 Read {len(snap)} meetings from snapshot {args.snapshot}")
+    elif args.by_workgroup:
+        with open_sources(
+            args.input,
+            template=args.source_template,
+            workers=args.workers,
+            max_per_host=args.max_per_host,
+            offline=args.offline,
+            cache_dir=args.cache_dir,
+            use_cache=False if args.no_cache else None,
+        ) as records:
+            shards = split_by_workgroup(records)
+        print_source_report(records)
+        parts = analyze_workgroups(shards, records.is_array, args)
+        workgroups = [part["row"] for part in parts]
+        # The global graphs are merged from the shards' counts; no record is visited twice.
+        field_counts = merge_field_sets(parts)
+        G_attend = merge_attendance(parts)
+        G_fields = field_counts.to_networkx()
+        field_components = merge_components(field_counts.keys, parts)
+        path_trie = merge_paths(parts, template=args.path_mode == "template")
+        timeline = merge_timelines(parts)
+    else:
+        # Stream records one at a time so the raw document is never held in memory.
+        with open_sources(
+            args.input,
+            template=args.source_template,
+            workers=args.workers,
+            max_per_host=args.max_per_host,
+            offline=args.offline,
+            cache_dir=args.cache_dir,
+            use_cache=False if args.no_cache else None,
+        ) as records:
+            # One traversal per record feeds every analysis (see graph_core/visitor.py);
+            # record paths keep the "[i]" prefix they had when the whole array was walked.
+            graphs = build_graphs(
+                records,
+                ("attendance", "paths", "fields", "components") + (("timeline",) if timeline else ()),
+                is_array=records.is_array,
+                path_mode=args.path_mode,
+            )
+        G_attend, path_trie, G_fields = graphs["attendance"], graphs["paths"], graphs["fields"]
+        field_components = graphs["components"]
+        timeline = graphs.get("timeline")
+        print_source_report(records)
+
+    warm_path = resolve_warm_start(args.warm_start, args.state_dir)
+    warm = WarmStart(warm_path) if warm_path else None
+    report = analyze(
+        G_attend, G_fields, path_trie, field_components, args, warm=warm, timeline=timeline, workers=args.centrality_workers
     )
+
+    write_report(output_file=args.output, workgroups=workgroups, **report)
     print(f"✅ Unified report written to: {args.output}")
 
     if args.html:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        write_html_report(
+        positions = None
+        if args.layout_iterations > 0:
+            # Laid out here, once, so the dashboard draws the network without running physics;
+            # people already in the last report keep their place.
+            graph_asset = os.path.join(os.path.dirname(args.html_output), ASSET_DIR, "coattendance.json")
+            previous = None if args.relayout else read_positions(graph_asset)
+            positions, layout_info = force_layout(
+                G_attend, seed=args.layout_seed, iterations=args.layout_iterations, previous=previous
+            )
+            print(
+                f"🧭 Layout: {layout_info['nodes']} nodes ({layout_info['kept']} kept from the last report), "
+                f"{layout_info['iterations']} iterations, {layout_info['method']} repulsion, {layout_info['seconds']:.2f}s"
+            )
+        start = time.perf_counter()
+        groups = communities(G_attend, seed=args.layout_seed)
+        print(
+            f"🔭 Levels of detail: {len(groups)} communities (largest {len(groups[0]) if groups else 0} people), "
+            f"{time.perf_counter() - start:.2f}s"
+        )
+        assets = write_html_report(
             output_file=args.html_output,
             timestamp=timestamp,
-            summary=summary,
-            attend_deg=(attend_deg_dict, attend_deg_counts),
-            attend_top=attend_top,
-            attend_dist=attend_dist,
             attend_graph=G_attend,
-            field_deg=(fdeg_dict, fdeg_counts),
-            field_top=field_top,
-            field_dist=field_dist,
-            path_info=pmetrics,
-            parent_top=parent_top,
-            centrality=centrality,
-            clustering=(avg_clust, top_clust_nodes),
-            components=components,
+            workgroups=workgroups,
+            positions=positions,
+            communities=groups,
+            top_edges=args.top_edges,
+            full_limit=args.full_graph_limit,
+            **report,
         )
         print(f"✅ HTML report written to: {args.html_output}")
-
+        # One entry per community would drown the rest: those are summed per directory.
+        shown: Dict[str, List[int]] = {}
+        for name, (plain, packed) in assets.items():
+            key = os.path.dirname(name) + "/" if os.path.dirname(name) else name
+            total = shown.setdefault(key, [0, 0, 0])
+            total[0] += plain
+            total[1] += packed
+            total[2] += 1
+        print(
+            f"📦 Dashboard assets in {os.path.join(os.path.dirname(args.html_output), ASSET_DIR)}: "
+            + ", ".join(
+                f"{name}{f' ({files} files)' if files > 1 else ''} {plain / 1024:.1f} KB ({packed / 1024:.1f} KB gzipped)"
+                for name, (plain, packed, files) in shown.items()
+            )
+        )
+    print_cache_stats()
 
 if __name__ == "__main__":
     main()
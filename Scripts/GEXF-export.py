@@ -1,19 +1,26 @@
-import requests
+import os
+import sys
 import json
 import networkx as nx
 import matplotlib.pyplot as plt
 from collections import Counter, defaultdict
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from graph_core.fetch import fetch_json  # noqa: E402
+from graph_core.snapshot import Snapshot  # noqa: E402
+
 # --- CONFIG ---
 url = "https://raw.githubusercontent.com/SingularityNET-Archive/SingularityNET-Archive/refs/heads/main/Data/Snet-Ambassador-Program/Meeting-Summaries/2025/meeting-summaries-array.json"
 output_gexf = "all_workgroups_graph_sanitized.gexf"
 
-# --- 1. Fetch remote JSON safely ---
-response = requests.get(url)
-if response.status_code != 200:
-    raise Exception(f"Failed to fetch JSON. Status code: {response.status_code}")
-
-data = response.json()
+# --- 1. Fetch remote JSON safely (or read a prebuilt snapshot) ---
+snapshot_path = os.environ.get("GRAPH_SNAPSHOT")
+if snapshot_path:
+    # Normalized records from the memory-mapped snapshot; no JSON decoding
+    with Snapshot(snapshot_path) as snap:
+        data = list(snap.iter_records())
+else:
+    data = fetch_json(url)
 
 # Normalize to list of workgroups
 if isinstance(data, dict):
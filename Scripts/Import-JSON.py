@@ -1,13 +1,16 @@
-import requests
+import os
+import sys
 import json
 from collections import defaultdict, Counter
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from graph_core.fetch import fetch_json  # noqa: E402
+
 # URL to the JSON file
 url = "https://raw.githubusercontent.com/SingularityNET-Archive/SingularityNET-Archive/refs/heads/main/Data/Snet-Ambassador-Program/Meeting-Summaries/2025/meeting-summaries-array.json"
 
 # Fetch JSON data from URL
-response = requests.get(url)
-data = response.json()
+data = fetch_json(url)
 
 # --- Containers for counts and meeting lists ---
 workgroup_counts = Counter()
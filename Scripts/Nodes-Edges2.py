@@ -1,13 +1,14 @@
-import requests
+import os
+import sys
 import networkx as nx
 import matplotlib.pyplot as plt
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from graph_core.fetch import fetch_json  # noqa: E402
+
 # === Fetch remote JSON ===
 url = "https://raw.githubusercontent.com/SingularityNET-Archive/SingularityNET-Archive/refs/heads/main/Data/Snet-Ambassador-Program/Meeting-Summaries/2025/meeting-summaries-array.json"  # Replace with your URL
-response = requests.get(url)
-if response.status_code != 200:
-    raise Exception(f"Failed to fetch JSON. Status code: {response.status_code}")
-data = response.json()
+data = fetch_json(url)
 
 # Ensure list of workgroups
 if isinstance(data, dict):
@@ -1,11 +1,14 @@
-import requests
+import os
+import sys
 import json
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from graph_core.fetch import fetch_json  # noqa: E402
+
 url = "https://raw.githubusercontent.com/SingularityNET-Archive/SingularityNET-Archive/refs/heads/main/Data/Snet-Ambassador-Program/Meeting-Summaries/2025/meeting-summaries-array.json"
 
 # Fetch the JSON from the URL
-response = requests.get(url)
-data = response.json()
+data = fetch_json(url)
 
 # Ensure we’re always working with a list at the top level
 if isinstance(data, list):
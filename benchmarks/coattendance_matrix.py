@@ -0,0 +1,62 @@
+"""
+Pairwise co-attendance loop vs. the sparse incidence-matrix builder.
+
+Extracts participant lists from synthetic meetings once, then times
+``add_participant_clique`` over every meeting (``has_edge`` plus a weight
+update per pair) against ``CoAttendanceMatrix``: building the incidence matrix
+and ``BᵀB`` with degrees only, and additionally materializing the NetworkX
+graph. Checks that degrees and edge weights agree before printing the times.
+
+    python benchmarks/coattendance_matrix.py --meetings 10000 40000 100000
+"""
+
+import argparse
+
+import networkx as nx
+from common import make_meetings, timed
+
+from graph_core.graphs import add_participant_clique
+from graph_core.incidence import CoAttendanceMatrix
+from graph_core.snapshot import normalize_participants
+
+
+def loop_build(participants):
+    G = nx.Graph()
+    for p in participants:
+        add_participant_clique(G, p)
+    return G
+
+
+def matrix_counts(participants):
+    matrix = CoAttendanceMatrix.from_participants(participants)
+    return matrix, matrix.degree()
+
+
+def edge_weights(G):
+    return {frozenset((u, v)): w for u, v, w in G.edges(data="weight")}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--meetings", type=int, nargs="+", default=[10000, 40000, 100000])
+    parser.add_argument("--people", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("| Meetings | Edges | Loop (s) | BᵀB + degrees (s) | BᵀB + NetworkX graph (s) | Speed-up (counts / graph) |")
+    print("|----------|-------|----------|-------------------|--------------------------|---------------------------|")
+    for n in args.meetings:
+        participants = [normalize_participants(m["meetingInfo"]) for m in make_meetings(n, people=args.people)]
+        t_loop, G = timed(lambda: loop_build(participants), args.repeat)
+        t_counts, (matrix, degree) = timed(lambda: matrix_counts(participants), args.repeat)
+        t_graph, H = timed(lambda: CoAttendanceMatrix.from_participants(participants).to_networkx(), args.repeat)
+        if degree != dict(G.degree()) or edge_weights(H) != edge_weights(G):
+            raise SystemExit(f"Matrix build differs from the loop for {n} meetings")
+        print(
+            f"| {n} | {G.number_of_edges()} | {t_loop:.3f} | {t_counts:.3f} | {t_graph:.3f} | "
+            f"{t_loop / t_counts:.1f}x / {t_loop / t_graph:.1f}x |"
+        )
+
+
+if __name__ == "__main__":
+    main()
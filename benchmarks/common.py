@@ -0,0 +1,97 @@
+"""
+Shared helpers for the benchmarks in this directory.
+
+``make_meetings`` produces deterministic synthetic records shaped like
+meeting-summaries-array.json, so benchmarks run without network access.
+``load_script`` imports an analysis script by path (their directories are not
+packages and contain spaces).
+"""
+
+import gc
+import importlib.util
+import os
+import random
+import sys
+import time
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+def load_script(relpath: str) -> ModuleType:
+    path = os.path.join(REPO_ROOT, relpath)
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def timed(fn: Callable[[], Any], repeat: int = 3) -> Tuple[float, Any]:
+    """Best wall time of ``repeat`` runs of ``fn`` and the result of the last one.
+
+    Like ``timeit``, garbage collection is paused while timing.
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        result = None
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best, result
+
+
+def make_meetings(
+    count: int,
+    seed: int = 0,
+    people: int = 400,
+    workgroups: int = 24,
+    year: int = 2025,
+) -> List[Dict[str, Any]]:
+    rnd = random.Random(seed)
+    names = [f"person{i}" for i in range(people)]
+    groups = [f"Workgroup {i}" for i in range(workgroups)]
+    meetings = []
+    for _ in range(count):
+        present = rnd.sample(names, rnd.randint(2, 15))
+        wg = rnd.randrange(workgroups)
+        meetings.append({
+            "workgroup": groups[wg],
+            "workgroup_id": f"wg-{wg}",
+            "meetingInfo": {
+                "typeOfMeeting": "Weekly",
+                "date": f"{year}-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}",
+                "host": rnd.choice(present),
+                "documenter": rnd.choice(names),
+                "peoplePresent": ", ".join(present),
+                "purpose": "Weekly sync",
+                "meetingVideoLink": "",
+                "workingDocs": [{"title": f"doc{j}", "link": "https://example.org"} for j in range(rnd.randint(0, 3))],
+                "timestampedVideo": {},
+            },
+            "agendaItems": [
+                {
+                    "status": "carry over",
+                    "actionItems": [
+                        {"text": f"task {j}", "assignee": rnd.choice(names), "dueDate": "", "status": "todo"}
+                        for j in range(rnd.randint(0, 4))
+                    ],
+                    "decisionItems": [{"decision": "d", "effect": "e"} for _ in range(rnd.randint(0, 2))],
+                }
+                for _ in range(rnd.randint(1, 3))
+            ],
+            "tags": {"topicsCovered": "governance, tooling, outreach", "emotions": "productive, calm"},
+            "type": "Custom",
+            "noSummaryGiven": False,
+            "canceledSummary": False,
+        })
+    return meetings
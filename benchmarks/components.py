@@ -0,0 +1,55 @@
+"""
+Graph-then-components vs. streaming union-find.
+
+Extracts participant lists from synthetic meetings once, then times building
+the co-attendance graph with ``CoAttendanceMatrix`` followed by
+``sorted(nx.connected_components(G), key=len)`` against unioning each
+meeting's participants into a ``graph_core.components.DisjointSet`` (no
+adjacency at all). Checks that the component sizes agree.
+
+    python benchmarks/components.py --meetings 10000 40000 100000 --people 20000
+"""
+
+import argparse
+
+import networkx as nx
+from common import make_meetings, timed
+
+from graph_core.components import DisjointSet
+from graph_core.incidence import CoAttendanceMatrix
+from graph_core.snapshot import normalize_participants
+
+
+def graph_components(participants):
+    G = CoAttendanceMatrix.from_participants(participants).to_networkx()
+    return [len(c) for c in sorted(nx.connected_components(G), key=len, reverse=True)]
+
+
+def union_find(participants):
+    ds = DisjointSet()
+    for people in participants:
+        if len(people) >= 2:
+            ds.union_all(people)
+    return ds.component_sizes()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--meetings", type=int, nargs="+", default=[10000, 40000, 100000])
+    parser.add_argument("--people", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("| Meetings | Components | Graph + nx.connected_components (s) | Union-find (s) | Speed-up |")
+    print("|----------|------------|-------------------------------------|----------------|----------|")
+    for n in args.meetings:
+        participants = [normalize_participants(m["meetingInfo"]) for m in make_meetings(n, people=args.people)]
+        t_graph, expected = timed(lambda: graph_components(participants), args.repeat)
+        t_ds, sizes = timed(lambda: union_find(participants), args.repeat)
+        if sizes != expected:
+            raise SystemExit(f"Union-find component sizes differ for {n} meetings")
+        print(f"| {n} | {len(sizes)} | {t_graph:.3f} | {t_ds:.3f} | {t_graph / t_ds:.1f}x |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Per-meeting dynamic updates vs. recomputing every graph metric.
+
+Starts from synthetic meetings loaded into ``graph_core.dynamic.DynamicMeetingGraphs``
+and applies random corrections as an upstream fix would: a participant's name
+changed, a participant dropped, a field removed from a record, a meeting
+deleted or a new one added. Each correction is a ``replace_meeting``,
+``remove_meeting`` or ``add_meeting``. Every ``--check-every`` corrections,
+and after the last one, the co-attendance and field graphs are rebuilt from
+the current records and their degrees, degree distribution, component sizes
+and per-node triangles are compared with the maintained values (a randomized
+check against the full recompute), whose time is the baseline.
+
+    python benchmarks/dynamic_graph.py --meetings 1000 4000 --corrections 500
+"""
+
+import argparse
+import copy
+import random
+import time
+from collections import Counter
+
+import networkx as nx
+from common import make_meetings, timed
+
+from graph_core.dynamic import DynamicMeetingGraphs
+from graph_core.graphs import build_field_graph
+from graph_core.incidence import CoAttendanceMatrix
+from graph_core.snapshot import normalize_participants
+from graph_core.triangles import triangle_stats
+
+
+def full_metrics(G):
+    degree = dict(G.degree())
+    return {
+        "degree": degree,
+        "distribution": sorted(Counter(degree.values()).items()),
+        "components": sorted((len(c) for c in nx.connected_components(G)), reverse=True),
+        "triangles": triangle_stats(G, weight=None)["triangles"],
+    }
+
+
+def recompute(records):
+    attendance = CoAttendanceMatrix.from_participants(normalize_participants(r["meetingInfo"]) for r in records).to_networkx()
+    return full_metrics(attendance), full_metrics(build_field_graph(records))
+
+
+def dynamic_metrics(graph):
+    return {
+        "degree": {node: graph.degree(node) for node in graph.adj},
+        "distribution": graph.degree_distribution(),
+        "components": graph.component_sizes(),
+        "triangles": dict(graph.triangles),
+    }
+
+
+def correct(record, rnd, extra):
+    """A corrected copy of ``record``: a renamed or dropped participant, or a dropped field."""
+    fixed = copy.deepcopy(record)
+    info = fixed["meetingInfo"]
+    present = [p.strip() for p in info["peoplePresent"].split(",")]
+    kind = rnd.randrange(3)
+    if kind == 0:
+        present[rnd.randrange(len(present))] = f"person{rnd.randrange(extra)}"
+    elif kind == 1 and len(present) > 2:
+        present.pop(rnd.randrange(len(present)))
+    else:
+        info.pop(rnd.choice(["purpose", "timestampedVideo", "meetingVideoLink", "workingDocs"]), None)
+    info["peoplePresent"] = ", ".join(present)
+    return fixed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--meetings", type=int, nargs="+", default=[1000, 4000])
+    parser.add_argument("--corrections", type=int, default=500)
+    parser.add_argument("--check-every", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print("| Meetings | Corrections | Dynamic update (ms each) | Full recompute (s) | Speed-up |")
+    print("|----------|-------------|--------------------------|--------------------|----------|")
+    for n in args.meetings:
+        rnd = random.Random(args.seed)
+        records = make_meetings(n, seed=args.seed)
+        spare = make_meetings(args.corrections, seed=args.seed + 1)
+        graphs = DynamicMeetingGraphs.from_records(records)
+        t_full, _ = timed(lambda: recompute(records), 1)
+        updating = 0.0
+        for step in range(1, args.corrections + 1):
+            action = rnd.random()
+            start = time.perf_counter()
+            if action < 0.7:
+                i = rnd.randrange(len(records))
+                fixed = correct(records[i], rnd, 450)
+                graphs.replace_meeting(records[i], fixed)
+                records[i] = fixed
+            elif action < 0.85 and len(records) > 1:
+                graphs.remove_meeting(records.pop(rnd.randrange(len(records))))
+            else:
+                records.append(spare[step - 1])
+                graphs.add_meeting(records[-1])
+            updating += time.perf_counter() - start
+            if step % args.check_every == 0 or step == args.corrections:
+                attendance, fields = recompute(records)
+                if dynamic_metrics(graphs.attendance) != attendance or dynamic_metrics(graphs.fields) != fields:
+                    raise SystemExit(f"Dynamic metrics differ from a full recompute after {step} corrections ({n} meetings)")
+        per_update = updating / args.corrections
+        print(f"| {n} | {args.corrections} | {per_update * 1000:.2f} | {t_full:.3f} | {t_full / per_update:.0f}x |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Per-pair field graph updates vs. bulk pair counting.
+
+Collects the key sets of synthetic meetings once (the record walk every build
+needs), then times building the weighted field co-occurrence graph with the
+old ``add_field_sets`` loop (``add_node`` per key, ``has_edge`` and a weight
+update per pair) against ``FieldPairCounts`` (distinct key sets counted, pairs
+expanded into a flat dict of packed key-ID pairs, one
+``add_weighted_edges_from``). Checks that both graphs list the same nodes,
+edges and weights in the same order.
+
+    python benchmarks/field_graph.py --meetings 10000 40000 160000
+"""
+
+import argparse
+
+import networkx as nx
+from common import make_meetings, timed
+
+from graph_core.graphs import FieldPairCounts, add_field_sets
+from graph_core.visitor import iter_field_combinations
+
+
+def collect_sets(meetings):
+    return [keys for m in meetings for keys in iter_field_combinations(m)]
+
+
+def loop_build(field_sets):
+    G = nx.Graph()
+    add_field_sets(G, field_sets)
+    return G
+
+
+def bulk_build(field_sets):
+    counts = FieldPairCounts()
+    counts.add_sets(field_sets)
+    return counts.to_networkx()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--meetings", type=int, nargs="+", default=[10000, 40000, 160000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("| Meetings | Key sets | Record walk (s) | Per-pair loop (s) | Bulk counts (s) | Speed-up | Bulk share of walk + build |")
+    print("|----------|----------|-----------------|-------------------|-----------------|----------|----------------------------|")
+    for n in args.meetings:
+        meetings = make_meetings(n)
+        t_walk, field_sets = timed(lambda: collect_sets(meetings), args.repeat)
+        t_loop, G = timed(lambda: loop_build(field_sets), args.repeat)
+        t_bulk, H = timed(lambda: bulk_build(field_sets), args.repeat)
+        if list(G.nodes) != list(H.nodes) or list(G.edges(data="weight")) != list(H.edges(data="weight")):
+            raise SystemExit(f"Bulk field graph differs from the loop for {n} meetings")
+        share = t_bulk / (t_walk + t_bulk)
+        print(
+            f"| {n} | {len(field_sets)} | {t_walk:.3f} | {t_loop:.3f} | {t_bulk:.4f} | "
+            f"{t_loop / t_bulk:.0f}x | {share:.1%} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Separate recursive walks vs. one fused visitor pass.
+
+Runs the five per-analysis traversals (paths, field key-sets, participants,
+workgroup mentions, schema) on synthetic meetings, then the same analyses as
+collectors of a single ``visit_records`` pass, checks that both produce the
+same results and prints the wall times.
+
+    python benchmarks/fused_visitor.py --meetings 5000 20000
+"""
+
+import argparse
+
+from common import load_script, make_meetings, timed
+
+from graph_core.visitor import (
+    FieldSetCollector,
+    ParticipantCollector,
+    PathCollector,
+    SchemaCollector,
+    WorkgroupCollector,
+    visit_records,
+)
+
+unified = load_script("Graph Analysis/unified_analysis.py")
+workgroups = load_script("Data Analysis/count_unique_workgroups.py")
+schema = load_script("Data Analysis/infer_json_schema.py")
+
+
+def separate_walks(data):
+    paths = []
+    field_sets = []
+    participants = []
+    for i, rec in enumerate(data):
+        paths.append(f"[{i}]")
+        paths.extend(unified.extract_json_paths(rec, f"[{i}]"))
+    for rec in data:
+        field_sets.extend(unified.find_field_combinations(rec))
+    for rec in data:
+        participants.append(unified.extract_participants(rec))
+    found = workgroups.find_workgroups(data)
+    inferred = schema.infer_schema(data[0])
+    return paths, field_sets, participants, found, inferred
+
+
+def fused_walk(data):
+    collectors = [PathCollector(), FieldSetCollector(), ParticipantCollector(), WorkgroupCollector(), SchemaCollector()]
+    visit_records(data, collectors, is_array=True)
+    p, f, pa, w, s = collectors
+    return p.paths, f.field_sets, pa.participants, w.found, s.schema
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--meetings", type=int, nargs="+", default=[2000, 10000, 40000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("| Meetings | Separate walks (s) | Fused pass (s) | Speed-up |")
+    print("|----------|--------------------|----------------|----------|")
+    for n in args.meetings:
+        data = make_meetings(n)
+        t_sep, expected = timed(lambda: separate_walks(data), args.repeat)
+        t_fused, actual = timed(lambda: fused_walk(data), args.repeat)
+        if actual != expected:
+            raise SystemExit(f"Fused results differ from separate walks for {n} meetings")
+        print(f"| {n} | {t_sep:.3f} | {t_fused:.3f} | {t_sep / t_fused:.2f}x |")
+
+
+if __name__ == "__main__":
+    main()
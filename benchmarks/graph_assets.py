@@ -0,0 +1,68 @@
+"""
+Inline vis-network payload vs. the compact, streamed graph asset.
+
+Builds the co-attendance graph of synthetic meetings and compares the node
+and edge dicts ``write_html_report`` used to ``json.dumps`` into the page
+with ``graph_core.assets.compact_graph`` streamed by ``write_json_asset``
+(plain and gzip sidecar): encode time and bytes. Checks that the compact form
+expands back to the same nodes, degrees and edge weights.
+
+    python benchmarks/graph_assets.py --meetings 1000 4000 16000 --people 2000
+"""
+
+import argparse
+import json
+import os
+import tempfile
+
+from common import make_meetings, timed
+
+from graph_core.assets import compact_graph, write_json_asset
+from graph_core.graphs import build_graphs
+
+
+def inline_payload(G):
+    nodes = [{"id": node, "label": node[:30], "value": deg, "title": f"{node} - Degree: {deg}"} for node, deg in G.degree()]
+    edges = [
+        {"from": u, "to": v, "value": w, "title": f"Co-attended {w} time(s)"} for u, v, w in G.edges(data="weight", default=1)
+    ]
+    return json.dumps(nodes, ensure_ascii=False) + json.dumps(edges, ensure_ascii=False)
+
+
+def expand(data):
+    labels = data["labels"]
+    edges = data["edges"]
+    return (
+        list(zip(labels, data["degree"])),
+        [(labels[edges[k]], labels[edges[k + 1]], edges[k + 2]) for k in range(0, len(edges), 3)],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--meetings", type=int, nargs="+", default=[1000, 4000, 16000])
+    parser.add_argument("--people", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("| Meetings | Edges | Inline json.dumps (s) | Inline (KB) | Asset write (s) | Asset (KB) | Gzipped (KB) | Size ratio |")
+    print("|----------|-------|-----------------------|-------------|-----------------|------------|--------------|------------|")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "coattendance.json")
+        for n in args.meetings:
+            G = build_graphs(make_meetings(n, people=args.people), ("attendance",))["attendance"]
+            t_inline, payload = timed(lambda: inline_payload(G), args.repeat)
+            t_asset, (plain, packed) = timed(lambda: write_json_asset(path, compact_graph(G)), args.repeat)
+            with open(path, encoding="utf-8") as f:
+                nodes, edges = expand(json.load(f))
+            if nodes != list(G.degree()) or edges != list(G.edges(data="weight")):
+                raise SystemExit(f"Compact asset does not round-trip for {n} meetings")
+            inline = len(payload.encode("utf-8"))
+            print(
+                f"| {n} | {G.number_of_edges()} | {t_inline:.3f} | {inline / 1024:.0f} | {t_asset:.3f} | "
+                f"{plain / 1024:.0f} | {packed / 1024:.0f} | {inline / packed:.1f}x |"
+            )
+
+
+if __name__ == "__main__":
+    main()
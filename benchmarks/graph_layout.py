@@ -0,0 +1,72 @@
+"""
+``nx.spring_layout`` vs. ``graph_core.layout.force_layout``.
+
+Lays out the co-attendance graph of synthetic meetings with NetworkX's
+Fruchterman-Reingold and with the vectorized layout (exact repulsion up to
+``EXACT_LIMIT`` nodes, grid Barnes-Hut above), same iteration count. Besides
+time, prints the mean edge length over the mean distance of random node pairs
+(lower keeps co-attendees closer) and the share of nodes whose nearest
+neighbour is closer than a hundredth of the median nearest-neighbour distance
+(overlapping dots). Checks that a second run with the first run's positions
+keeps every node in place.
+
+    python benchmarks/graph_layout.py --people 500 2000 5000 --meetings 3000
+"""
+
+import argparse
+
+import networkx as nx
+import numpy as np
+from common import make_meetings, timed
+from scipy.spatial import cKDTree
+
+from graph_core.graphs import build_graphs
+from graph_core.layout import force_layout
+
+
+def quality(G, pos):
+    X = np.array([pos[node] for node in G], dtype=float)
+    index = {node: i for i, node in enumerate(G)}
+    u = np.array([index[a] for a, _ in G.edges()])
+    v = np.array([index[b] for _, b in G.edges()])
+    rng = np.random.default_rng(0)
+    a, b = rng.integers(0, len(X), (2, 20000))
+    ratio = np.linalg.norm(X[u] - X[v], axis=1).mean() / np.linalg.norm(X[a] - X[b], axis=1).mean()
+    nearest = cKDTree(X).query(X, 2)[0][:, 1]
+    overlap = float(np.mean(nearest < np.median(nearest) / 100))
+    return ratio, overlap
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--people", type=int, nargs="+", default=[500, 2000, 5000])
+    parser.add_argument("--meetings", type=int, default=3000)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    print("| People | Edges | spring_layout (s) | Edge/pair ratio | Overlaps | force_layout (s) | Edge/pair ratio | Overlaps | Speed-up |")
+    print("|--------|-------|-------------------|-----------------|----------|------------------|-----------------|----------|----------|")
+    for people in args.people:
+        meetings = make_meetings(args.meetings, people=people)
+        for m in meetings:
+            # Smaller meetings keep large graphs sparse enough to show structure.
+            names = m["meetingInfo"]["peoplePresent"].split(", ")[:4]
+            m["meetingInfo"]["peoplePresent"] = ", ".join(names)
+            m["meetingInfo"]["host"] = names[0]
+        G = build_graphs(meetings, ("attendance",))["attendance"]
+        t_nx, nx_pos = timed(lambda: nx.spring_layout(G, iterations=args.iterations, seed=0), args.repeat)
+        t_fl, (pos, _) = timed(lambda: force_layout(G, iterations=args.iterations), args.repeat)
+        kept, info = force_layout(G, iterations=args.iterations, previous=pos)
+        if kept != pos or info["iterations"]:
+            raise SystemExit(f"Positions of a known graph were not kept for {people} people")
+        nx_ratio, nx_overlap = quality(G, nx_pos)
+        ratio, overlap = quality(G, pos)
+        print(
+            f"| {len(G)} | {G.number_of_edges()} | {t_nx:.2f} | {nx_ratio:.3f} | {nx_overlap:.1%} | "
+            f"{t_fl:.2f} | {ratio:.3f} | {overlap:.1%} | {t_nx / t_fl:.1f}x |"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+What the dashboard draws first: the whole graph vs. its levels of detail.
+
+Builds co-attendance graphs of growing synthetic archives and prints the
+nodes and edges of each level ``graph_core.lod`` writes (communities,
+strongest ties, largest community) next to the whole graph the page used to
+draw on load, with the time to compute them. Checks that the community level
+keeps every unit of co-attendance (between or within groups) and that each
+person keeps their heaviest ties.
+
+    python benchmarks/graph_lod.py --meetings 1000 4000 16000 --people 3000
+"""
+
+import argparse
+import time
+
+from common import make_meetings
+
+from graph_core.graphs import build_graphs
+from graph_core.lod import TOP_EDGES, communities, community_graph, strongest_edges
+
+
+def levels(G, top):
+    start = time.perf_counter()
+    groups = communities(G)
+    overview = community_graph(G, groups)
+    strongest = strongest_edges(G, top)
+    return groups, overview, strongest, time.perf_counter() - start
+
+
+def check(G, overview, strongest, top):
+    total = sum(w for _, _, w in G.edges(data="weight"))
+    if sum(overview["edges"][2::3]) + sum(overview["ties"]) != total:
+        return False
+    kept = {node: [] for node in G}
+    for u, v, w in strongest:
+        kept[u].append(w)
+        kept[v].append(w)
+    for node in G:
+        heaviest = sorted((d["weight"] for d in G[node].values()), reverse=True)[:top]
+        if sorted(kept[node], reverse=True)[:top] != heaviest:
+            return False
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--meetings", type=int, nargs="+", default=[1000, 4000, 16000])
+    parser.add_argument("--people", type=int, default=3000)
+    parser.add_argument("--top", type=int, default=TOP_EDGES)
+    args = parser.parse_args()
+
+    print("| Meetings | Whole graph (nodes / edges) | Communities (nodes / edges) | Strongest ties (edges) | Largest community (nodes / edges) | Levels (s) |")
+    print("|----------|-----------------------------|-----------------------------|------------------------|-----------------------------------|------------|")
+    for n in args.meetings:
+        G = build_graphs(make_meetings(n, people=args.people), ("attendance",))["attendance"]
+        groups, overview, strongest, seconds = levels(G, args.top)
+        if not check(G, overview, strongest, args.top):
+            raise SystemExit(f"Levels of detail lose co-attendance for {n} meetings")
+        largest = G.subgraph(groups[0])
+        print(
+            f"| {n} | {len(G)} / {G.number_of_edges()} | {len(groups)} / {len(overview['edges']) // 3} | {len(strongest)} | "
+            f"{len(largest)} / {largest.number_of_edges()} | {seconds:.2f} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Recursive list-building walks vs. the explicit-stack generators.
+
+Compares the original recursive ``extract_json_paths`` /
+``find_field_combinations`` (which re-copy every child list into its parent)
+with ``graph_core.visitor.iter_json_paths`` / ``iter_field_combinations``,
+consumed lazily and materialized with ``list()``, on synthetic deep, wide
+documents. Prints wall time and peak traced memory for each version; the
+recursive versions report ``RecursionError`` once the document is deeper than
+the interpreter's recursion limit.
+
+    python benchmarks/iterative_walks.py --depth 200 800 5000 --width 8
+"""
+
+import argparse
+import sys
+import tracemalloc
+from typing import Any, Callable, List
+
+from common import timed
+
+from graph_core.visitor import iter_field_combinations, iter_json_paths
+
+
+# Reference copies of the recursive implementations these generators replaced.
+
+def recursive_json_paths(obj: Any, prefix: str = "") -> List[str]:
+    paths: List[str] = []
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            path = f"{prefix}.{k}" if prefix else k
+            paths.append(path)
+            paths.extend(recursive_json_paths(v, path))
+    elif isinstance(obj, list):
+        for i, item in enumerate(obj):
+            path = f"{prefix}[{i}]"
+            paths.append(path)
+            paths.extend(recursive_json_paths(item, path))
+    return paths
+
+
+def recursive_field_combinations(obj: Any) -> List[set]:
+    results: List[set] = []
+    if isinstance(obj, dict):
+        keys = set(obj.keys())
+        if len(keys) > 1:
+            results.append(keys)
+        for v in obj.values():
+            results.extend(recursive_field_combinations(v))
+    elif isinstance(obj, list):
+        for item in obj:
+            results.extend(recursive_field_combinations(item))
+    return results
+
+
+def make_document(depth: int, width: int) -> dict:
+    """A chain of ``depth`` nested dicts, each with ``width`` leaves and a short list."""
+    node: dict = {}
+    for level in range(depth):
+        node = {
+            **{f"k{j}": level for j in range(width)},
+            "items": [{"a": 1, "b": 2}, level],
+            "next": node,
+        }
+    return node
+
+
+def count(items: Any) -> int:
+    n = 0
+    for _ in items:
+        n += 1
+    return n
+
+
+def peak_memory(fn: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    try:
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--depth", type=int, nargs="+", default=[200, 800, 5000])
+    parser.add_argument("--width", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"Recursion limit: {sys.getrecursionlimit()}\n")
+    print("| Depth x width | Walk | Version | Items | Time (s) | Peak memory (MB) |")
+    print("|---------------|------|---------|-------|----------|------------------|")
+    for depth in args.depth:
+        doc = make_document(depth, args.width)
+        versions = [
+            ("paths", "recursive list", lambda: recursive_json_paths(doc)),
+            ("paths", "generator (lazy)", lambda: count(iter_json_paths(doc))),
+            ("paths", "generator + list()", lambda: list(iter_json_paths(doc))),
+            ("field sets", "recursive list", lambda: recursive_field_combinations(doc)),
+            ("field sets", "generator (lazy)", lambda: count(iter_field_combinations(doc))),
+            ("field sets", "generator + list()", lambda: list(iter_field_combinations(doc))),
+        ]
+        reference = {}
+        for walk, version, fn in versions:
+            try:
+                seconds, result = timed(fn, args.repeat)
+                peak = peak_memory(fn)
+            except RecursionError:
+                print(f"| {depth} x {args.width} | {walk} | {version} | - | RecursionError | - |")
+                continue
+            items = result if isinstance(result, int) else len(result)
+            if isinstance(result, list):
+                if walk in reference and reference[walk] != result:
+                    raise SystemExit(f"{version} {walk} differ from the reference order at depth {depth}")
+                reference[walk] = result
+            print(f"| {depth} x {args.width} | {walk} | {version} | {items} | {seconds:.3f} | {peak:.1f} |")
+            result = None
+
+
+if __name__ == "__main__":
+    main()
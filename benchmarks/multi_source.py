@@ -0,0 +1,130 @@
+"""
+Several year files from a local ``http.server``, one at a time vs. concurrently.
+
+Writes synthetic ``<year>/meeting-summaries-array.json`` files to a temporary
+directory, serves it with ``http.server`` (each response delayed by
+``--latency`` ms, like a remote host) and reads the years through
+``graph_core.sources.open_sources`` with a ``--source-template`` pointing at
+it: with one fetch worker and with ``--workers``, through a cold and a warm
+download cache and with the cache disabled (bodies parsed as they arrive).
+Prints the wall time and the peak memory traced while reading (it stays
+near one parse chunk per source however large the files are) and checks
+that every run yields the year files' records in order. Finally runs
+``unified_analysis.py --input <years> --source-template ... --no-cache``
+against the same server.
+
+    python benchmarks/multi_source.py --years 2021-2024 --meetings 5000 --latency 200
+"""
+
+import argparse
+import contextlib
+import functools
+import io
+import itertools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from common import REPO_ROOT, make_meetings
+
+from graph_core.sources import expand_sources, open_sources
+
+
+class SlowHandler(SimpleHTTPRequestHandler):
+    latency = 0.0
+
+    def do_GET(self) -> None:
+        time.sleep(self.latency)
+        super().do_GET()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def read_all(years, template, expected, **kwargs):
+    """Wall time, peak traced memory and whether the records match ``expected``, compared as they arrive."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    # The cache reports each hit and miss; keep the table readable.
+    with contextlib.redirect_stdout(io.StringIO()), open_sources([years], template=template, **kwargs) as stream:
+        same = all(got == want for got, want in itertools.zip_longest(stream, expected))
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak, same
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--years", default="2021-2024")
+    parser.add_argument("--meetings", type=int, default=5000, help="Meetings per year file")
+    parser.add_argument("--latency", type=float, default=200, help="Delay before each response, in ms")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        served = os.path.join(root, "served")
+        expected = []
+        expected_years = expand_sources([args.years], os.path.join(served, "{year}", "meeting-summaries-array.json"))
+        for i, path in enumerate(expected_years):
+            year = int(os.path.basename(os.path.dirname(path)))
+            meetings = make_meetings(args.meetings, seed=i, year=year)
+            os.makedirs(os.path.dirname(path))
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(meetings, f)
+            expected.extend(meetings)
+        size = sum(os.path.getsize(os.path.join(d, name)) for d, _, names in os.walk(served) for name in names)
+
+        SlowHandler.latency = args.latency / 1000
+        server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(SlowHandler, directory=served))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        template = f"http://127.0.0.1:{server.server_address[1]}/{{year}}/meeting-summaries-array.json"
+        try:
+            print(f"Serving {len(expected)} meetings ({size / 1e6:.1f} MB) from {template}")
+            print()
+            print("| Cache | Workers | Time (s) | Peak traced memory (MB) |")
+            print("|-------|---------|----------|-------------------------|")
+            runs = []
+            for workers in (1, args.workers):
+                cache_dir = os.path.join(root, f"cache-{workers}")
+                runs.append(("cold", workers, dict(use_cache=True, cache_dir=cache_dir)))
+                runs.append(("warm", workers, dict(use_cache=True, cache_dir=cache_dir)))
+                runs.append(("off", workers, dict(use_cache=False)))
+            for label, workers, kwargs in runs:
+                seconds, peak, same = read_all(args.years, template, expected, workers=workers, **kwargs)
+                if not same:
+                    raise SystemExit(f"Cache {label}, {workers} workers: records differ from the served year files")
+                print(f"| {label} | {workers} | {seconds:.2f} | {peak / 1e6:.1f} |")
+
+            output = os.path.join(root, "reports", "unified.md")
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    os.path.join(REPO_ROOT, "Graph Analysis", "unified_analysis.py"),
+                    "--input", args.years,
+                    "--source-template", template,
+                    "--no-cache",
+                    "--output", output,
+                ],
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode != 0 or not os.path.exists(output):
+                raise SystemExit(f"unified_analysis.py failed against the local server:\n{result.stderr}")
+            print()
+            report = result.stdout.splitlines()
+            start = next(i for i, line in enumerate(report) if line.startswith("📥"))
+            print("\n".join(report[start : start + 1 + len(expected_years)]))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    main()
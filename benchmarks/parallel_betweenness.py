@@ -0,0 +1,47 @@
+"""
+Serial vs. process-parallel exact betweenness centrality.
+
+Builds a co-attendance graph from synthetic meetings and times
+``nx.betweenness_centrality`` against the shortest-path sweep of
+``graph_core.shortest_paths.all_pairs_bfs`` with several worker counts, checking every result against the serial one.
+Speed-up beyond one worker needs as many free cores.
+
+    python benchmarks/parallel_betweenness.py --meetings 1000 --people 2000 --workers 2 4 8
+"""
+
+import argparse
+import os
+
+import networkx as nx
+from common import make_meetings, timed
+
+from graph_core.incidence import CoAttendanceMatrix
+from graph_core.shortest_paths import all_pairs_bfs
+from graph_core.snapshot import normalize_participants
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--meetings", type=int, default=1000)
+    parser.add_argument("--people", type=int, default=2000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    participants = [normalize_participants(m["meetingInfo"]) for m in make_meetings(args.meetings, people=args.people)]
+    G = CoAttendanceMatrix.from_participants(participants).to_networkx()
+    print(f"Graph: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges; {os.cpu_count()} CPU(s)\n")
+    print("| Version | Time (s) | Speed-up | Max abs. difference |")
+    print("|---------|----------|----------|---------------------|")
+    t_serial, expected = timed(lambda: nx.betweenness_centrality(G), args.repeat)
+    print(f"| networkx serial | {t_serial:.2f} | 1.00x | - |")
+    for workers in args.workers:
+        seconds, result = timed(lambda: all_pairs_bfs(G, workers).betweenness(), args.repeat)
+        diff = max(abs(result[v] - expected[v]) for v in G)
+        if diff > 1e-9:
+            raise SystemExit(f"{workers} workers differ from the serial result by {diff}")
+        print(f"| {workers} workers | {seconds:.2f} | {t_serial / seconds:.2f}x | {diff:.1e} |")
+
+
+if __name__ == "__main__":
+    main()
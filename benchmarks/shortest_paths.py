@@ -0,0 +1,66 @@
+"""
+Separate all-pairs computations vs. one shared BFS sweep.
+
+Builds a co-attendance graph from synthetic meetings and times the three
+NetworkX calls the reports would otherwise make (``betweenness_centrality``,
+``closeness_centrality`` and ``average_shortest_path_length`` per component,
+each running a BFS from every node) against one
+``graph_core.shortest_paths.all_pairs_bfs`` sweep that yields all three.
+Checks that the results agree before printing the times.
+
+    python benchmarks/shortest_paths.py --meetings 100 200 400 --people 800
+"""
+
+import argparse
+
+import networkx as nx
+from common import make_meetings, timed
+
+from graph_core.incidence import CoAttendanceMatrix
+from graph_core.shortest_paths import all_pairs_bfs
+from graph_core.snapshot import normalize_participants
+
+
+def separate(G):
+    betweenness = nx.betweenness_centrality(G)
+    closeness = nx.closeness_centrality(G)
+    total = pairs = 0
+    for component in nx.connected_components(G):
+        size = len(component)
+        if size > 1:
+            n_pairs = size * (size - 1)
+            total += nx.average_shortest_path_length(G.subgraph(component)) * n_pairs
+            pairs += n_pairs
+    return betweenness, closeness, total / pairs if pairs else 0.0
+
+
+def shared(G):
+    paths = all_pairs_bfs(G)
+    return paths.betweenness(), paths.closeness(), paths.average_shortest_path_length()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--meetings", type=int, nargs="+", default=[100, 200, 400])
+    parser.add_argument("--people", type=int, default=800)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    print("| Meetings | Nodes | Edges | Three NetworkX passes (s) | One sweep (s) | Speed-up | Max abs. difference |")
+    print("|----------|-------|-------|---------------------------|---------------|----------|---------------------|")
+    for n in args.meetings:
+        participants = [normalize_participants(m["meetingInfo"]) for m in make_meetings(n, people=args.people)]
+        G = CoAttendanceMatrix.from_participants(participants).to_networkx()
+        t_separate, (b1, c1, a1) = timed(lambda: separate(G), args.repeat)
+        t_shared, (b2, c2, a2) = timed(lambda: shared(G), args.repeat)
+        diff = max([abs(b1[v] - b2[v]) for v in G] + [abs(c1[v] - c2[v]) for v in G] + [abs(a1 - a2)])
+        if diff > 1e-9:
+            raise SystemExit(f"Shared sweep differs from NetworkX by {diff} for {n} meetings")
+        print(
+            f"| {n} | {G.number_of_nodes()} | {G.number_of_edges()} | {t_separate:.2f} | {t_shared:.2f} | "
+            f"{t_separate / t_shared:.1f}x | {diff:.1e} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+NetworkX vs. sparse PageRank and eigenvector centrality on the co-attendance graph.
+
+Builds weighted co-attendance graphs from synthetic meetings and times
+``nx.eigenvector_centrality`` + ``nx.pagerank`` against
+``graph_core.centrality.spectral_centrality`` (power iteration on a SciPy
+sparse adjacency), checking that the scores agree within the solvers'
+tolerance.
+
+    python benchmarks/spectral_centrality.py --meetings 1000 4000 --people 3000
+"""
+
+import argparse
+
+import networkx as nx
+from common import make_meetings, timed
+
+from graph_core.centrality import spectral_centrality
+from graph_core.incidence import CoAttendanceMatrix
+from graph_core.snapshot import normalize_participants
+
+
+def networkx_scores(G):
+    return {
+        "eigenvector": nx.eigenvector_centrality(G, max_iter=1000, weight="weight"),
+        "pagerank": nx.pagerank(G, weight="weight"),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--meetings", type=int, nargs="+", default=[1000, 4000])
+    parser.add_argument("--people", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("| Meetings | Nodes | Edges | NetworkX (s) | Sparse (s) | Speed-up | Iterations (eig / PR) | Max abs. difference |")
+    print("|----------|-------|-------|--------------|------------|----------|-----------------------|---------------------|")
+    for n in args.meetings:
+        participants = [normalize_participants(m["meetingInfo"]) for m in make_meetings(n, people=args.people)]
+        G = CoAttendanceMatrix.from_participants(participants).to_networkx()
+        t_nx, expected = timed(lambda: networkx_scores(G), args.repeat)
+        t_sparse, (scores, diagnostics) = timed(lambda: spectral_centrality(G), args.repeat)
+        diff = max(abs(scores[m][v] - expected[m][v]) for m in expected for v in G)
+        if diff > 1e-6:
+            raise SystemExit(f"Sparse scores differ from NetworkX by {diff} for {n} meetings")
+        iterations = " / ".join(str(d["iterations"]) for d in diagnostics)
+        print(
+            f"| {n} | {G.number_of_nodes()} | {G.number_of_edges()} | {t_nx:.2f} | {t_sparse:.3f} | "
+            f"{t_nx / t_sparse:.1f}x | {iterations} | {diff:.1e} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+NetworkX clustering calls vs. one blocked sparse triangle count.
+
+Builds weighted co-attendance graphs from synthetic meetings and times the
+separate ``nx.clustering`` (weighted and unweighted), ``nx.average_clustering``
+and ``nx.transitivity`` calls against ``graph_core.triangles.triangle_stats``,
+which derives all of them from masked sparse products. Checks that the
+results agree before printing the times.
+
+    python benchmarks/triangles.py --meetings 200 400 800 --people 1500
+"""
+
+import argparse
+
+import networkx as nx
+from common import make_meetings, timed
+
+from graph_core.incidence import CoAttendanceMatrix
+from graph_core.snapshot import normalize_participants
+from graph_core.triangles import triangle_stats
+
+
+def separate(G):
+    return {
+        "clustering": nx.clustering(G),
+        "weighted_clustering": nx.clustering(G, weight="weight"),
+        "average_clustering": nx.average_clustering(G),
+        "average_weighted_clustering": nx.average_clustering(G, weight="weight"),
+        "transitivity": nx.transitivity(G),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--meetings", type=int, nargs="+", default=[200, 400, 800])
+    parser.add_argument("--people", type=int, default=1500)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    print("| Meetings | Nodes | Edges | NetworkX (s) | Sparse triangles (s) | Speed-up | Max abs. difference |")
+    print("|----------|-------|-------|--------------|----------------------|----------|---------------------|")
+    for n in args.meetings:
+        participants = [normalize_participants(m["meetingInfo"]) for m in make_meetings(n, people=args.people)]
+        G = CoAttendanceMatrix.from_participants(participants).to_networkx()
+        t_nx, expected = timed(lambda: separate(G), args.repeat)
+        t_sparse, stats = timed(lambda: triangle_stats(G), args.repeat)
+        diff = max(
+            max(abs(stats[key][v] - expected[key][v]) for key in ("clustering", "weighted_clustering") for v in G),
+            max(abs(stats[key] - expected[key]) for key in ("average_clustering", "average_weighted_clustering", "transitivity")),
+        )
+        if diff > 1e-9:
+            raise SystemExit(f"Sparse triangle counts differ from NetworkX by {diff} for {n} meetings")
+        print(
+            f"| {n} | {G.number_of_nodes()} | {G.number_of_edges()} | {t_nx:.2f} | {t_sparse:.3f} | "
+            f"{t_nx / t_sparse:.1f}x | {diff:.1e} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
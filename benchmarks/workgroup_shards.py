@@ -0,0 +1,110 @@
+"""
+One pass over every meeting vs. per-workgroup shards in a process pool.
+
+Times ``build_graphs`` over all synthetic meetings (co-attendance, field
+graph, field components, path trie) against building the same aggregates per
+workgroup across ``--workers`` processes, as ``unified_analysis.py
+--by-workgroup`` does, and merging them with ``graph_core.shards``. Checks
+that the merged graphs, components and paths equal the single-pass ones.
+Speed-up needs free cores; the largest shard's build time is the bound.
+
+    python benchmarks/workgroup_shards.py --meetings 10000 40000 --workers 4
+"""
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from common import make_meetings, timed
+
+from graph_core.components import DisjointSet
+from graph_core.graphs import build_graphs
+from graph_core.incidence import CoAttendanceMatrix
+from graph_core.path_trie import PathTrie, PathTrieCollector
+from graph_core.shards import (
+    ShardCollector,
+    first_appearances,
+    merge_attendance,
+    merge_components,
+    merge_field_sets,
+    merge_paths,
+    split_by_workgroup,
+)
+from graph_core.visitor import FieldSetCollector, ParticipantCollector, visit_records
+
+
+def build_shard(shard):
+    start = time.perf_counter()
+    indices = [index for index, _ in shard]
+    trie = PathTrie()
+    info = ShardCollector(trie)
+    components = DisjointSet()
+    attendance = ParticipantCollector()
+    collectors = [info, attendance, FieldSetCollector(info.add_set), FieldSetCollector(components.union_all), PathTrieCollector(trie)]
+    visit_records((record for _, record in shard), collectors, indices=indices)
+    matrix = CoAttendanceMatrix.from_participants(attendance.participants)
+    matrix.adjacency  # BᵀB is computed in the shard, as when it builds its own report
+    return {
+        "people": first_appearances(indices, attendance.participants),
+        "attendance": matrix,
+        "field_sets": list(info.field_sets.values()),
+        "components": components,
+        "trie": trie,
+        "trie_marks": info.trie_marks,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def sharded(meetings, workers):
+    shards = list(split_by_workgroup(meetings).values())
+    shards.sort(key=len, reverse=True)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(build_shard, shards))
+    start = time.perf_counter()
+    field_counts = merge_field_sets(parts)
+    merged = {
+        "attendance": merge_attendance(parts),
+        "fields": field_counts.to_networkx(),
+        "components": merge_components(field_counts.keys, parts),
+        "paths": merge_paths(parts, template=False),
+    }
+    merged["merge_seconds"] = time.perf_counter() - start
+    merged["largest_seconds"] = max(part["seconds"] for part in parts)
+    return merged
+
+
+def same(full, merged):
+    for kind in ("attendance", "fields"):
+        if list(full[kind].nodes) != list(merged[kind].nodes):
+            return False
+        if list(full[kind].edges(data="weight")) != list(merged[kind].edges(data="weight")):
+            return False
+    if full["components"].summary(10) != merged["components"].summary(10):
+        return False
+    return list(full["paths"].parent) == list(merged["paths"].parent) and list(full["paths"].count) == list(merged["paths"].count)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--meetings", type=int, nargs="+", default=[10000, 40000])
+    parser.add_argument("--workgroups", type=int, default=24)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"| Meetings | Workgroups | One pass (s) | Largest shard (s) | Shards on {args.workers} workers + merge (s) | Merge (s) | Speed-up |")
+    print("|----------|------------|--------------|-------------------|---------------------------------|-----------|----------|")
+    for n in args.meetings:
+        meetings = make_meetings(n, workgroups=args.workgroups)
+        t_full, full = timed(lambda: build_graphs(meetings, ("attendance", "fields", "components", "paths")), args.repeat)
+        t_shards, merged = timed(lambda: sharded(meetings, args.workers), args.repeat)
+        if not same(full, merged):
+            raise SystemExit(f"Merged shard graphs differ from the single pass for {n} meetings")
+        print(
+            f"| {n} | {args.workgroups} | {t_full:.3f} | {merged['largest_seconds']:.3f} | {t_shards:.3f} | "
+            f"{merged['merge_seconds']:.3f} | {t_full / t_shards:.1f}x |"
+        )
+
+
+if __name__ == "__main__":
+    main()
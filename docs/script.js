@@ -1,8 +1,125 @@
 // Network visualization
 let coattendanceNetwork = null;
+let coattendanceGraph = null;
 let initRetryCount = 0;
 const MAX_INIT_RETRIES = 10;
 
+// Data assets written next to index.html (see graph_core/assets.py), fetched once, when a tab first needs them
+const assetRequests = {};
+
+function fetchAsset(src) {
+    if (!assetRequests[src]) {
+        assetRequests[src] = fetchGzipAsset(src).catch(() => fetch(src).then(response => {
+            if (!response.ok) {
+                throw new Error(`${src}: HTTP ${response.status}`);
+            }
+            return response.json();
+        }));
+    }
+    return assetRequests[src];
+}
+
+async function fetchGzipAsset(src) {
+    // Precompressed sidecar, inflated here; servers that already decode it fall back to the plain file
+    if (!window.DecompressionStream) {
+        throw new Error('DecompressionStream not supported');
+    }
+    const response = await fetch(src + '.gz');
+    if (!response.ok) {
+        throw new Error(`${src}.gz: HTTP ${response.status}`);
+    }
+    const stream = response.body.pipeThrough(new DecompressionStream('gzip'));
+    return JSON.parse(await new Response(stream).text());
+}
+
+function truncateLabel(text, maxLen) {
+    const safe = String(text).replace(/\n/g, ' ').trim();
+    return safe.length <= maxLen ? safe : safe.slice(0, maxLen - 1) + '…';
+}
+
+// Expand the compact asset (label table, degrees, flat [u, v, weight, ...] edges) to vis-network items
+function expandCoattendanceGraph(data) {
+    const labels = data.labels;
+    const nodes = labels.map((id, i) => {
+        const node = {
+            id: id,
+            label: truncateLabel(id, 30),
+            value: data.degree[i],
+            title: `${id} - Degree: ${data.degree[i]}`
+        };
+        // Coordinates precomputed by graph_core/layout.py
+        if (data.x) {
+            node.x = data.x[i];
+            node.y = data.y[i];
+        }
+        return node;
+    });
+    return { nodes: nodes, edges: expandEdges(labels, data.edges, weight => `Co-attended ${weight} time(s)`) };
+}
+
+function expandEdges(labels, flat, describe) {
+    const edges = [];
+    for (let k = 0; k < flat.length; k += 3) {
+        const weight = flat[k + 2];
+        edges.push({
+            from: labels[flat[k]],
+            to: labels[flat[k + 1]],
+            value: weight,
+            title: describe(weight)
+        });
+    }
+    return edges;
+}
+
+// Community level (graph_core/lod.py): one node per group of people, opening its own asset (src) when clicked
+function expandCommunityGraph(data) {
+    const nodes = data.labels.map((id, i) => {
+        const node = {
+            id: id,
+            label: `${id} (${data.size[i]})`,
+            value: data.size[i],
+            title: `${id}: ${data.size[i]} people, ${data.ties[i]} co-attendances within; most connected: ${data.top[i].join(', ')}`
+        };
+        if (data.x) {
+            node.x = data.x[i];
+            node.y = data.y[i];
+        }
+        if (data.src) {
+            node.src = data.src[i];
+        }
+        return node;
+    });
+    return { nodes: nodes, edges: expandEdges(data.labels, data.edges, weight => `${weight} co-attendances between the communities`) };
+}
+
+function loadCoattendanceGraph() {
+    // Reports generated before the graph was moved to an asset embed it inline
+    if (typeof coattendanceGraphData !== 'undefined') {
+        return Promise.resolve(coattendanceGraphData);
+    }
+    const container = document.getElementById('coattendance-network');
+    const src = container && container.dataset.src;
+    if (!src) {
+        return Promise.reject(new Error('No co-attendance graph asset in this report'));
+    }
+    return fetchAsset(src).then(data => data.size ? expandCommunityGraph(data) : expandCoattendanceGraph(data));
+}
+
+// Switch the network to another level of detail, or to one community's members
+function showCoattendanceLevel(src, caption) {
+    const container = document.getElementById('coattendance-network');
+    if (!container) {
+        return;
+    }
+    container.dataset.src = src;
+    const info = document.getElementById('coattendance-level-info');
+    if (info) {
+        info.textContent = caption || '';
+    }
+    coattendanceGraph = null;
+    initCoattendanceNetwork();
+}
+
 function initCoattendanceNetwork() {
     try {
         // Check prerequisites - wait for vis library if needed
@@ -21,12 +138,30 @@ function initCoattendanceNetwork() {
         
         initRetryCount = 0; // Reset retry count on success
         
-        if (!coattendanceGraphData) {
-            console.error('coattendanceGraphData not found');
+        if (!coattendanceGraph) {
+            const requested = document.getElementById('coattendance-network');
+            const requestedSrc = requested && requested.dataset.src;
+            loadCoattendanceGraph()
+                .then(graph => {
+                    // Another level was picked while this one loaded
+                    const current = document.getElementById('coattendance-network');
+                    if (coattendanceGraph || (current && current.dataset.src !== requestedSrc)) {
+                        return;
+                    }
+                    coattendanceGraph = graph;
+                    initCoattendanceNetwork();
+                })
+                .catch(error => {
+                    console.error('Error loading co-attendance graph:', error);
+                    const container = document.getElementById('coattendance-network');
+                    if (container) {
+                        container.innerHTML = '<p style="color: red; padding: 20px;">Could not load the co-attendance graph data. When opening the report from disk, serve the docs/ directory over HTTP instead (e.g. python -m http.server -d docs).</p>';
+                    }
+                });
             return;
         }
         
-        if (!coattendanceGraphData.nodes || !Array.isArray(coattendanceGraphData.nodes) || coattendanceGraphData.nodes.length === 0) {
+        if (!coattendanceGraph.nodes || !Array.isArray(coattendanceGraph.nodes) || coattendanceGraph.nodes.length === 0) {
             console.error('No nodes data available');
             return;
         }
@@ -51,7 +186,7 @@ function initCoattendanceNetwork() {
         }
         
         // Calculate min/max values for scaling
-        const nodeValues = coattendanceGraphData.nodes.map(n => n.value || 1);
+        const nodeValues = coattendanceGraph.nodes.map(n => n.value || 1);
         if (nodeValues.length === 0) {
             console.error('No node values available');
             return;
@@ -61,16 +196,19 @@ function initCoattendanceNetwork() {
         const minNodeValue = Math.min(...nodeValues);
         const nodeValueRange = maxNodeValue - minNodeValue;
         
-        const edgeValues = coattendanceGraphData.edges && Array.isArray(coattendanceGraphData.edges) 
-            ? coattendanceGraphData.edges.map(e => e.value || 1)
+        const edgeValues = coattendanceGraph.edges && Array.isArray(coattendanceGraph.edges) 
+            ? coattendanceGraph.edges.map(e => e.value || 1)
             : [];
         const maxEdgeValue = edgeValues.length > 0 ? Math.max(...edgeValues) : 1;
         const minEdgeValue = edgeValues.length > 0 ? Math.min(...edgeValues) : 1;
         const edgeValueRange = maxEdgeValue - minEdgeValue;
     
+    // With precomputed coordinates the network is drawn as laid out, with no physics in the browser
+    const positioned = coattendanceGraph.nodes.every(n => typeof n.x === 'number' && typeof n.y === 'number');
+    
     // Scale nodes: size based on degree (value)
     // Node size between 10 and 50 pixels
-    const scaledNodes = coattendanceGraphData.nodes.map(node => {
+    const scaledNodes = coattendanceGraph.nodes.map(node => {
         const degree = node.value || 1;
         // Scale size: 10 + (degree - min) / range * 40
         const size = nodeValueRange > 0 
@@ -89,6 +227,8 @@ function initCoattendanceNetwork() {
         
         return {
             id: node.id,
+            x: positioned ? node.x : undefined,
+            y: positioned ? node.y : undefined,
             label: node.label || node.id,
             value: degree,
             title: node.title || `${node.id} - Degree: ${degree}`,
@@ -117,8 +257,8 @@ function initCoattendanceNetwork() {
     });
     
     // Scale edges: width based on co-attendance frequency (weight)
-    const edgesData = coattendanceGraphData.edges && Array.isArray(coattendanceGraphData.edges) 
-        ? coattendanceGraphData.edges 
+    const edgesData = coattendanceGraph.edges && Array.isArray(coattendanceGraph.edges) 
+        ? coattendanceGraph.edges 
         : [];
     
     const scaledEdges = edgesData.map(edge => {
@@ -198,7 +338,7 @@ function initCoattendanceNetwork() {
             }
         },
         physics: {
-            enabled: true,
+            enabled: !positioned,
             stabilization: {
                 iterations: 150,
                 updateInterval: 100,
@@ -229,7 +369,7 @@ function initCoattendanceNetwork() {
             hideEdgesOnZoom: false
         },
         layout: {
-            improvedLayout: true,
+            improvedLayout: !positioned,
             hierarchical: {
                 enabled: false
             }
@@ -237,9 +377,12 @@ function initCoattendanceNetwork() {
     };
     
     coattendanceNetwork = new vis.Network(container, data, options);
+    if (positioned) {
+        coattendanceNetwork.fit({ animation: false });
+    }
     
-    // Disable physics after stabilization to prevent constant movement
-    let physicsDisabled = false;
+    // Disable physics after stabilization to prevent constant movement (already off for laid-out graphs)
+    let physicsDisabled = positioned;
     
     coattendanceNetwork.once('stabilizationEnd', function() {
         if (!physicsDisabled) {
@@ -317,7 +460,13 @@ function initCoattendanceNetwork() {
     coattendanceNetwork.on('click', function(params) {
         if (params.nodes.length > 0) {
             const nodeId = params.nodes[0];
-            const node = coattendanceGraphData.nodes.find(n => n.id === nodeId);
+            const node = coattendanceGraph.nodes.find(n => n.id === nodeId);
+            
+            // A community opens as its members with all the ties among them
+            if (node && node.src) {
+                showCoattendanceLevel(node.src, `${node.id}: ${node.value} people. Click the background to go back.`);
+                return;
+            }
             
             // If clicking the same node again, reset to full view
             if (currentlySelectedNodeId === nodeId) {
@@ -330,6 +479,12 @@ function initCoattendanceNetwork() {
         } else if (params.nodes.length === 0 && currentlySelectedNodeId) {
             // Clicking on background: reset to full view
             filterToNode(null);
+        } else if (params.nodes.length === 0) {
+            // Clicking on background inside a community: back to the selected level
+            const level = document.getElementById('coattendance-level');
+            if (level && container.dataset.src !== level.value) {
+                showCoattendanceLevel(level.value);
+            }
         }
     });
     
@@ -356,6 +511,42 @@ function initCoattendanceNetwork() {
     }
 }
 
+// Temporal co-attendance chart (only present when the report was built with --temporal)
+let temporalChart = null;
+
+function initTemporalChart() {
+    const canvas = document.getElementById('temporal-chart');
+    if (temporalChart || !canvas || !canvas.dataset.src || !window.Chart) {
+        return;
+    }
+    fetchAsset(canvas.dataset.src).then(series => {
+        if (temporalChart) {
+            return;
+        }
+        temporalChart = new Chart(canvas, {
+            type: 'line',
+            data: {
+                labels: series.label,
+                datasets: [
+                    { label: 'People', data: series.people, borderColor: '#0366d6', yAxisID: 'y' },
+                    { label: 'Meetings', data: series.meetings, borderColor: '#28a745', yAxisID: 'y' },
+                    { label: 'Components', data: series.components, borderColor: '#d73a49', yAxisID: 'y' },
+                    { label: 'Density', data: series.density, borderColor: '#6f42c1', borderDash: [6, 4], yAxisID: 'density' }
+                ]
+            },
+            options: {
+                interaction: { mode: 'index', intersect: false },
+                scales: {
+                    y: { beginAtZero: true, title: { display: true, text: 'Count' } },
+                    density: { position: 'right', beginAtZero: true, grid: { drawOnChartArea: false }, title: { display: true, text: 'Density' } }
+                }
+            }
+        });
+    }).catch(error => {
+        console.error('Error loading temporal series:', error);
+    });
+}
+
 // Tab switching functionality
 function showTab(tabId) {
     // Hide all tab panes
@@ -381,6 +572,7 @@ function showTab(tabId) {
     const tabMap = {
         'summary': 'Summary',
         'coattendance': 'Co-attendance Degree',
+        'temporal': 'Temporal',
         'field-degree': 'Field Degree',
         'path-structure': 'Path Structure',
         'centrality': 'Centrality',
@@ -411,6 +603,13 @@ function showTab(tabId) {
         }
     }
     
+    // Draw the temporal chart once its tab is visible (Chart.js needs a sized canvas)
+    if (tabId === 'temporal') {
+        setTimeout(() => {
+            initTemporalChart();
+        }, 100);
+    }
+
     // Load audit data if showing audit tab
     if (tabId === 'audit') {
         setTimeout(() => {
@@ -429,7 +628,7 @@ window.addEventListener('DOMContentLoaded', function() {
     const hash = window.location.hash.substring(1);
     if (hash) {
         // Check if hash corresponds to a valid tab
-        const validTabs = ['summary', 'coattendance', 'field-degree', 'path-structure', 'centrality', 'clustering', 'components', 'audit'];
+        const validTabs = ['summary', 'coattendance', 'temporal', 'field-degree', 'path-structure', 'centrality', 'clustering', 'components', 'audit'];
         if (validTabs.includes(hash)) {
             showTab(hash);
             return;
@@ -443,7 +642,7 @@ window.addEventListener('DOMContentLoaded', function() {
 window.addEventListener('popstate', function() {
     const hash = window.location.hash.substring(1);
     if (hash) {
-        const validTabs = ['summary', 'coattendance', 'field-degree', 'path-structure', 'centrality', 'clustering', 'components', 'audit'];
+        const validTabs = ['summary', 'coattendance', 'temporal', 'field-degree', 'path-structure', 'centrality', 'clustering', 'components', 'audit'];
         if (validTabs.includes(hash)) {
             showTab(hash);
         }
@@ -0,0 +1,8 @@
+"""
+Shared helpers for the meeting-summary analysis scripts.
+
+Scripts live in directories that are not importable packages ("Graph Analysis",
+"Data Analysis", "Scripts"), so each one puts the repository root on
+``sys.path`` and imports the submodule it needs, e.g.
+``from graph_core.fetch import fetch_json``.
+"""
@@ -0,0 +1,89 @@
+"""
+Dashboard data written as separate, compact JSON assets.
+
+``write_html_report`` used to inline the co-attendance graph in
+``docs/index.html`` as one dict per node and edge, each with a prebuilt
+``title`` string, so every page load parsed it whichever tab was open. The
+data now goes to files next to the page (``data/*.json``), which
+``docs/script.js`` fetches the first time a tab needs them:
+
+- ``compact_graph`` lists every node once in a label table; degrees are a list
+  aligned with it and edges a flat ``[u, v, weight, ...]`` list of indices into
+  it. Display labels, tooltips and styling are derived in the browser. With
+  layout positions (``graph_core/layout.py``) it also carries ``x``/``y`` lists,
+  which ``read_positions`` reads back so the next run can keep them. The
+  levels of detail in ``graph_core/lod.py`` use the same form for parts of
+  the graph.
+- ``write_json_asset`` streams the JSON to disk with ``JSONEncoder.iterencode``
+  instead of building the document as one string, and writes a gzip sidecar
+  (``.json.gz``) in the same pass, for servers that serve precompressed files
+  and for browsers that inflate it themselves with ``DecompressionStream``.
+"""
+
+import gzip
+import json
+import os
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import networkx as nx
+
+ASSET_DIR = "data"
+# Characters of encoded JSON gathered before each write to the two files.
+_WRITE_CHUNK = 1 << 16
+
+
+def compact_graph(
+    G: nx.Graph,
+    positions: Optional[Dict[Hashable, Tuple[float, float]]] = None,
+    nodes: Optional[Iterable[Hashable]] = None,
+    edges: Optional[Iterable[Tuple[Hashable, Hashable, Any]]] = None,
+) -> Dict[str, Any]:
+    """``{"labels", "degree", "edges"}`` form of a weighted graph, plus ``x``/``y`` with ``positions`` (see module docstring).
+
+    ``nodes`` and ``edges`` (``(u, v, weight)`` between those nodes) restrict it to part of ``G``; degrees stay ``G``'s.
+    """
+    labels = list(G) if nodes is None else list(nodes)
+    index = {node: i for i, node in enumerate(labels)}
+    flat: List[Any] = []
+    for u, v, w in G.edges(data="weight", default=1) if edges is None else edges:
+        flat.extend((index[u], index[v], w))
+    degree = [d for _, d in G.degree()] if nodes is None else [G.degree(node) for node in labels]
+    data: Dict[str, Any] = {"labels": [str(node) for node in labels], "degree": degree, "edges": flat}
+    if positions:
+        data["x"] = [positions[node][0] for node in labels]
+        data["y"] = [positions[node][1] for node in labels]
+    return data
+
+
+def read_positions(path: str) -> Dict[str, Tuple[float, float]]:
+    """Node positions stored in a graph asset by an earlier run; empty if there is none (or it has no layout)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return {label: (x, y) for label, x, y in zip(data["labels"], data["x"], data["y"])}
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def write_json_asset(path: str, obj: Any) -> Tuple[int, int]:
+    """Stream ``obj`` as compact JSON to ``path`` and ``path + ".gz"``; return both sizes in bytes."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    with open(path, "wb") as plain, open(path + ".gz", "wb") as raw:
+        # mtime=0 keeps the sidecar byte-identical while the data is unchanged; level 6 (the
+        # gzip tool's default) is several times faster than 9 for a few percent more bytes.
+        with gzip.GzipFile(filename="", mode="wb", compresslevel=6, fileobj=raw, mtime=0) as packed:
+            pending: List[str] = []
+            size = 0
+            for chunk in encoder.iterencode(obj):
+                pending.append(chunk)
+                size += len(chunk)
+                if size >= _WRITE_CHUNK:
+                    data = "".join(pending).encode("utf-8")
+                    plain.write(data)
+                    packed.write(data)
+                    pending, size = [], 0
+            data = "".join(pending).encode("utf-8")
+            plain.write(data)
+            packed.write(data)
+        return plain.tell(), raw.tell()
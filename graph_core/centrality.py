@@ -0,0 +1,428 @@
+"""
+Centrality measures with an exact and a sampled (approximate) mode.
+
+Exact betweenness and closeness run one BFS from every node, O(VE) on
+unweighted graphs. That is fine for the field graph but not for a multi-year
+co-attendance graph, so ``compute_centrality`` can also estimate both from a
+seeded sample of ``k`` pivot sources:
+
+- betweenness: Brandes–Pich source sampling (``nx.betweenness_centrality``
+  with ``k`` and ``seed``). Each pivot contributes a value in ``[0, n/(n-1)]``
+  to a node's normalized score, so by Hoeffding's inequality and a union
+  bound over all nodes every estimate is within
+  ``±n/(n-1) * sqrt(ln(2n/δ) / 2k)`` of the exact value with probability
+  ``1 - δ``.
+- closeness: Eppstein–Wang pivot sampling. Pivots are drawn per connected
+  component in proportion to its size; a node's average distance to the rest
+  of its component is estimated by its average distance to the pivots (one
+  BFS per pivot). Its error is reported as the widest per-node normal
+  confidence interval on the closeness value itself: the standard error of
+  the node's mean pivot distance (sample variance, finite-population
+  corrected) carried through ``1/d`` by the delta method. Components no
+  larger than their pivot share are computed exactly.
+
+``mode="auto"`` stays exact up to ``APPROX_MIN_NODES`` nodes. The returned
+info dict records the estimator, pivots, seed, bounds and wall time of each
+measure for the reports.
+
+``spectral_centrality`` computes weighted eigenvector centrality and PageRank
+by vectorized power iteration on a SciPy sparse adjacency matrix (the same
+iterations as ``nx.eigenvector_centrality`` / ``nx.pagerank``) and returns
+convergence diagnostics instead of silently zeroing the scores: if
+eigenvector power iteration stalls, the leading eigenvector is taken from
+ARPACK (``eigsh``) and the report says so. Both solvers, and the field-graph
+eigenvector centrality of ``compute_centrality``, accept the previous run's
+scores as a start vector (``graph_core/warm_start.py``).
+
+Exact betweenness and closeness are read from one BFS per source
+(``graph_core/shortest_paths.py``), which can be split across processes
+(``workers > 1``) and also yields the path-length statistics of the
+component reports.
+"""
+
+import math
+import random
+import time
+from statistics import NormalDist
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import networkx as nx
+import numpy as np
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import ArpackNoConvergence, eigsh
+
+from graph_core.shortest_paths import shared_shortest_paths
+from graph_core.warm_start import WarmStart
+
+CENTRALITY_MODES = ("auto", "exact", "approx")
+APPROX_MIN_NODES = 2000
+DEFAULT_PIVOTS = 256
+DEFAULT_CONFIDENCE = 0.95
+
+
+def hoeffding_bound(k: int, n: int, value_range: float, confidence: float = DEFAULT_CONFIDENCE) -> float:
+    """Half-width of a ``confidence`` interval holding for all ``n`` estimates at once, from ``k`` samples in ``value_range``."""
+    if k <= 0 or n <= 0:
+        return float("inf")
+    delta = 1.0 - confidence
+    return value_range * math.sqrt(math.log(2 * n / delta) / (2 * k))
+
+
+# ---------------- Exact betweenness ----------------
+
+def parallel_betweenness(G: nx.Graph, workers: int = 1) -> Dict[Any, float]:
+    """Exact normalized betweenness (as ``nx.betweenness_centrality(G)``) over ``workers`` processes."""
+    return shared_shortest_paths(G, workers).betweenness()
+
+
+# ---------------- Sampled estimators ----------------
+
+def approximate_betweenness(G: nx.Graph, k: int, seed: int = 0) -> Tuple[Dict[Any, float], float]:
+    """Normalized betweenness from ``k`` sampled sources and its simultaneous error bound."""
+    n = G.number_of_nodes()
+    scores = nx.betweenness_centrality(G, k=k, seed=seed)
+    return scores, hoeffding_bound(k, n, n / (n - 1) if n > 1 else 0.0)
+
+
+def approximate_closeness(
+    G: nx.Graph, k: int, seed: int = 0, confidence: float = DEFAULT_CONFIDENCE
+) -> Tuple[Dict[Any, float], float, int]:
+    """Closeness (``nx.closeness_centrality`` scaling) from about ``k`` pivots.
+
+    Returns the scores, the largest half-width of a node's ``confidence``
+    interval on its closeness (0 if every component was exact; see module
+    docstring) and the number of BFS runs.
+    """
+    n = G.number_of_nodes()
+    rng = random.Random(seed)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    closeness: Dict[Any, float] = {}
+    bound = 0.0
+    runs = 0
+    for component in sorted(nx.connected_components(G), key=len, reverse=True):
+        # In G's node order: a set's order follows the hash seed, and so would the sample.
+        members = [node for node in G if node in component]
+        size = len(members)
+        share = max(2, math.ceil(k * size / n))
+        pivots = members if share >= size else rng.sample(members, share)
+        totals = dict.fromkeys(members, 0)
+        squares = dict.fromkeys(members, 0)
+        for pivot in pivots:
+            lengths = nx.single_source_shortest_path_length(G, pivot)
+            runs += 1
+            for node, dist in lengths.items():
+                totals[node] += dist
+                squares[node] += dist * dist
+        exact = len(pivots) == size
+        pivot_set = set(pivots)
+        for node in members:
+            if size == 1:
+                closeness[node] = 0.0
+                continue
+            samples = len(pivots) - (1 if node in pivot_set else 0)
+            mean_dist = totals[node] / samples if samples else 0.0
+            if exact or not mean_dist:
+                # Every other node is a pivot: the distance sum is exact.
+                dist_sum = totals[node]
+            else:
+                dist_sum = mean_dist * (size - 1)
+            closeness[node] = ((size - 1) / dist_sum) * ((size - 1) / (n - 1)) if dist_sum else 0.0
+            if not exact and samples > 1 and mean_dist:
+                # Pivots are drawn without replacement from the size - 1 other nodes.
+                variance = max(squares[node] - samples * mean_dist * mean_dist, 0.0) / (samples - 1)
+                correction = (size - 1 - samples) / (size - 2)
+                stderr = math.sqrt(variance / samples * correction)
+                bound = max(bound, z * closeness[node] * stderr / mean_dist)
+    return closeness, bound, runs
+
+
+def compute_centrality(
+    G: nx.Graph,
+    mode: str = "auto",
+    k: int = DEFAULT_PIVOTS,
+    seed: int = 0,
+    workers: int = 1,
+    warm: Optional[WarmStart] = None,
+) -> Tuple[Dict[str, Dict[Any, float]], Dict[str, Any]]:
+    """Degree, betweenness, closeness and eigenvector centrality, plus how they were computed.
+
+    Eigenvector centrality is unweighted, as before; with ``warm`` it starts
+    from the scores stored for the ``"fields"`` graph.
+    """
+    if mode not in CENTRALITY_MODES:
+        raise ValueError(f"Unknown centrality mode {mode!r}; choose from {', '.join(CENTRALITY_MODES)}")
+    n = G.number_of_nodes()
+    approx = (mode == "approx" or (mode == "auto" and n > APPROX_MIN_NODES)) and 0 < k < n
+    info: Dict[str, Any] = {
+        "mode": "approx" if approx else "exact",
+        "requested_mode": mode,
+        "nodes": n,
+        "edges": G.number_of_edges(),
+        "confidence": DEFAULT_CONFIDENCE,
+        "runtime": {},
+    }
+    metrics: Dict[str, Dict[Any, float]] = {}
+
+    start = time.perf_counter()
+    metrics["degree"] = nx.degree_centrality(G) if n else {}
+    info["runtime"]["degree"] = time.perf_counter() - start
+
+    if approx:
+        start = time.perf_counter()
+        metrics["betweenness"], info["betweenness_bound"] = approximate_betweenness(G, k, seed)
+        info["betweenness_estimator"] = f"Brandes–Pich source sampling, k={k} pivots, seed={seed}"
+        info["runtime"]["betweenness"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        metrics["closeness"], info["closeness_bound"], runs = approximate_closeness(G, k, seed, DEFAULT_CONFIDENCE)
+        info["closeness_estimator"] = f"Eppstein–Wang pivot sampling, {runs} BFS runs, seed={seed}"
+        info["runtime"]["closeness"] = time.perf_counter() - start
+    else:
+        # One BFS per source feeds both measures (and the path-length statistics).
+        start = time.perf_counter()
+        paths = shared_shortest_paths(G, workers)
+        metrics["betweenness"] = paths.betweenness()
+        metrics["closeness"] = paths.closeness()
+        sweep = "one BFS per source, shared by betweenness, closeness and path lengths"
+        if workers > 1:
+            sweep += f", {workers} worker processes"
+        info["betweenness_estimator"] = f"exact (Brandes; {sweep})"
+        info["closeness_estimator"] = f"exact ({sweep})"
+        info["runtime"]["betweenness + closeness"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    metrics["eigenvector"], info["eigenvector"] = warm_solve("eigenvector", G, "fields", warm, weight=None)
+    info["runtime"]["eigenvector"] = time.perf_counter() - start
+    return metrics, info
+
+
+# ---------------- Spectral measures ----------------
+
+def _diagnostics(
+    measure: str, method: str, iterations: int, converged: bool, residual: float, tol: float, seconds: float, warm: bool = False
+) -> Dict[str, Any]:
+    return {
+        "measure": measure,
+        "method": method,
+        "start": "warm" if warm else "uniform",
+        "iterations": iterations,
+        "converged": converged,
+        "residual": residual,
+        "tolerance": tol,
+        "seconds": seconds,
+    }
+
+
+def _start_vector(nodes: List[Any], nstart: Optional[Dict[Any, float]]) -> Optional[np.ndarray]:
+    """``nstart`` in ``nodes`` order (missing nodes at 0), or ``None`` if it is empty or all zero."""
+    if not nstart:
+        return None
+    x = np.array([nstart.get(node, 0.0) for node in nodes], dtype=float)
+    return x if x.any() else None
+
+
+def sparse_eigenvector(
+    G: nx.Graph,
+    weight: Optional[str] = "weight",
+    tol: float = 1e-6,
+    max_iter: int = 1000,
+    nstart: Optional[Dict[Any, float]] = None,
+    settled: Optional[Iterable[Any]] = None,
+) -> Tuple[Dict[Any, float], Dict[str, Any]]:
+    """Eigenvector centrality by power iteration on ``A + I``, as ``nx.eigenvector_centrality``.
+
+    On a disconnected graph the result depends on how much of the start
+    vector lies in each component (components with equal leading eigenvalues
+    keep their initial ratio), and settling that balance takes most of the
+    iterations. A warm ``nstart`` keeps its values as they are on the
+    ``settled`` nodes, whose components are unchanged since the run it comes
+    from. Every other component keeps its shape but is rescaled to a uniform
+    start's projection, grown by the largest factor a settled component has
+    grown by since its own uniform start (so a component with the leading
+    eigenvalue lands where a cold run would take it). Warm and cold runs
+    agree to the tolerance.
+    """
+    start = time.perf_counter()
+    nodes = list(G)
+    n = len(nodes)
+    if n == 0:
+        return {}, _diagnostics("eigenvector", "empty graph", 0, True, 0.0, tol, 0.0)
+    A = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=weight, dtype=float, format="csr")
+    x = _start_vector(nodes, nstart)
+    warm = x is not None
+    if warm:
+        _, labels = connected_components(A, directed=False)
+        sums = np.bincount(labels, weights=x)
+        squares = np.bincount(labels, weights=x * x)
+        # x_c -> x_c * <1_c, x_c> / |x_c|^2: the projection of a uniform start
+        # on the direction of x_c, per component (uniform where x_c is zero).
+        scale = np.divide(sums, squares, out=np.zeros_like(sums), where=squares > 0)
+        kept = np.zeros(len(sums), dtype=bool)
+        if settled:
+            position = {node: i for i, node in enumerate(nodes)}
+            kept[labels[[position[node] for node in settled if node in position]]] = True
+            kept &= sums > 0
+        # A settled x_c is its uniform projection grown by |x_c|^2 / <1_c, x_c>.
+        growth = float((squares[kept] / sums[kept]).max()) if kept.any() else 1.0
+        rescaled = np.where(squares[labels] > 0, x * scale[labels], 1.0) * growth
+        x = np.where(kept[labels], x, rescaled)
+        x = x / np.linalg.norm(x)
+    else:
+        x = np.full(n, 1.0 / n)
+    residual = float("inf")
+    iterations = 0
+    while iterations < max_iter:
+        iterations += 1
+        xlast = x
+        x = xlast + A @ xlast
+        norm = np.linalg.norm(x) or 1.0
+        x = x / norm
+        residual = float(np.abs(x - xlast).sum())
+        if residual < n * tol:
+            method = "sparse power iteration"
+            return dict(zip(nodes, x.tolist())), _diagnostics(
+                "eigenvector", method, iterations, True, residual, tol, time.perf_counter() - start, warm
+            )
+    # Power iteration stalled (e.g. near-equal leading eigenvalues): ask ARPACK.
+    try:
+        _, vectors = eigsh(A, k=1, which="LA", tol=tol, maxiter=max_iter * n)
+        x = np.abs(vectors[:, 0])
+        x = x / (np.linalg.norm(x) or 1.0)
+        method = "ARPACK eigsh (power iteration did not converge)"
+        converged = True
+    except ArpackNoConvergence:
+        method = "sparse power iteration (not converged; last iterate)"
+        converged = False
+    return dict(zip(nodes, x.tolist())), _diagnostics(
+        "eigenvector", method, iterations, converged, residual, tol, time.perf_counter() - start, warm
+    )
+
+
+def sparse_pagerank(
+    G: nx.Graph,
+    weight: Optional[str] = "weight",
+    alpha: float = 0.85,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    nstart: Optional[Dict[Any, float]] = None,
+) -> Tuple[Dict[Any, float], Dict[str, Any]]:
+    """PageRank by power iteration on the row-normalized sparse adjacency, as ``nx.pagerank``."""
+    start = time.perf_counter()
+    nodes = list(G)
+    n = len(nodes)
+    if n == 0:
+        return {}, _diagnostics("pagerank", "empty graph", 0, True, 0.0, tol, 0.0)
+    A = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=weight, dtype=float, format="csr")
+    out = np.asarray(A.sum(axis=1)).ravel()
+    dangling = out == 0
+    inv = np.zeros(n)
+    inv[~dangling] = 1.0 / out[~dangling]
+    # x @ Q with Q = diag(1/out) A, written as (x / out) @ A to keep A as is.
+    p = np.full(n, 1.0 / n)
+    x = _start_vector(nodes, nstart)
+    warm = x is not None
+    x = x / x.sum() if warm else p.copy()
+    residual = float("inf")
+    iterations = 0
+    converged = False
+    while iterations < max_iter:
+        iterations += 1
+        xlast = x
+        x = alpha * ((xlast * inv) @ A + xlast[dangling].sum() * p) + (1 - alpha) * p
+        residual = float(np.abs(x - xlast).sum())
+        if residual < n * tol:
+            converged = True
+            break
+    method = "sparse power iteration" if converged else "sparse power iteration (not converged; last iterate)"
+    return dict(zip(nodes, x.tolist())), _diagnostics(
+        "pagerank", method, iterations, converged, residual, tol, time.perf_counter() - start, warm
+    )
+
+
+SPECTRAL_SOLVERS = {"eigenvector": sparse_eigenvector, "pagerank": sparse_pagerank}
+
+
+def warm_solve(measure: str, G: nx.Graph, graph: str, warm: Optional[WarmStart], **kwargs: Any) -> Tuple[Dict[Any, float], Dict[str, Any]]:
+    """Run the ``measure`` solver from the scores ``warm`` holds for ``graph`` and store its result back."""
+    seed = warm.start(graph, measure, G) if warm else None
+    # PageRank has one fixed point whatever the start; eigenvector centrality
+    # depends on the start's balance across components, so it keeps them.
+    partitioned = measure == "eigenvector"
+    if seed:
+        kwargs["nstart"] = seed["vector"]
+        if partitioned:
+            kwargs["settled"] = seed["settled"]
+    scores, diagnostics = SPECTRAL_SOLVERS[measure](G, **kwargs)
+    if seed and diagnostics["start"] == "warm":
+        diagnostics["new_nodes"] = seed["new_nodes"]
+    if warm:
+        warm.record(graph, measure, scores, diagnostics, G if partitioned else None)
+    return scores, diagnostics
+
+
+def spectral_centrality(
+    G: nx.Graph, weight: Optional[str] = "weight", warm: Optional[WarmStart] = None, graph: str = "attendance"
+) -> Tuple[Dict[str, Dict[Any, float]], List[Dict[str, Any]]]:
+    """Weighted eigenvector centrality and PageRank with their convergence diagnostics."""
+    eigenvector, eig_info = warm_solve("eigenvector", G, graph, warm, weight=weight)
+    pagerank, pr_info = warm_solve("pagerank", G, graph, warm, weight=weight)
+    return {"eigenvector": eigenvector, "pagerank": pagerank}, [eig_info, pr_info]
+
+
+def describe_start(diagnostics: Dict[str, Any]) -> str:
+    """"uniform", or the warm start's new nodes and the iterations it saved."""
+    if diagnostics["start"] != "warm":
+        return "uniform"
+    text = f"warm ({diagnostics.get('new_nodes', 0)} new nodes"
+    if "iterations_saved" in diagnostics:
+        text += (
+            f", {diagnostics['iterations_saved']} iterations saved vs. the last cold start"
+            f" on {diagnostics['baseline_nodes']} nodes"
+        )
+    return text + ")"
+
+
+def describe_convergence(diagnostics: List[Dict[str, Any]]) -> List[Tuple[str, str, str, str, str, str, str]]:
+    """(measure, method, start, iterations, converged, residual, time) rows for the reports."""
+    return [
+        (
+            d["measure"],
+            d["method"],
+            describe_start(d),
+            str(d["iterations"]),
+            "yes" if d["converged"] else "no",
+            f"{d['residual']:.2e} (tol {d['tolerance']:.0e} x n)",
+            f"{d['seconds']:.3f}s",
+        )
+        for d in diagnostics
+    ]
+
+
+def describe_centrality(info: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """(label, value) rows describing how centrality was computed, for the reports."""
+    rows = [
+        ("Mode", f"{info['mode']} (requested: {info['requested_mode']}, {info['nodes']} nodes, {info['edges']} edges)"),
+        ("Betweenness", info["betweenness_estimator"]),
+        ("Closeness", info["closeness_estimator"]),
+    ]
+    eigenvector = info.get("eigenvector")
+    if eigenvector:
+        status = "" if eigenvector["converged"] else ", not converged"
+        rows.append((
+            "Eigenvector",
+            f"{eigenvector['method']}, {eigenvector['iterations']} iterations{status}, start: {describe_start(eigenvector)}",
+        ))
+    confidence = f"{info['confidence']:.0%}"
+    if "betweenness_bound" in info:
+        rows.append(("Betweenness error bound", f"±{info['betweenness_bound']:.4f} for every node ({confidence} confidence, Hoeffding)"))
+    if "closeness_bound" in info:
+        bound = info["closeness_bound"]
+        rows.append((
+            "Closeness error bound",
+            f"±{bound:.4f} at most, on each node's closeness ({confidence} normal interval from its pivot-distance variance)"
+            if bound
+            else "exact (every component fully sampled)",
+        ))
+    runtime = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in info["runtime"].items())
+    rows.append(("Runtime", runtime))
+    return rows
@@ -0,0 +1,166 @@
+"""
+Connected components by union-find, fed while records stream in.
+
+``nx.connected_components`` needs the whole adjacency first and then
+materializes every component as a set. Connectivity only depends on which
+items ever appear together, so ``DisjointSet`` takes each meeting's
+participants or each object's key set as it is visited (``union_all``) and
+keeps one parent pointer per item: union by rank, path compression on every
+``find``. Component count, size distribution and a sample of the largest
+component are read from the root sizes without building either.
+
+Items and components keep first-seen order, so ties between equally large
+components resolve as they do for ``nx.connected_components`` on a graph
+built from the same stream. A ``DisjointSet`` only grows: new meetings are
+added to a stored one, and sets built over separate shards of the input are
+combined with ``merge``. ``to_state``/``from_state`` give it a JSON form.
+"""
+
+from typing import Any, Dict, Hashable, Iterable, List, Optional
+
+import networkx as nx
+
+
+class DisjointSet:
+    """Union-find over hashable items with union by rank and path compression."""
+
+    def __init__(self) -> None:
+        self._index: Dict[Hashable, int] = {}
+        self.items: List[Hashable] = []
+        self._parent: List[int] = []
+        self._rank: List[int] = []
+        self._size: List[int] = []
+        self.count = 0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._index
+
+    def add(self, item: Hashable) -> int:
+        """Index of ``item``, adding it as a singleton component if new."""
+        i = self._index.get(item)
+        if i is None:
+            i = self._index[item] = len(self.items)
+            self.items.append(item)
+            self._parent.append(i)
+            self._rank.append(0)
+            self._size.append(1)
+            self.count += 1
+        return i
+
+    def _find(self, i: int) -> int:
+        parent = self._parent
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    def _union(self, a: int, b: int) -> int:
+        ra, rb = self._find(a), self._find(b)
+        if ra == rb:
+            return ra
+        if self._rank[ra] < self._rank[rb]:
+            ra, rb = rb, ra
+        self._parent[rb] = ra
+        self._size[ra] += self._size[rb]
+        if self._rank[ra] == self._rank[rb]:
+            self._rank[ra] += 1
+        self.count -= 1
+        return ra
+
+    def find(self, item: Hashable) -> Hashable:
+        """Representative item of ``item``'s component."""
+        return self.items[self._find(self._index[item])]
+
+    def connected(self, a: Hashable, b: Hashable) -> bool:
+        return a in self._index and b in self._index and self._find(self._index[a]) == self._find(self._index[b])
+
+    def union(self, a: Hashable, b: Hashable) -> None:
+        self._union(self.add(a), self.add(b))
+
+    def union_all(self, items: Iterable[Hashable]) -> None:
+        """Put all of ``items`` (one meeting's participants, one object's keys) in one component."""
+        first = None
+        for item in items:
+            i = self.add(item)
+            if first is None:
+                first = i
+            else:
+                first = self._union(first, i)
+
+    def merge(self, other: "DisjointSet") -> None:
+        """Add every item and connection of ``other`` (e.g. a set built over another shard)."""
+        for i, item in enumerate(other.items):
+            self.union(item, other.items[other._find(i)])
+
+    # -- reading components --
+
+    def _roots_by_size(self) -> List[int]:
+        """Component roots, largest first; ties in order of each component's first-seen item."""
+        order: Dict[int, int] = {}
+        for i in range(len(self.items)):
+            root = self._find(i)
+            if root not in order:
+                order[root] = len(order)
+        return sorted(order, key=lambda root: (-self._size[root], order[root]))
+
+    def component_sizes(self) -> List[int]:
+        return [self._size[root] for root in self._roots_by_size()]
+
+    def components(self) -> List[List[Hashable]]:
+        """Every component's items in first-seen order, largest component first."""
+        members: Dict[int, List[Hashable]] = {}
+        for i, item in enumerate(self.items):
+            members.setdefault(self._find(i), []).append(item)
+        return [members[root] for root in self._roots_by_size()]
+
+    def sample(self, root_item: Hashable, top: int) -> List[Hashable]:
+        """First ``top`` items (in first-seen order) of ``root_item``'s component."""
+        root = self._find(self._index[root_item])
+        sample: List[Hashable] = []
+        for i in range(len(self.items)):
+            if len(sample) >= top:
+                break
+            if self._find(i) == root:
+                sample.append(self.items[i])
+        return sample
+
+    def summary(self, top: int) -> Dict[str, Any]:
+        """Component count, sizes (largest first) and up to ``top`` items of the largest component."""
+        roots = self._roots_by_size()
+        return {
+            "component_count": len(roots),
+            "component_sizes": [self._size[root] for root in roots],
+            "largest_component_sample": self.sample(self.items[roots[0]], top) if roots else [],
+        }
+
+    # -- construction and persistence --
+
+    @classmethod
+    def from_graph(cls, G: nx.Graph) -> "DisjointSet":
+        ds = cls()
+        for node in G:
+            ds.add(node)
+        for u, v in G.edges():
+            ds.union(u, v)
+        return ds
+
+    def to_state(self) -> Dict[str, List[Any]]:
+        return {"items": list(self.items), "parent": list(self._parent), "rank": list(self._rank), "size": list(self._size)}
+
+    @classmethod
+    def from_state(cls, state: Optional[Dict[str, List[Any]]]) -> "DisjointSet":
+        ds = cls()
+        if not state:
+            return ds
+        ds.items = list(state["items"])
+        ds._index = {item: i for i, item in enumerate(ds.items)}
+        ds._parent = list(state["parent"])
+        ds._rank = list(state["rank"])
+        ds._size = list(state["size"])
+        ds.count = sum(1 for i, p in enumerate(ds._parent) if i == p)
+        return ds
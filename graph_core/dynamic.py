@@ -0,0 +1,289 @@
+"""
+Degree, components and triangles kept up to date as meetings come and go.
+
+Correcting one meeting upstream (a name fixed in ``peoplePresent``) used to
+mean rerunning every analysis. ``DynamicGraph`` holds a graph as node and pair
+counts, like ``AnalysisState``: every meeting (or JSON object) adds a clique
+over its participants (or keys), and removing it subtracts the same clique.
+An edge exists while its pair count is positive, so the topology only changes
+when a count moves between 0 and 1, and each such change updates:
+
+- degrees and the degree distribution (one histogram bucket moves per endpoint),
+- per-node triangle counts: the endpoints' common neighbours each gain or
+  lose one triangle, and the endpoints gain or lose one per common neighbour,
+- connected components: an inserted edge relabels the smaller component; a
+  deleted edge runs two breadth-first searches, one from each endpoint, in
+  lockstep until they meet (still connected) or one side runs out, and that
+  side, the smaller one, becomes a new component.
+
+Queries (degree, distribution, component count and sizes, triangles,
+clustering) then read the maintained values instead of walking the graph.
+``DynamicMeetingGraphs`` applies ``add_meeting`` / ``remove_meeting`` /
+``replace_meeting`` to the co-attendance and field graphs together.
+"""
+
+from collections import Counter, deque
+from itertools import combinations
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+import networkx as nx
+
+from graph_core.snapshot import normalize_participants
+from graph_core.visitor import iter_field_combinations
+
+
+class DynamicGraph:
+    """Undirected graph of pair counts with incrementally maintained degree, component and triangle data."""
+
+    def __init__(self) -> None:
+        self.counts: Dict[Hashable, int] = {}
+        self.adj: Dict[Hashable, Dict[Hashable, int]] = {}
+        self.degree_histogram: Counter = Counter()
+        self.triangles: Dict[Hashable, int] = {}
+        self.triangle_count = 0
+        self._label: Dict[Hashable, int] = {}
+        self._members: Dict[int, Set[Hashable]] = {}
+        self._next_label = 0
+
+    # -- updates --
+
+    def add_clique(self, members: Sequence[Hashable]) -> None:
+        """Count one more group (meeting participants or object keys) connecting all of ``members``."""
+        self._apply(members, 1)
+
+    def remove_clique(self, members: Sequence[Hashable]) -> None:
+        """Retract a group previously passed to ``add_clique``."""
+        self._apply(members, -1)
+
+    def _apply(self, members: Sequence[Hashable], sign: int) -> None:
+        members = list(dict.fromkeys(members))
+        if len(members) < 2:
+            return
+        if sign > 0:
+            for node in members:
+                self._add_node(node)
+        else:
+            missing = [node for node in members if node not in self.adj]
+            if missing:
+                raise ValueError(f"Cannot remove a group with nodes not in the graph: {missing[:5]}")
+        for u, v in combinations(members, 2):
+            old = self.adj[u].get(v, 0)
+            if old == 0 and sign < 0:
+                raise ValueError(f"Cannot remove edge {u!r} - {v!r}: it is not in the graph")
+            if old == 0:
+                self._insert_edge(u, v)
+            elif old + sign == 0:
+                self._delete_edge(u, v)
+            else:
+                self.adj[u][v] = self.adj[v][u] = old + sign
+        if sign < 0:
+            for node in members:
+                self._release_node(node)
+
+    def _add_node(self, node: Hashable) -> None:
+        n = self.counts.get(node, 0)
+        self.counts[node] = n + 1
+        if n:
+            return
+        self.adj[node] = {}
+        self.triangles[node] = 0
+        self.degree_histogram[0] += 1
+        self._label[node] = label = self._next_label
+        self._members[label] = {node}
+        self._next_label += 1
+
+    def _release_node(self, node: Hashable) -> None:
+        n = self.counts[node] - 1
+        if n:
+            self.counts[node] = n
+            return
+        # A node's last group is gone, and with it every edge it had.
+        del self.counts[node], self.adj[node], self.triangles[node]
+        self._bucket(0, -1)
+        label = self._label.pop(node)
+        del self._members[label]
+
+    def _bucket(self, degree: int, delta: int) -> None:
+        n = self.degree_histogram[degree] + delta
+        if n:
+            self.degree_histogram[degree] = n
+        else:
+            del self.degree_histogram[degree]
+
+    def _move_degree(self, node: Hashable, delta: int) -> None:
+        d = len(self.adj[node])
+        self._bucket(d - delta, -1)
+        self._bucket(d, 1)
+
+    def _common(self, u: Hashable, v: Hashable) -> List[Hashable]:
+        small, large = (self.adj[u], self.adj[v]) if len(self.adj[u]) <= len(self.adj[v]) else (self.adj[v], self.adj[u])
+        return [w for w in small if w in large and w != u and w != v]
+
+    def _insert_edge(self, u: Hashable, v: Hashable) -> None:
+        common = self._common(u, v)
+        self.adj[u][v] = self.adj[v][u] = 1
+        self._move_degree(u, 1)
+        self._move_degree(v, 1)
+        self._count_triangles(u, v, common, 1)
+        lu, lv = self._label[u], self._label[v]
+        if lu != lv:
+            if len(self._members[lu]) < len(self._members[lv]):
+                lu, lv = lv, lu
+            moved = self._members.pop(lv)
+            for node in moved:
+                self._label[node] = lu
+            self._members[lu] |= moved
+
+    def _delete_edge(self, u: Hashable, v: Hashable) -> None:
+        del self.adj[u][v], self.adj[v][u]
+        self._move_degree(u, -1)
+        self._move_degree(v, -1)
+        self._count_triangles(u, v, self._common(u, v), -1)
+        split = self._split_side(u, v)
+        if split is not None:
+            old = self._label[u]
+            self._members[old] -= split
+            label = self._next_label
+            self._next_label += 1
+            self._members[label] = split
+            for node in split:
+                self._label[node] = label
+
+    def _count_triangles(self, u: Hashable, v: Hashable, common: List[Hashable], sign: int) -> None:
+        if not common:
+            return
+        self.triangles[u] += sign * len(common)
+        self.triangles[v] += sign * len(common)
+        for w in common:
+            self.triangles[w] += sign
+        self.triangle_count += sign * len(common)
+
+    def _split_side(self, u: Hashable, v: Hashable) -> Optional[Set[Hashable]]:
+        """Nodes cut off from the rest of ``u``'s old component, or ``None`` if ``u`` still reaches ``v``.
+
+        Both searches advance one node at a time, so the work is bounded by
+        twice the size of the smaller side when the edge was a bridge.
+        """
+        seen = ({u}, {v})
+        queues = (deque([u]), deque([v]))
+        while True:
+            for side in (0, 1):
+                queue = queues[side]
+                if not queue:
+                    return seen[side]
+                node = queue.popleft()
+                other = seen[1 - side]
+                for nbr in self.adj[node]:
+                    if nbr in other:
+                        return None
+                    if nbr not in seen[side]:
+                        seen[side].add(nbr)
+                        queue.append(nbr)
+
+    # -- queries --
+
+    def __len__(self) -> int:
+        return len(self.adj)
+
+    def __contains__(self, node: Hashable) -> bool:
+        return node in self.adj
+
+    @property
+    def edge_count(self) -> int:
+        return sum(d * n for d, n in self.degree_histogram.items()) // 2
+
+    def degree(self, node: Hashable) -> int:
+        return len(self.adj[node])
+
+    def degree_distribution(self) -> List[Tuple[int, int]]:
+        """(degree, number of nodes) pairs in ascending degree, as in the degree tables."""
+        return sorted(self.degree_histogram.items())
+
+    @property
+    def component_count(self) -> int:
+        return len(self._members)
+
+    def component_sizes(self) -> List[int]:
+        return sorted((len(members) for members in self._members.values()), reverse=True)
+
+    def component(self, node: Hashable) -> Set[Hashable]:
+        return set(self._members[self._label[node]])
+
+    def connected(self, a: Hashable, b: Hashable) -> bool:
+        return a in self._label and b in self._label and self._label[a] == self._label[b]
+
+    def clustering(self, node: Hashable) -> float:
+        """Local (unweighted) clustering coefficient, as ``nx.clustering(G, node)``."""
+        d = len(self.adj[node])
+        return 2 * self.triangles[node] / (d * (d - 1)) if d > 1 else 0.0
+
+    def average_clustering(self) -> float:
+        return sum(self.clustering(node) for node in self.adj) / len(self.adj) if self.adj else 0.0
+
+    def to_networkx(self) -> nx.Graph:
+        G = nx.Graph()
+        G.add_nodes_from(self.adj)
+        done: Set[Hashable] = set()
+        for u, nbrs in self.adj.items():
+            G.add_weighted_edges_from((u, v, w) for v, w in nbrs.items() if v not in done)
+            done.add(u)
+        return G
+
+    @classmethod
+    def from_counts(cls, nodes: Dict[Hashable, int], pairs: Dict[Tuple[Hashable, Hashable], int]) -> "DynamicGraph":
+        """Rebuild from the node and pair counts ``AnalysisState`` keeps."""
+        graph = cls()
+        for node, n in nodes.items():
+            graph._add_node(node)
+            graph.counts[node] = n
+        for (u, v), w in pairs.items():
+            graph._insert_edge(u, v)
+            graph.adj[u][v] = graph.adj[v][u] = w
+        return graph
+
+
+class DynamicMeetingGraphs:
+    """Co-attendance and field graphs updated one meeting record at a time."""
+
+    def __init__(self) -> None:
+        self.attendance = DynamicGraph()
+        self.fields = DynamicGraph()
+
+    def _apply(self, record: Any, sign: int) -> None:
+        meeting_info = (record.get("meetingInfo", {}) or {}) if isinstance(record, dict) else {}
+        participants = normalize_participants(meeting_info)
+        key_sets = [list(keys) for keys in iter_field_combinations(record)]
+        if sign > 0:
+            self.attendance.add_clique(participants)
+            for keys in key_sets:
+                self.fields.add_clique(keys)
+        else:
+            self.attendance.remove_clique(participants)
+            for keys in key_sets:
+                self.fields.remove_clique(keys)
+
+    def add_meeting(self, record: Any) -> None:
+        self._apply(record, 1)
+
+    def remove_meeting(self, record: Any) -> None:
+        """Retract a record exactly as it was added (the old version of a corrected meeting)."""
+        self._apply(record, -1)
+
+    def replace_meeting(self, old: Any, new: Any) -> None:
+        self.remove_meeting(old)
+        self.add_meeting(new)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Any]) -> "DynamicMeetingGraphs":
+        graphs = cls()
+        for record in records:
+            graphs.add_meeting(record)
+        return graphs
+
+    @classmethod
+    def from_state(cls, state: Any) -> "DynamicMeetingGraphs":
+        """Start from the counts of an ``AnalysisState`` (``--state-dir``) instead of replaying every record."""
+        graphs = cls()
+        graphs.attendance = DynamicGraph.from_counts(state.attend_nodes, state.attend_pairs)
+        graphs.fields = DynamicGraph.from_counts(state.field_nodes, state.field_pairs)
+        return graphs
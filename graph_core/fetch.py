@@ -0,0 +1,297 @@
+"""
+On-disk HTTP cache with conditional GET for the meeting-summary JSON sources.
+
+Every URL is stored under the cache directory as two files keyed by the SHA-256
+of the URL: ``<key>.body`` holds the raw response bytes and ``<key>.meta.json``
+holds the ETag, Last-Modified and size. The next request for the same URL sends
+``If-None-Match`` / ``If-Modified-Since`` and a ``304 Not Modified`` is served
+straight from disk.
+
+Environment variables (command-line flags, where a script has them, win):
+- ``GRAPH_CACHE_DIR``: cache location (default: ``<repo>/.cache/http``)
+- ``GRAPH_OFFLINE=1``: never touch the network; fail fast on a cache miss
+- ``GRAPH_NO_CACHE=1``: bypass the cache and always download
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import requests
+
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "http"
+)
+DEFAULT_TIMEOUT = 60
+CHUNK_SIZE = 1 << 16
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, int] = {
+    "hits": 0,
+    "misses": 0,
+    "offline_hits": 0,
+    "bytes_downloaded": 0,
+    "bytes_saved": 0,
+}
+
+
+class CacheMissError(RuntimeError):
+    """Raised in offline mode when a URL has no cached copy."""
+
+
+def is_url(source: str) -> bool:
+    return source.startswith("http://") or source.startswith("https://")
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def resolve_cache_dir(cache_dir: Optional[str] = None) -> str:
+    return cache_dir or os.environ.get("GRAPH_CACHE_DIR") or DEFAULT_CACHE_DIR
+
+
+def is_offline(offline: Optional[bool] = None) -> bool:
+    return _env_flag("GRAPH_OFFLINE") if offline is None else offline
+
+
+def cache_enabled(use_cache: Optional[bool] = None) -> bool:
+    return (not _env_flag("GRAPH_NO_CACHE")) if use_cache is None else use_cache
+
+
+def _cache_paths(url: str, cache_dir: str) -> Dict[str, str]:
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return {
+        "body": os.path.join(cache_dir, f"{key}.body"),
+        "meta": os.path.join(cache_dir, f"{key}.meta.json"),
+    }
+
+
+def _read_meta(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _record(**deltas: int) -> None:
+    with _stats_lock:
+        for k, v in deltas.items():
+            _stats[k] += v
+
+
+def cache_stats() -> Dict[str, int]:
+    """Return a copy of this process's cache counters."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def record_download(size: int) -> None:
+    """Count a body of ``size`` bytes read straight from the network, bypassing the cache, as a miss."""
+    _record(misses=1, bytes_downloaded=size)
+
+
+def format_cache_stats(stats: Optional[Dict[str, int]] = None) -> Optional[str]:
+    """One-line summary of the counters, or ``None`` if no URL was requested."""
+    stats = stats or cache_stats()
+    if not (stats["hits"] or stats["misses"] or stats["offline_hits"]):
+        return None
+    line = f"{stats['hits']} hits / {stats['misses']} misses / {stats['bytes_saved']:,} bytes saved"
+    if stats["offline_hits"]:
+        line += f" ({stats['offline_hits']} served offline)"
+    return f"{line}, {stats['bytes_downloaded']:,} bytes downloaded"
+
+
+def print_cache_stats() -> None:
+    """Print this run's cache summary, if any URL was requested."""
+    line = format_cache_stats()
+    if line:
+        print(f"📦 HTTP cache: {line}")
+
+
+def _download(resp: requests.Response, body_path: str) -> int:
+    """Stream a response body to ``body_path`` atomically; return its size."""
+    tmp_path = f"{body_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    size = 0
+    try:
+        with open(tmp_path, "wb") as f:
+            for chunk in resp.iter_content(chunk_size=CHUNK_SIZE):
+                if chunk:
+                    f.write(chunk)
+                    size += len(chunk)
+        os.replace(tmp_path, body_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return size
+
+
+def fetch_entry(
+    url: str,
+    session: Optional[requests.Session] = None,
+    cache_dir: Optional[str] = None,
+    offline: Optional[bool] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    verbose: bool = True,
+) -> Dict[str, Any]:
+    """Make sure ``url`` is cached on disk and describe the cached body.
+
+    Returns ``{"path", "status", "size"}`` where status is ``"hit"`` (304),
+    ``"miss"`` (downloaded) or ``"offline"``. Sends a conditional GET when a
+    cached copy exists. In offline mode the cached copy is returned without any
+    request, and ``CacheMissError`` is raised immediately if there is none.
+    """
+    cache_dir = resolve_cache_dir(cache_dir)
+    paths = _cache_paths(url, cache_dir)
+    meta = _read_meta(paths["meta"]) if os.path.exists(paths["body"]) else None
+
+    if is_offline(offline):
+        if meta is None:
+            raise CacheMissError(f"Offline mode: no cached copy of {url} in {cache_dir}")
+        _record(offline_hits=1, bytes_saved=meta.get("size", 0))
+        if verbose:
+            print(f"📦 Offline: serving cached copy of {url} ({meta.get('size', 0):,} bytes)")
+        return {"path": paths["body"], "status": "offline", "size": meta.get("size", 0)}
+
+    headers: Dict[str, str] = {}
+    if meta is not None:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    getter = session.get if session is not None else requests.get
+    with getter(url, headers=headers, stream=True, timeout=timeout) as resp:
+        if resp.status_code == 304 and meta is not None:
+            _record(hits=1, bytes_saved=meta.get("size", 0))
+            if verbose:
+                print(f"📦 Cache hit (304 Not Modified): {url} — saved {meta.get('size', 0):,} bytes")
+            return {"path": paths["body"], "status": "hit", "size": meta.get("size", 0)}
+        resp.raise_for_status()
+        os.makedirs(cache_dir, exist_ok=True)
+        size = _download(resp, paths["body"])
+        new_meta = {
+            "url": url,
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "size": size,
+            "fetched_at": datetime.now().isoformat(timespec="seconds"),
+        }
+
+    with open(paths["meta"], "w", encoding="utf-8") as f:
+        json.dump(new_meta, f, indent=2)
+    _record(misses=1, bytes_downloaded=size)
+    if verbose:
+        print(f"🌐 Cache miss: downloaded {url} ({size:,} bytes)")
+    return {"path": paths["body"], "status": "miss", "size": size}
+
+
+def fetch_to_path(
+    url: str,
+    session: Optional[requests.Session] = None,
+    cache_dir: Optional[str] = None,
+    offline: Optional[bool] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    verbose: bool = True,
+) -> str:
+    """Make sure ``url`` is cached on disk and return the path of its body."""
+    entry = fetch_entry(url, session=session, cache_dir=cache_dir, offline=offline, timeout=timeout, verbose=verbose)
+    return entry["path"]
+
+
+def fetch_bytes(
+    url: str,
+    session: Optional[requests.Session] = None,
+    cache_dir: Optional[str] = None,
+    offline: Optional[bool] = None,
+    use_cache: Optional[bool] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> bytes:
+    """Return the body of ``url``, going through the on-disk cache unless disabled."""
+    if not cache_enabled(use_cache):
+        getter = session.get if session is not None else requests.get
+        resp = getter(url, timeout=timeout)
+        resp.raise_for_status()
+        record_download(len(resp.content))
+        return resp.content
+    path = fetch_to_path(url, session=session, cache_dir=cache_dir, offline=offline, timeout=timeout)
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def fetch_json(
+    url: str,
+    session: Optional[requests.Session] = None,
+    cache_dir: Optional[str] = None,
+    offline: Optional[bool] = None,
+    use_cache: Optional[bool] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Any:
+    """Fetch ``url`` through the cache and decode it as JSON."""
+    if not cache_enabled(use_cache):
+        return json.loads(fetch_bytes(url, session=session, use_cache=False, timeout=timeout))
+    path = fetch_to_path(url, session=session, cache_dir=cache_dir, offline=offline, timeout=timeout)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_json_remote(url: str) -> Any:
+    """Load JSON data from a remote URL (cached; honours GRAPH_* env settings)."""
+    return fetch_json(url)
+
+
+def describe_cache(cache_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Summarize the cached entries on disk."""
+    cache_dir = resolve_cache_dir(cache_dir)
+    entries = []
+    if os.path.isdir(cache_dir):
+        for name in sorted(os.listdir(cache_dir)):
+            if name.endswith(".meta.json"):
+                meta = _read_meta(os.path.join(cache_dir, name))
+                if meta:
+                    entries.append(meta)
+    return {
+        "cache_dir": cache_dir,
+        "entries": entries,
+        "total_bytes": sum(e.get("size", 0) for e in entries),
+    }
+
+
+def clear_cache(cache_dir: Optional[str] = None) -> int:
+    """Delete every cached body and metadata file; return the number removed."""
+    cache_dir = resolve_cache_dir(cache_dir)
+    removed = 0
+    if os.path.isdir(cache_dir):
+        for name in os.listdir(cache_dir):
+            if name.endswith(".body") or name.endswith(".meta.json"):
+                os.remove(os.path.join(cache_dir, name))
+                removed += 1
+    return removed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Inspect or clear the HTTP cache")
+    parser.add_argument("--cache-dir", default=None, help="Cache directory (default: GRAPH_CACHE_DIR or .cache/http)")
+    parser.add_argument("--clear", action="store_true", help="Remove all cached responses")
+    args = parser.parse_args()
+
+    if args.clear:
+        removed = clear_cache(args.cache_dir)
+        print(f"🧹 Removed {removed} cache files from {resolve_cache_dir(args.cache_dir)}")
+        return
+
+    info = describe_cache(args.cache_dir)
+    print(f"Cache directory: {info['cache_dir']}")
+    print(f"Entries: {len(info['entries'])} ({info['total_bytes']:,} bytes)")
+    for e in info["entries"]:
+        print(f"- {e.get('url')} | {e.get('size', 0):,} bytes | ETag {e.get('etag')} | fetched {e.get('fetched_at')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Graph builders shared by the analysis scripts.
+
+Every per-metric script used to carry its own copy of ``build_field_graph``;
+they now import it from here, together with the co-attendance helpers of
+``unified_analysis.py``. ``build_graphs`` builds several graph kinds in one
+``visit_records`` pass, for runners that report on more than one of them:
+
+- ``"fields"``: field co-occurrence graph (keys of the same object, weighted),
+- ``"attendance"``: co-attendance graph of meeting participants (weighted),
+  built as ``BᵀB`` of the meetings x people incidence matrix
+  (see ``graph_core/incidence.py``),
+- ``"paths"``: ``PathTrie`` of JSON paths (see ``graph_core/path_trie.py``),
+- ``"components"``: ``DisjointSet`` of field keys, the connected components of
+  the field graph, unioned key set by key set while records are visited
+  (see ``graph_core/components.py``),
+- ``"timeline"``: ``TimelineCollector`` of meeting days and participants, for
+  the sliding-window series of ``graph_core/temporal.py``.
+"""
+
+from itertools import combinations
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import networkx as nx
+
+from graph_core.components import DisjointSet
+from graph_core.incidence import CoAttendanceMatrix
+from graph_core.path_trie import PathTrie, PathTrieCollector
+from graph_core.temporal import TimelineCollector
+from graph_core.visitor import FieldSetCollector, ParticipantCollector, iter_field_combinations, visit_records
+
+GRAPH_KINDS = ("fields", "attendance", "paths", "components", "timeline")
+
+
+def add_participant_clique(G: nx.Graph, participants: List[str]) -> None:
+    """Connect every pair of a meeting's participants, counting repeat meetings in ``weight``."""
+    if len(participants) < 2:
+        return
+    for p in participants:
+        G.add_node(p)
+    for u, v in combinations(participants, 2):
+        if G.has_edge(u, v):
+            G[u][v]["weight"] += 1
+        else:
+            G.add_edge(u, v, weight=1)
+
+
+def add_field_sets(G: nx.Graph, field_sets: Iterable[Sequence[str]]) -> None:
+    """Connect every pair of keys of the same object, counting repeats in ``weight``."""
+    for s in field_sets:
+        for k in s:
+            G.add_node(k)
+        for u, v in combinations(s, 2):
+            if G.has_edge(u, v):
+                G[u][v]["weight"] += 1
+            else:
+                G.add_edge(u, v, weight=1)
+
+
+class FieldPairCounts:
+    """Field co-occurrence counts aggregated without NetworkX.
+
+    The same key sets recur in every meeting, so ``add`` only counts each
+    distinct set; pairs are expanded once per distinct set into a flat dict
+    keyed by ``(a << 32) | b`` for interned key IDs ``a < b``. Keys are
+    interned and sets expanded in first-seen order, which makes
+    ``to_networkx`` list nodes and edges exactly as ``add_field_sets`` would.
+    """
+
+    def __init__(self) -> None:
+        # Distinct key set -> [occurrences, keys in first-seen iteration order].
+        self._sets: Dict[frozenset, List[Any]] = {}
+        self._keys: List[str] = []
+        self._pairs: Dict[int, int] = {}
+        self._pending = False
+
+    def add(self, keys: Iterable[str], times: int = 1) -> None:
+        """Count ``times`` objects holding exactly ``keys``."""
+        key_set = frozenset(keys)
+        entry = self._sets.get(key_set)
+        if entry is None:
+            self._sets[key_set] = [times, tuple(keys)]
+        else:
+            entry[0] += times
+        self._pending = True
+
+    def add_sets(self, field_sets: Iterable[Sequence[str]]) -> None:
+        for keys in field_sets:
+            self.add(keys)
+
+    def _expand(self) -> None:
+        if not self._pending:
+            return
+        key_ids: Dict[str, int] = {k: i for i, k in enumerate(self._keys)}
+        keys = self._keys
+        pairs = self._pairs
+        for entry in self._sets.values():
+            times, ordered = entry
+            if not times:
+                continue
+            entry[0] = 0
+            ids = []
+            for k in ordered:
+                i = key_ids.get(k)
+                if i is None:
+                    i = key_ids[k] = len(keys)
+                    keys.append(k)
+                ids.append(i)
+            for a, b in combinations(ids, 2):
+                pair = (a << 32) | b if a < b else (b << 32) | a
+                pairs[pair] = pairs.get(pair, 0) + times
+        self._pending = False
+
+    @property
+    def keys(self) -> List[str]:
+        """Interned keys; a key's position is its ID."""
+        self._expand()
+        return self._keys
+
+    @property
+    def pairs(self) -> Dict[int, int]:
+        """Packed ``(a << 32) | b`` key-ID pair -> number of objects holding both keys."""
+        self._expand()
+        return self._pairs
+
+    def iter_edges(self) -> Iterator[Tuple[str, str, int]]:
+        keys = self.keys
+        for pair, weight in self.pairs.items():
+            yield keys[pair >> 32], keys[pair & 0xFFFFFFFF], weight
+
+    def degree(self) -> Dict[str, int]:
+        """Distinct co-occurring keys per key, as ``dict(G.degree())``."""
+        counts = [0] * len(self.keys)
+        for pair in self.pairs:
+            counts[pair >> 32] += 1
+            counts[pair & 0xFFFFFFFF] += 1
+        return dict(zip(self._keys, counts))
+
+    def to_networkx(self) -> nx.Graph:
+        """Weighted field graph built with one ``add_weighted_edges_from`` call."""
+        G = nx.Graph()
+        G.add_nodes_from(self.keys)
+        G.add_weighted_edges_from(self.iter_edges())
+        return G
+
+
+def build_field_graph(data: Any) -> nx.Graph:
+    """Build the field co-occurrence graph from a parsed document or an iterator of records."""
+    counts = FieldPairCounts()
+    for obj in ([data] if isinstance(data, (dict, list)) else data):
+        counts.add_sets(iter_field_combinations(obj))
+    return counts.to_networkx()
+
+
+def build_graphs(records: Iterable[Any], kinds: Sequence[str], is_array: bool = True, path_mode: str = "instance") -> Dict[str, Any]:
+    """Build each graph kind in ``kinds`` from one traversal of ``records``."""
+    unknown = set(kinds) - set(GRAPH_KINDS)
+    if unknown:
+        raise ValueError(f"Unknown graph kind(s): {', '.join(sorted(unknown))}")
+    graphs: Dict[str, Any] = {}
+    collectors = []
+    fields = None
+    if "fields" in kinds:
+        fields = FieldPairCounts()
+        collectors.append(FieldSetCollector(fields.add))
+    if "components" in kinds:
+        components = graphs["components"] = DisjointSet()
+        collectors.append(FieldSetCollector(components.union_all))
+    attendance = None
+    if "attendance" in kinds:
+        attendance = ParticipantCollector()
+        collectors.append(attendance)
+    if "paths" in kinds:
+        trie = graphs["paths"] = PathTrie(template=path_mode == "template")
+        collectors.append(PathTrieCollector(trie))
+    if "timeline" in kinds:
+        collectors.append(graphs.setdefault("timeline", TimelineCollector()))
+    visit_records(records, collectors, is_array=is_array)
+    if fields is not None:
+        graphs["fields"] = fields.to_networkx()
+    if attendance is not None:
+        graphs["attendance"] = CoAttendanceMatrix.from_participants(attendance.participants).to_networkx()
+    return graphs
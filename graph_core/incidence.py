@@ -0,0 +1,121 @@
+"""
+Co-attendance counts from a sparse meetings x people incidence matrix.
+
+``add_participant_clique`` costs O(k²) dict operations per meeting with k
+participants (``has_edge`` plus a weight update for every pair).
+``CoAttendanceMatrix`` instead encodes the meetings as a 0/1 CSR matrix ``B``
+(one row per meeting, one column per person) and gets every pair count at once
+from the sparse product ``A = BᵀB``: ``A[i, j]`` is the number of meetings
+person i and person j attended together, and the diagonal is each person's
+meeting count. Degrees and weighted degrees are row reductions of ``A``;
+the NetworkX graph is only materialized when a caller asks for it.
+
+As in ``add_participant_clique``, meetings with fewer than two participants
+are ignored and people are numbered in order of first appearance, so the
+graph has the same nodes, edges and weights as the loop builds.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import networkx as nx
+import numpy as np
+from scipy import sparse
+
+
+class CoAttendanceMatrix:
+    """Incidence matrix of meetings x people and the co-attendance matrix ``BᵀB``."""
+
+    def __init__(self, people: List[str], incidence: sparse.csr_matrix) -> None:
+        self.people = people
+        self.incidence = incidence
+        self._adjacency: Optional[sparse.csr_matrix] = None
+
+    @classmethod
+    def from_participants(cls, meetings: Iterable[Sequence[str]]) -> "CoAttendanceMatrix":
+        """Build ``B`` from one participant list per meeting (names already deduplicated)."""
+        index: Dict[str, int] = {}
+        indptr = array("q", [0])
+        indices = array("i")
+        for participants in meetings:
+            if len(participants) < 2:
+                continue
+            for p in participants:
+                j = index.get(p)
+                if j is None:
+                    j = index[p] = len(index)
+                indices.append(j)
+            indptr.append(len(indices))
+        B = cls._csr(np.frombuffer(indptr, dtype=np.int64), np.frombuffer(indices, dtype=np.int32), len(index))
+        return cls(list(index), B)
+
+    @classmethod
+    def from_snapshot(cls, snap: Any) -> "CoAttendanceMatrix":
+        """Build ``B`` straight from a snapshot's participant offsets and string IDs, without decoding names per meeting."""
+        offsets, ids = snap.participant_arrays()
+        offsets = np.asarray(offsets, dtype=np.int64)
+        ids = np.asarray(ids)
+        lengths = np.diff(offsets)
+        keep = lengths >= 2
+        ids = ids[np.repeat(keep, lengths)]
+        indptr = np.concatenate(([0], np.cumsum(lengths[keep])))
+        # Number people by first appearance, like the name-keyed builder.
+        unique, first, inverse = np.unique(ids, return_index=True, return_inverse=True)
+        order = np.argsort(first, kind="stable")
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        people = snap.strings(int(sid) for sid in unique[order])
+        return cls(people, cls._csr(indptr, rank[inverse].astype(np.int32), len(people)))
+
+    @staticmethod
+    def _csr(indptr: np.ndarray, indices: np.ndarray, people: int) -> sparse.csr_matrix:
+        data = np.ones(len(indices), dtype=np.int32)
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(indptr) - 1, people))
+
+    # -- matrices --
+
+    @property
+    def adjacency(self) -> sparse.csr_matrix:
+        """``BᵀB`` with the diagonal removed: shared-meeting counts per pair of people."""
+        if self._adjacency is None:
+            A = (self.incidence.T @ self.incidence).tocsr()
+            A = (A - sparse.diags(A.diagonal(), dtype=A.dtype)).tocsr()
+            A.eliminate_zeros()
+            A.sort_indices()
+            self._adjacency = A
+        return self._adjacency
+
+    def __len__(self) -> int:
+        return len(self.people)
+
+    def degree(self) -> Dict[str, int]:
+        """Number of distinct co-attendees per person, as ``dict(G.degree())``."""
+        counts = np.diff(self.adjacency.indptr)
+        return dict(zip(self.people, counts.tolist()))
+
+    def weighted_degree(self) -> Dict[str, int]:
+        """Sum of shared-meeting counts per person, as ``dict(G.degree(weight="weight"))``."""
+        sums = np.asarray(self.adjacency.sum(axis=1)).ravel()
+        return dict(zip(self.people, sums.tolist()))
+
+    def meetings(self) -> Dict[str, int]:
+        """Meetings attended per person (the diagonal of ``BᵀB``, i.e. the column sums of ``B``)."""
+        counts = np.asarray(self.incidence.sum(axis=0)).ravel()
+        return dict(zip(self.people, counts.tolist()))
+
+    def edge_count(self) -> int:
+        return self.adjacency.nnz // 2
+
+    def iter_edges(self) -> Iterator[Tuple[str, str, int]]:
+        """``(u, v, weight)`` for every co-attending pair, each pair once."""
+        upper = sparse.triu(self.adjacency, k=1, format="coo")
+        people = self.people
+        for i, j, w in zip(upper.row.tolist(), upper.col.tolist(), upper.data.tolist()):
+            yield people[i], people[j], w
+
+    def to_networkx(self) -> nx.Graph:
+        """Weighted co-attendance graph, equal to the ``add_participant_clique`` build."""
+        G = nx.Graph()
+        G.add_nodes_from(self.people)
+        G.add_weighted_edges_from(self.iter_edges())
+        return G
@@ -0,0 +1,311 @@
+"""
+Incremental re-analysis keyed by per-record content hashes.
+
+A full run rebuilds every graph from every meeting, although between two runs
+only a handful of meetings are usually added or edited. ``AnalysisState``
+persists what the unified analysis aggregates, in a state directory
+(``--state-dir`` or ``GRAPH_STATE_DIR``):
+
+- ``state.json``: the SHA-256 of every record in input order, co-attendance
+  node and pair counts, field node and pair counts, template path counts,
+  list-length histograms and the union-find of field components,
+- ``records/<hash>.json``: what each distinct record contributed to those
+  counts (participants, key sets, template paths), so it can be retracted
+  without its original JSON.
+
+``update`` hashes the incoming records and diffs them against the stored
+hashes as a multiset: new hashes are added, hashes that disappeared are
+retracted, and an edited meeting is both (its old version retracted, its new
+version added). Graph work is therefore proportional to the number of changed
+meetings; unchanged ones are only hashed. Field components grow with added
+meetings; a union-find cannot split, so after a removal they are rebuilt from
+the stored pair counts.
+
+Paths are kept in ``--path-mode template`` form: instance paths carry the
+record's array index, which shifts for every later record whenever a meeting
+is inserted or removed.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from collections import Counter
+from itertools import combinations
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import networkx as nx
+
+from graph_core.components import DisjointSet
+from graph_core.path_trie import PathTrie
+from graph_core.snapshot import normalize_participants
+from graph_core.visitor import iter_field_combinations
+
+DEFAULT_STATE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "state"
+)
+STATE_VERSION = 1
+
+Segments = Tuple[Any, ...]
+
+
+def resolve_state_dir(state_dir: Optional[str] = None) -> str:
+    return state_dir or os.environ.get("GRAPH_STATE_DIR") or DEFAULT_STATE_DIR
+
+
+def record_hash(record: Any) -> str:
+    """SHA-256 of the record's canonical JSON (sorted keys), so key order does not matter."""
+    blob = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _template_paths(record: Any, is_array: bool) -> Tuple[Dict[Segments, int], Dict[Segments, Counter]]:
+    """Template path counts and list-length histograms of one record, in ``PathTrie.add`` order."""
+    paths: Dict[Segments, int] = {}
+    lists: Dict[Segments, Counter] = {}
+    top: Segments = ()
+    if is_array:
+        top = (None,)
+        paths[top] = 1
+        if isinstance(record, list):
+            lists.setdefault(top, Counter())[len(record)] += 1
+    stack: List[Tuple[Iterator, Segments]] = []
+    if isinstance(record, dict):
+        stack.append((iter(record.items()), top))
+    elif isinstance(record, list):
+        stack.append((enumerate(record), top))
+    while stack:
+        children, parent = stack[-1]
+        for key, value in children:
+            path = parent + (None if isinstance(key, int) else key,)
+            paths[path] = paths.get(path, 0) + 1
+            if isinstance(value, dict) and value:
+                stack.append((iter(value.items()), path))
+                break
+            if isinstance(value, list):
+                lists.setdefault(path, Counter())[len(value)] += 1
+                if value:
+                    stack.append((enumerate(value), path))
+                    break
+        else:
+            stack.pop()
+    return paths, lists
+
+
+def record_contribution(record: Any, is_array: bool) -> Dict[str, Any]:
+    """Everything one record adds to the aggregated state, in JSON-ready form."""
+    meeting_info = (record.get("meetingInfo", {}) or {}) if isinstance(record, dict) else {}
+    paths, lists = _template_paths(record, is_array)
+    return {
+        "participants": normalize_participants(meeting_info),
+        "field_sets": [list(keys) for keys in iter_field_combinations(record)],
+        "paths": [[list(seg), n] for seg, n in paths.items()],
+        "lists": [[list(seg), sorted(hist.items())] for seg, hist in lists.items()],
+    }
+
+
+def _bump(counts: Dict[Any, int], key: Any, delta: int) -> None:
+    n = counts.get(key, 0) + delta
+    if n:
+        counts[key] = n
+    else:
+        del counts[key]
+
+
+class AnalysisState:
+    """Aggregated co-attendance, field and path counts, updated by content-hash deltas."""
+
+    def __init__(self, state_dir: Optional[str] = None) -> None:
+        self.state_dir = resolve_state_dir(state_dir)
+        self.records_dir = os.path.join(self.state_dir, "records")
+        self.state_path = os.path.join(self.state_dir, "state.json")
+        self._reset()
+        self._load()
+
+    def _reset(self) -> None:
+        self.is_array: Optional[bool] = None
+        self.hashes: List[str] = []
+        # Dicts keep first-seen order, so graphs rebuilt from a state that was
+        # filled in one pass list nodes and edges like a direct build.
+        self.attend_nodes: Dict[str, int] = {}
+        self.attend_pairs: Dict[Tuple[str, str], int] = {}
+        self.field_nodes: Dict[str, int] = {}
+        self.field_pairs: Dict[Tuple[str, str], int] = {}
+        self.paths: Dict[Segments, int] = {}
+        self.lists: Dict[Segments, Dict[int, int]] = {}
+        self.field_components = DisjointSet()
+
+    def _load(self) -> None:
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != STATE_VERSION:
+            return
+        self.is_array = data["is_array"]
+        self.hashes = data["hashes"]
+        self.attend_nodes = dict(data["attend_nodes"])
+        self.attend_pairs = {(u, v): w for u, v, w in data["attend_pairs"]}
+        self.field_nodes = dict(data["field_nodes"])
+        self.field_pairs = {(u, v): w for u, v, w in data["field_pairs"]}
+        self.paths = {tuple(seg): n for seg, n in data["paths"]}
+        self.lists = {tuple(seg): {length: n for length, n in hist} for seg, hist in data["lists"]}
+        if "field_components" in data:
+            self.field_components = DisjointSet.from_state(data["field_components"])
+        else:
+            self._rebuild_components()
+
+    def save(self) -> None:
+        os.makedirs(self.state_dir, exist_ok=True)
+        data = {
+            "version": STATE_VERSION,
+            "is_array": self.is_array,
+            "hashes": self.hashes,
+            "attend_nodes": list(self.attend_nodes.items()),
+            "attend_pairs": [[u, v, w] for (u, v), w in self.attend_pairs.items()],
+            "field_nodes": list(self.field_nodes.items()),
+            "field_pairs": [[u, v, w] for (u, v), w in self.field_pairs.items()],
+            "paths": [[list(seg), n] for seg, n in self.paths.items()],
+            "lists": [[list(seg), sorted(hist.items())] for seg, hist in self.lists.items()],
+            "field_components": self.field_components.to_state(),
+        }
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, self.state_path)
+
+    def clear(self) -> None:
+        """Forget every stored record; the next ``update`` rebuilds from scratch."""
+        if os.path.isdir(self.records_dir):
+            shutil.rmtree(self.records_dir)
+        if os.path.exists(self.state_path):
+            os.remove(self.state_path)
+        self._reset()
+
+    # -- applying contributions --
+
+    def _record_path(self, digest: str) -> str:
+        return os.path.join(self.records_dir, f"{digest}.json")
+
+    def _apply(self, contribution: Dict[str, Any], sign: int) -> None:
+        participants = contribution["participants"]
+        if len(participants) >= 2:
+            for p in participants:
+                _bump(self.attend_nodes, p, sign)
+            for u, v in combinations(participants, 2):
+                _bump(self.attend_pairs, (u, v) if u < v else (v, u), sign)
+        for keys in contribution["field_sets"]:
+            for k in keys:
+                _bump(self.field_nodes, k, sign)
+            for u, v in combinations(keys, 2):
+                _bump(self.field_pairs, (u, v) if u < v else (v, u), sign)
+        for seg, n in contribution["paths"]:
+            _bump(self.paths, tuple(seg), sign * n)
+        for seg, hist in contribution["lists"]:
+            seg = tuple(seg)
+            lengths = self.lists.setdefault(seg, {})
+            for length, n in hist:
+                _bump(lengths, length, sign * n)
+            if not lengths:
+                del self.lists[seg]
+
+    def update(self, records: Iterable[Any], is_array: bool) -> Dict[str, int]:
+        """Bring the state in line with ``records``; return record counts for the delta.
+
+        Records are streamed once: each is hashed, and only those whose hash
+        is not already stored are walked. Stored hashes left over at the end
+        belong to removed or edited meetings and are retracted from their
+        saved contributions.
+        """
+        if self.is_array is not None and self.is_array != is_array:
+            # Top-level shape changed, so every template path changes too.
+            self.clear()
+        stored = Counter(self.hashes)
+        known = set(stored)
+        hashes: List[str] = []
+        added: List[Tuple[str, Dict[str, Any]]] = []
+        for record in records:
+            digest = record_hash(record)
+            hashes.append(digest)
+            if stored[digest] > 0:
+                stored[digest] -= 1
+            else:
+                added.append((digest, record_contribution(record, is_array)))
+
+        removed = [(digest, n) for digest, n in stored.items() if n > 0]
+        for digest, n in removed:
+            try:
+                with open(self._record_path(digest), "r", encoding="utf-8") as f:
+                    contribution = json.load(f)
+            except (OSError, ValueError) as exc:
+                raise RuntimeError(
+                    f"State in {self.state_dir} has no contribution for record {digest}; "
+                    "rerun with --reset-state"
+                ) from exc
+            for _ in range(n):
+                self._apply(contribution, -1)
+        for _, contribution in added:
+            self._apply(contribution, 1)
+        if removed:
+            self._rebuild_components()
+        else:
+            for _, contribution in added:
+                for keys in contribution["field_sets"]:
+                    self.field_components.union_all(keys)
+
+        os.makedirs(self.records_dir, exist_ok=True)
+        current = set(hashes)
+        for digest, contribution in added:
+            if digest not in known:
+                known.add(digest)
+                with open(self._record_path(digest), "w", encoding="utf-8") as f:
+                    json.dump(contribution, f, ensure_ascii=False, separators=(",", ":"))
+        for digest, _ in removed:
+            if digest not in current and os.path.exists(self._record_path(digest)):
+                os.remove(self._record_path(digest))
+
+        self.is_array = is_array
+        self.hashes = hashes
+        return {
+            "records": len(hashes),
+            "added": len(added),
+            "removed": sum(n for _, n in removed),
+            "unchanged": len(hashes) - len(added),
+        }
+
+    def _rebuild_components(self) -> None:
+        components = DisjointSet()
+        for key in self.field_nodes:
+            components.add(key)
+        for u, v in self.field_pairs:
+            components.union(u, v)
+        self.field_components = components
+
+    # -- graphs --
+
+    @staticmethod
+    def _weighted_graph(nodes: Dict[str, int], pairs: Dict[Tuple[str, str], int]) -> nx.Graph:
+        G = nx.Graph()
+        G.add_nodes_from(nodes)
+        G.add_weighted_edges_from((u, v, w) for (u, v), w in pairs.items())
+        return G
+
+    def attendance_graph(self) -> nx.Graph:
+        """Co-attendance graph, as ``add_participant_clique`` over every record."""
+        return self._weighted_graph(self.attend_nodes, self.attend_pairs)
+
+    def field_graph(self) -> nx.Graph:
+        """Field co-occurrence graph, as ``add_field_sets`` over every record."""
+        return self._weighted_graph(self.field_nodes, self.field_pairs)
+
+    def path_trie(self) -> PathTrie:
+        """Template-mode ``PathTrie`` holding the stored path counts and list lengths."""
+        trie = PathTrie(template=True)
+        for seg, n in self.paths.items():
+            trie.add_path(seg, n)
+        for seg, hist in self.lists.items():
+            node = trie.add_path(seg, 0)
+            for length, n in sorted(hist.items()):
+                trie.note_list(node, length, n)
+        return trie
@@ -0,0 +1,193 @@
+"""
+Seeded force-directed layout of the co-attendance graph, computed offline.
+
+The dashboard used to let vis-network run its physics until the network
+stabilised, in the browser, on every page load. ``force_layout`` computes the
+coordinates once while the report is generated; they travel in the graph
+asset (see ``graph_core/assets.py``) and the page draws them with physics off.
+
+The layout is Fruchterman-Reingold in pixel units: every edge pulls its ends
+together with force d²/k (times ``1 + log(weight)``), every pair of nodes
+pushes apart with k²/d, a weak gravity keeps separate components close, and
+the step size cools linearly. Forces are numpy array operations:
+
+- attraction: one pass over the edge arrays,
+- repulsion: exact, over blocks of rows, up to ``EXACT_LIMIT`` nodes; above
+  that, Barnes-Hut style on a quadtree of grid levels. Nodes in the same or a
+  neighbouring finest cell repel exactly; every other node is counted once,
+  through the coarsest cell that holds it and is not adjacent to the node's own
+  cell at that level (cells of the parent's neighbourhood), as the cell's node
+  count at its centroid. Each node thus sees its neighbourhood plus at most 27
+  cells per level.
+
+Random starting positions come from ``seed``, so the same graph gets the same
+layout. With ``previous`` positions (the last run's asset), nodes seen before
+keep their coordinates and only new nodes are placed, starting next to their
+known neighbours, so the picture stays familiar from one run to the next.
+"""
+
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import networkx as nx
+import numpy as np
+
+SPACING = 120.0  # ideal edge length (k) in pixels
+DEFAULT_ITERATIONS = 150
+EXACT_LIMIT = 500
+GRAVITY = 0.1
+_LEAF_SIZE = 4  # nodes per finest grid cell the quadtree aims for
+_MAX_DEPTH = 10  # finest grid: 1024 x 1024 cells
+_BLOCK = 1 << 21  # pair distances held at once by the exact repulsion
+_MIN_R2 = 1e-2  # squared distance floor for nodes on top of each other
+
+Positions = Dict[Hashable, Tuple[float, float]]
+
+
+def _exact_repulsion(X: np.ndarray, k2: float) -> np.ndarray:
+    n = len(X)
+    F = np.zeros_like(X)
+    rows = max(1, _BLOCK // n)
+    for start in range(0, n, rows):
+        stop = min(start + rows, n)
+        d = X[start:stop, None, :] - X[None, :, :]
+        r2 = np.einsum("ijk,ijk->ij", d, d)
+        np.maximum(r2, _MIN_R2, out=r2)
+        own = np.arange(start, stop)
+        r2[own - start, own] = np.inf
+        F[start:stop] = np.einsum("ijk,ij->ik", d, k2 / r2)
+    return F
+
+
+def _accumulate(F: np.ndarray, rows: np.ndarray, forces: np.ndarray) -> None:
+    n = len(F)
+    F[:, 0] += np.bincount(rows, forces[:, 0], n)
+    F[:, 1] += np.bincount(rows, forces[:, 1], n)
+
+
+def _grid_repulsion(X: np.ndarray, k2: float) -> np.ndarray:
+    n = len(X)
+    lo = X.min(axis=0)
+    span = max(float((X.max(axis=0) - lo).max()), 1e-9)
+    unit = np.minimum((X - lo) / span, 1 - 1e-9)
+    depth = max(2, int(np.ceil(np.log(n / _LEAF_SIZE) / np.log(4))))
+    # Clustered layouts crowd some cells: refine until the exact near-field pairs stay linear in n.
+    while depth < _MAX_DEPTH:
+        side = 1 << depth
+        cell = (unit * side).astype(np.int64)
+        counts = np.bincount(cell[:, 0] * side + cell[:, 1])
+        if int(np.dot(counts, counts)) <= 2 * _LEAF_SIZE * n:
+            break
+        depth += 1
+    F = np.zeros_like(X)
+    # Far field: at each level, the cells of the parent's 3x3 neighbourhood that
+    # are not next to the node's own cell, each as its node count at its centroid.
+    for level in range(2, depth + 1):
+        side = 1 << level
+        cell = (unit * side).astype(np.int64)
+        ids = cell[:, 0] * side + cell[:, 1]
+        mass = np.bincount(ids, minlength=side * side).astype(float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            centroid = np.stack([np.bincount(ids, X[:, c], side * side) / mass for c in (0, 1)], axis=1)
+        base = 2 * (cell // 2)
+        for ax in range(-2, 4):
+            tx = base[:, 0] + ax
+            for ay in range(-2, 4):
+                ty = base[:, 1] + ay
+                far = (np.abs(tx - cell[:, 0]) > 1) | (np.abs(ty - cell[:, 1]) > 1)
+                rows = np.flatnonzero(far & (tx >= 0) & (tx < side) & (ty >= 0) & (ty < side))
+                target = tx[rows] * side + ty[rows]
+                m = mass[target]
+                rows, target, m = rows[m > 0], target[m > 0], m[m > 0]
+                d = X[rows] - centroid[target]
+                r2 = np.maximum(np.einsum("ij,ij->i", d, d), _MIN_R2)
+                _accumulate(F, rows, d * (m * k2 / r2)[:, None])
+    # Near field: exact pairs within the finest cell and its eight neighbours.
+    side = 1 << depth
+    cell = (unit * side).astype(np.int64)
+    ids = cell[:, 0] * side + cell[:, 1]
+    order = np.argsort(ids, kind="stable")
+    counts = np.bincount(ids, minlength=side * side)
+    starts = np.cumsum(counts) - counts
+    for dx in (-1, 0, 1):
+        tx = cell[:, 0] + dx
+        for dy in (-1, 0, 1):
+            ty = cell[:, 1] + dy
+            src = np.flatnonzero((tx >= 0) & (tx < side) & (ty >= 0) & (ty < side))
+            target = tx[src] * side + ty[src]
+            sizes = counts[target]
+            total = int(sizes.sum())
+            if not total:
+                continue
+            rows = np.repeat(src, sizes)
+            within = np.arange(total) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+            cols = order[np.repeat(starts[target], sizes) + within]
+            keep = rows != cols
+            rows, cols = rows[keep], cols[keep]
+            d = X[rows] - X[cols]
+            r2 = np.maximum(np.einsum("ij,ij->i", d, d), _MIN_R2)
+            _accumulate(F, rows, d * (k2 / r2)[:, None])
+    return F
+
+
+def repulsion(X: np.ndarray, k2: float) -> np.ndarray:
+    """Sum of k²/d repulsion on every node (exact for small graphs, grid-approximated for large ones)."""
+    return _exact_repulsion(X, k2) if len(X) <= EXACT_LIMIT else _grid_repulsion(X, k2)
+
+
+def force_layout(
+    G: nx.Graph,
+    seed: int = 0,
+    iterations: int = DEFAULT_ITERATIONS,
+    previous: Optional[Positions] = None,
+    spacing: float = SPACING,
+) -> Tuple[Positions, Dict[str, Any]]:
+    """Pixel coordinates of every node of ``G`` and a summary (nodes, kept, iterations, method, seconds)."""
+    start_time = time.perf_counter()
+    nodes = list(G)
+    n = len(nodes)
+    index = {node: i for i, node in enumerate(nodes)}
+    previous = previous or {}
+    known = np.array([node in previous for node in nodes], dtype=bool)
+    info = {"nodes": n, "kept": int(known.sum()), "iterations": 0, "method": "exact" if n <= EXACT_LIMIT else "grid"}
+    if n == 0 or known.all():
+        info["seconds"] = time.perf_counter() - start_time
+        return {node: tuple(previous[node]) for node in nodes}, info
+
+    rng = np.random.default_rng(seed)
+    k = spacing
+    side = k * np.sqrt(n)
+    X = rng.uniform(-side / 2, side / 2, size=(n, 2))
+    edges = np.array([(index[u], index[v]) for u, v in G.edges()], dtype=np.int64).reshape(-1, 2)
+    weights = 1 + np.log(np.array([w for _, _, w in G.edges(data="weight", default=1)], dtype=float))
+    temperature = side / 10
+    if known.any():
+        X[known] = [previous[node] for node, seen in zip(nodes, known) if seen]
+        # New nodes start beside the known people they met, or anywhere when they met none of them.
+        fresh = np.flatnonzero(~known)
+        for i in fresh:
+            placed = [X[index[nbr]] for nbr in G[nodes[i]] if known[index[nbr]]]
+            if placed:
+                X[i] = np.mean(placed, axis=0) + rng.normal(0, k / 2, 2)
+        temperature = 2 * k
+    movable = ~known
+
+    k2 = k * k
+    cooling = temperature / (iterations + 1)
+    for _ in range(iterations):
+        F = repulsion(X, k2)
+        if len(edges):
+            d = X[edges[:, 0]] - X[edges[:, 1]]
+            pull = d * (np.sqrt(np.einsum("ij,ij->i", d, d)) * weights / k)[:, None]
+            _accumulate(F, edges[:, 0], -pull)
+            _accumulate(F, edges[:, 1], pull)
+        F -= GRAVITY * (X - X.mean(axis=0))
+        length = np.maximum(np.sqrt(np.einsum("ij,ij->i", F, F)), 1e-9)
+        step = F * (np.minimum(length, temperature) / length)[:, None]
+        X[movable] += step[movable]
+        temperature -= cooling
+        info["iterations"] += 1
+    if not known.any():
+        X -= X.mean(axis=0)
+    info["seconds"] = time.perf_counter() - start_time
+    return {node: (round(float(x), 1), round(float(y), 1)) for node, (x, y) in zip(nodes, X)}, info
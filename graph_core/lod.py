@@ -0,0 +1,119 @@
+"""
+Level-of-detail views of the co-attendance graph for the dashboard.
+
+vis-network draws every node and edge it is given, and past a few thousand
+edges the page stops responding. The dashboard therefore starts from a
+bounded summary and loads detail on demand, each level a separate asset:
+
+- communities: ``communities`` splits the people into at most
+  ``MAX_COMMUNITIES`` groups (seeded Louvain, weighted by co-attendance; the
+  smallest groups share the last slot). ``community_graph`` draws each group
+  as one node at its members' centroid, linked by the summed co-attendance
+  between the groups, so its size depends on the number of groups only;
+- strongest ties: everyone, with only the edges among either endpoint's
+  ``TOP_EDGES`` heaviest (``strongest_edges``): at most ``TOP_EDGES`` times
+  the number of people in total, though a hub keeps every edge that is among
+  its neighbours' heaviest;
+- a community's members with all the edges among them, one asset per
+  community, loaded when its node is selected;
+- the whole graph (``data/coattendance.json``), as before.
+
+Above ``CLUSTER_EDGE_LIMIT`` edges, Louvain runs on the strongest ties of
+every person (``CLUSTER_TOP_EDGES`` of them) rather than on the whole graph:
+its passes are pure Python and dense archives have millions of pairs.
+"""
+
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import networkx as nx
+import numpy as np
+from scipy.sparse import coo_matrix
+
+MAX_COMMUNITIES = 60  # supernodes, so at most 1770 edges at the coarsest level
+TOP_EDGES = 5
+CLUSTER_EDGE_LIMIT = 200_000
+CLUSTER_TOP_EDGES = 10
+FULL_EDGE_LIMIT = 2000  # graphs up to this size open on the whole graph
+
+Edge = Tuple[Hashable, Hashable, Any]
+
+
+def _edge_arrays(G: nx.Graph) -> Tuple[Dict[Hashable, int], np.ndarray, np.ndarray, np.ndarray]:
+    index = {node: i for i, node in enumerate(G)}
+    m = G.number_of_edges()
+    flat = np.fromiter(
+        (x for a, b, weight in G.edges(data="weight", default=1) for x in (index[a], index[b], weight)), float, 3 * m
+    )
+    return index, flat[0::3].astype(np.int64), flat[1::3].astype(np.int64), flat[2::3]
+
+
+def strongest_edges(G: nx.Graph, top: int = TOP_EDGES) -> List[Edge]:
+    """Edges of ``G`` among the ``top`` heaviest of either end, in ``G``'s edge order (ties go to the earlier edge)."""
+    edges = list(G.edges(data="weight", default=1))
+    _, u, v, w = _edge_arrays(G)
+    m = len(edges)
+    # Every edge once from each end, ranked within its end by weight, heaviest first.
+    ends = np.concatenate([u, v])
+    ids = np.tile(np.arange(m), 2)
+    order = np.lexsort((ids, -np.tile(w, 2), ends))
+    ranked = ends[order]
+    rank = np.arange(2 * m) - np.searchsorted(ranked, ranked)
+    keep = np.zeros(m, dtype=bool)
+    keep[ids[order[rank < top]]] = True
+    return [edge for edge, kept in zip(edges, keep) if kept]
+
+
+def communities(G: nx.Graph, seed: int = 0, limit: int = MAX_COMMUNITIES) -> List[List[Hashable]]:
+    """At most ``limit`` groups of nodes, largest first, members in ``G``'s node order (see module docstring)."""
+    if len(G) == 0:
+        return []
+    H = G
+    if G.number_of_edges() > CLUSTER_EDGE_LIMIT:
+        H = nx.Graph()
+        H.add_nodes_from(G)
+        H.add_weighted_edges_from(strongest_edges(G, CLUSTER_TOP_EDGES))
+    order = {node: i for i, node in enumerate(G)}
+    groups = [sorted(group, key=order.__getitem__) for group in nx.community.louvain_communities(H, weight="weight", seed=seed)]
+    groups.sort(key=lambda group: (-len(group), order[group[0]]))
+    if len(groups) > limit:
+        rest = sorted((node for group in groups[limit - 1 :] for node in group), key=order.__getitem__)
+        groups = groups[: limit - 1] + [rest]
+    return groups
+
+
+def community_graph(
+    G: nx.Graph,
+    groups: Sequence[Sequence[Hashable]],
+    positions: Optional[Dict[Hashable, Tuple[float, float]]] = None,
+    sources: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """Compact asset of the groups as nodes: ``labels``, ``size``, ``ties`` within, ``top`` members, ``edges``, ``x``/``y``, ``src``."""
+    index, u, v, w = _edge_arrays(G)
+    member = np.empty(len(G), dtype=np.int64)
+    for c, group in enumerate(groups):
+        member[[index[node] for node in group]] = c
+    k = len(groups)
+    cu, cv = member[u], member[v]
+    across = cu != cv
+    ties = np.bincount(cu[~across], w[~across], k)
+    between = coo_matrix(
+        (w[across], (np.minimum(cu, cv)[across], np.maximum(cu, cv)[across])), shape=(k, k)
+    ).tocsr().tocoo()
+    integral = bool(np.all(w == np.round(w)))
+    edges: List[Any] = []
+    for a, b, total in zip(between.row.tolist(), between.col.tolist(), between.data.tolist()):
+        edges.extend((a, b, int(total) if integral else total))
+    data: Dict[str, Any] = {
+        "labels": [f"Community {c + 1}" for c in range(k)],
+        "size": [len(group) for group in groups],
+        "ties": [int(t) if integral else float(t) for t in ties],
+        "top": [[str(node) for node in sorted(group, key=G.degree, reverse=True)[:3]] for group in groups],
+        "edges": edges,
+    }
+    if positions:
+        centroids = [np.mean([positions[node] for node in group], axis=0) for group in groups]
+        data["x"] = [round(float(x), 1) for x, _ in centroids]
+        data["y"] = [round(float(y), 1) for _, y in centroids]
+    if sources:
+        data["src"] = list(sources)
+    return data
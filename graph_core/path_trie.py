@@ -0,0 +1,383 @@
+"""
+Trie of JSON paths.
+
+Every distinct path is one node holding its parent's node ID, a segment ID and
+its depth, in flat ``array`` columns. Keys are interned once in a segment table
+and list indices are encoded in the segment ID itself, so memory grows with the
+number of distinct nodes and segments rather than with the total length of all
+path strings. Path strings are rebuilt from parent pointers only when a report
+needs them.
+
+Depth and "parent" keep the conventions of the path report: depth is the
+number of ``.`` and ``[`` in the path, and a path's parent in
+``parent_counts`` is the path before its last ``.`` (the object that holds the
+key), or the path itself when it has no ``.``. Keys are single segments here,
+so a key that itself contains ``.`` or ``[`` is not split by it.
+
+With ``template=True`` every list index collapses to ``[*]``: the trie then
+has one node per schema path, whatever the number of meetings, and each node
+counts its occurrences; list nodes also keep min/max/average lengths.
+"""
+
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import sys
+
+import networkx as nx
+import numpy as np
+
+from graph_core.visitor import Collector
+
+ROOT = 0
+_NONE = -1
+_STAR = -1  # index segment of template paths; odd like every index segment
+PATH_MODES = ("instance", "template")
+
+
+class PathTrie:
+    """Distinct JSON paths as a trie with per-node occurrence counts."""
+
+    def __init__(self, template: bool = False) -> None:
+        self.template = template
+        self.parent = array("i", [_NONE])
+        self.segment = array("i", [_NONE])
+        self.depth = array("i", [0])
+        self.count = array("i", [0])
+        # Node whose path precedes this node's last ".", or _NONE.
+        self.container = array("i", [_NONE])
+        # Children as linked lists; a lookup table is built only for parents
+        # that gain children again after the insertion that created them.
+        self.first_child = array("i", [_NONE])
+        self.next_sibling = array("i", [_NONE])
+        self._keys: List[str] = []
+        self._key_ids: Dict[str, int] = {}
+        self._lookup: Dict[int, Dict[int, int]] = {}
+        # Collapsed indices repeat within a record, so templates always look up.
+        self._fresh_from = sys.maxsize if template else 1
+        # List node -> [occurrences, total length, min length, max length].
+        self.list_lengths: Dict[int, List[int]] = {}
+
+    def __len__(self) -> int:
+        """Number of distinct paths (the root is not a path)."""
+        return len(self.parent) - 1
+
+    # -- building --
+
+    def _key_segment(self, key: str) -> int:
+        sid = self._key_ids.get(key)
+        if sid is None:
+            sid = self._key_ids[key] = len(self._keys)
+            self._keys.append(key)
+        return sid << 1
+
+    def begin(self) -> None:
+        """Start inserting a new record.
+
+        Nodes created from here on are known to have no children yet, and a
+        record never repeats a key or index under the same node, so their
+        children are appended without any lookup.
+        """
+        if not self.template:
+            self._fresh_from = len(self.parent)
+
+    def _find(self, parent: int, seg: int) -> int:
+        table = self._lookup.get(parent)
+        if table is None:
+            table = self._lookup[parent] = {}
+            node = self.first_child[parent]
+            while node != _NONE:
+                table[self.segment[node]] = node
+                node = self.next_sibling[node]
+        return table.get(seg, _NONE)
+
+    def child(self, parent: int, key: Any, count: int = 1) -> int:
+        """Return the node for ``key`` (a dict key, list index or None for ``[*]``) under ``parent``, counting ``count`` occurrences."""
+        if key is None:
+            seg = _STAR
+        elif isinstance(key, int):
+            seg = _STAR if self.template else (key << 1) | 1
+        else:
+            seg = self._key_segment(key)
+        node = _NONE if parent >= self._fresh_from else self._find(parent, seg)
+        if node == _NONE:
+            node = len(self.parent)
+            self.parent.append(parent)
+            self.segment.append(seg)
+            self.count.append(0)
+            self.first_child.append(_NONE)
+            self.next_sibling.append(self.first_child[parent])
+            self.first_child[parent] = node
+            if parent in self._lookup:
+                self._lookup[parent][seg] = node
+            if seg & 1:
+                self.depth.append(self.depth[parent] + 1)
+                self.container.append(self.container[parent])
+            elif parent == ROOT:
+                self.depth.append(0)
+                self.container.append(_NONE)
+            else:
+                self.depth.append(self.depth[parent] + 1)
+                self.container.append(parent)
+        self.count[node] += count
+        return node
+
+    def note_list(self, node: int, length: int, times: int = 1) -> None:
+        """Record the length of ``times`` list occurrences at ``node`` (template mode only)."""
+        if not self.template:
+            return
+        stats = self.list_lengths.get(node)
+        if stats is None:
+            self.list_lengths[node] = [times, length * times, length, length]
+        else:
+            stats[0] += times
+            stats[1] += length * times
+            if length < stats[2]:
+                stats[2] = length
+            if length > stats[3]:
+                stats[3] = length
+
+    def add(self, obj: Any, index: Optional[int] = None) -> None:
+        """Insert every path of ``obj``; with ``index`` the paths are prefixed by ``[index]``."""
+        self.begin()
+        top = ROOT if index is None else self.child(ROOT, index)
+        stack: List[Tuple[Iterator, int]] = []
+        if isinstance(obj, dict):
+            stack.append((iter(obj.items()), top))
+        elif isinstance(obj, list):
+            if top != ROOT:
+                self.note_list(top, len(obj))
+            stack.append((enumerate(obj), top))
+        child = self.child
+        while stack:
+            children, parent = stack[-1]
+            for key, value in children:
+                node = child(parent, key)
+                if isinstance(value, dict) and value:
+                    stack.append((iter(value.items()), node))
+                    break
+                if isinstance(value, list):
+                    self.note_list(node, len(value))
+                    if value:
+                        stack.append((enumerate(value), node))
+                        break
+            else:
+                stack.pop()
+
+    def add_path(self, segments: Sequence[Any], count: int = 1) -> int:
+        """Insert one path given as its keys/indices and count ``count`` occurrences of it.
+
+        Prefixes are created when missing but not counted, so a trie can be
+        rebuilt from ``(segments, count)`` pairs listed parents first.
+        """
+        node = ROOT
+        last = len(segments) - 1
+        for i, key in enumerate(segments):
+            node = self.child(node, key, count if i == last else 0)
+        return node
+
+    @classmethod
+    def merge(cls, parts: Sequence[Tuple["PathTrie", Sequence[Tuple[int, int]]]], template: bool = False) -> "PathTrie":
+        """One trie from tries built over disjoint sets of records (e.g. one per shard).
+
+        Each part is a trie and its record marks: ``(len(trie.parent), record
+        index)`` taken as each of its records began. Nodes are replayed in order
+        of the record that created them, so the merged trie numbers paths
+        exactly as one trie fed every record in index order would; occurrence
+        counts and list lengths add up.
+        """
+        if not template and all(trie.first_child[ROOT] == _NONE or trie.segment[trie.first_child[ROOT]] & 1 for trie, _ in parts):
+            # Instance paths start with the record's own "[i]": no node is shared.
+            return cls._concatenate(parts)
+        merged = cls(template=template)
+        # Replayed nodes may land under existing parents: always look children up.
+        merged._fresh_from = sys.maxsize
+        events: List[Tuple[int, int, int]] = []
+        for p, (trie, marks) in enumerate(parts):
+            starts = [first for first, _ in marks]
+            events.extend((marks[bisect_right(starts, node) - 1][1], node, p) for node in trie.nodes())
+        events.sort()
+        mapping: List[Dict[int, int]] = [{ROOT: ROOT} for _ in parts]
+        for _, node, p in events:
+            trie = parts[p][0]
+            new = mapping[p][node] = merged.child(mapping[p][trie.parent[node]], trie.key(node), trie.count[node])
+            stats = trie.list_lengths.get(node)
+            if stats is None:
+                continue
+            current = merged.list_lengths.get(new)
+            if current is None:
+                merged.list_lengths[new] = list(stats)
+            else:
+                current[0] += stats[0]
+                current[1] += stats[1]
+                current[2] = min(current[2], stats[2])
+                current[3] = max(current[3], stats[3])
+        return merged
+
+    @classmethod
+    def _concatenate(cls, parts: Sequence[Tuple["PathTrie", Sequence[Tuple[int, int]]]]) -> "PathTrie":
+        """``merge`` of instance tries: each record's block of nodes is copied whole, with shifted IDs."""
+        blocks: List[Tuple[int, int, int, int]] = []
+        for p, (trie, marks) in enumerate(parts):
+            bounds = [first for first, _ in marks[1:]] + [len(trie.parent)]
+            blocks.extend((record, p, first, stop) for (first, record), stop in zip(marks, bounds) if stop > first)
+        blocks.sort()
+        ids = [np.zeros(len(trie.parent), dtype=np.int64) for trie, _ in parts]
+        size = 1
+        for _, p, first, stop in blocks:
+            ids[p][first:stop] = np.arange(size, size + stop - first)
+            size += stop - first
+
+        merged = cls()
+        columns = {name: np.full(size, _NONE, dtype=np.int64) for name in ("parent", "segment", "depth", "count", "container", "first_child", "next_sibling")}
+        columns["depth"][ROOT] = columns["count"][ROOT] = 0
+        for p, (trie, _) in enumerate(parts):
+            new = ids[p]
+            rows = new[1:]
+
+            def column(name: str) -> np.ndarray:
+                return np.frombuffer(getattr(trie, name), dtype=np.int32)[1:].astype(np.int64)
+
+            def remap(values: np.ndarray) -> np.ndarray:
+                return np.where(values == _NONE, _NONE, new[np.maximum(values, 0)])
+
+            key_ids = np.array([merged._key_segment(key) for key in trie._keys], dtype=np.int64)
+            segment = column("segment")
+            is_key = (segment & 1) == 0
+            segment[is_key] = key_ids[segment[is_key] >> 1]
+            columns["segment"][rows] = segment
+            columns["parent"][rows] = new[column("parent")]
+            columns["depth"][rows] = column("depth")
+            columns["count"][rows] = column("count")
+            for name in ("container", "first_child", "next_sibling"):
+                columns[name][rows] = remap(column(name))
+        # Top-level nodes form one sibling list across parts, newest first.
+        top = np.flatnonzero(columns["parent"] == ROOT)
+        columns["next_sibling"][top] = np.concatenate(([_NONE], top[:-1]))
+        columns["first_child"][ROOT] = top[-1] if len(top) else _NONE
+        for name, values in columns.items():
+            setattr(merged, name, array("i", values.astype(np.int32).tobytes()))
+        merged._fresh_from = sys.maxsize
+        return merged
+
+    # -- queries --
+
+    def key(self, node: int) -> Any:
+        """Dict key, list index or ``None`` (``[*]``) leading to ``node``, as passed to ``child``."""
+        seg = self.segment[node]
+        if seg == _STAR:
+            return None
+        return seg >> 1 if seg & 1 else self._keys[seg >> 1]
+
+    def path(self, node: int) -> str:
+        """Rebuild the path string of ``node`` in ``extract_json_paths`` notation."""
+        segments = []
+        while node != ROOT:
+            segments.append(self.segment[node])
+            node = self.parent[node]
+        parts = []
+        for seg in reversed(segments):
+            if seg == _STAR:
+                parts.append("[*]")
+            elif seg & 1:
+                parts.append(f"[{seg >> 1}]")
+            elif parts:
+                parts.append(f".{self._keys[seg >> 1]}")
+            else:
+                parts.append(self._keys[seg >> 1])
+        return "".join(parts)
+
+    def nodes(self) -> range:
+        """Node IDs of all paths, in order of first occurrence."""
+        return range(1, len(self.parent))
+
+    def depth_histogram(self) -> Counter:
+        """Distinct paths per depth."""
+        return Counter(self.depth[1:])
+
+    def parent_counts(self) -> Counter:
+        """Distinct paths per parent node (see module docstring), keyed by node ID."""
+        counts: Counter = Counter()
+        container = self.container
+        for node in self.nodes():
+            holder = container[node]
+            counts[node if holder == _NONE else holder] += 1
+        return counts
+
+    def metrics(self, top: int = 10, deepest: int = 10) -> Dict[str, Any]:
+        """Path report metrics from the trie; only the reported paths are turned into strings.
+
+        Counts are over distinct paths, so in template mode they describe the
+        schema; ``occurrences`` is the number of instance paths seen. Template
+        mode adds the most frequent template paths and per-list length stats.
+        """
+        hist = self.depth_histogram()
+        total = len(self)
+        max_depth = max(hist) if hist else 0
+        avg_depth = (sum(d * c for d, c in hist.items()) / total) if total else 0.0
+        deepest_nodes = [n for n in self.nodes() if self.depth[n] == max_depth][:deepest]
+        info = {
+            "path_mode": "template" if self.template else "instance",
+            "total_paths": total,
+            "occurrences": sum(self.count),
+            "max_depth": max_depth,
+            "avg_depth": avg_depth,
+            "depth_histogram": sorted(hist.items()),
+            "deepest_paths": [self.path(n) for n in deepest_nodes],
+            "parent_top": [(self.path(n), c) for n, c in self.parent_counts().most_common(top)],
+        }
+        if self.template:
+            frequent = sorted(self.nodes(), key=lambda n: self.count[n], reverse=True)[:top]
+            info["frequent_paths"] = [(self.path(n), self.count[n]) for n in frequent]
+            info["array_lengths"] = [
+                (self.path(n), seen, low, high, total_len / seen)
+                for n, (seen, total_len, low, high) in sorted(self.list_lengths.items())
+            ]
+        return info
+
+    def to_digraph(self) -> nx.DiGraph:
+        """Parent -> child DiGraph on node IDs (the root appears only above top-level indices)."""
+        G = nx.DiGraph()
+        parent = self.parent
+        segment = self.segment
+        G.add_nodes_from(self.nodes())
+        G.add_edges_from(
+            (parent[n], n) for n in self.nodes() if parent[n] != ROOT or segment[n] & 1
+        )
+        return G
+
+
+class PathTrieCollector(Collector):
+    """Visitor plug-in that inserts every visited path into a ``PathTrie``."""
+
+    def __init__(self, trie: Optional[PathTrie] = None) -> None:
+        self.trie = trie if trie is not None else PathTrie()
+        self._stack: List[int] = []
+        self._index = 0
+
+    def on_record(self, index: int, record: Any) -> None:
+        self._index = index
+
+    def _visit(self, path: str, key: Any, depth: int) -> None:
+        if depth == 0:
+            self.trie.begin()
+            # A non-empty record path means records are array elements: "[i]".
+            node = self.trie.child(ROOT, self._index) if path else ROOT
+            self._stack[:] = [node]
+            return
+        node = self.trie.child(self._stack[depth - 1], key)
+        del self._stack[depth:]
+        self._stack.append(node)
+
+    def on_dict(self, obj: Dict[str, Any], path: str, key: Any, depth: int) -> None:
+        self._visit(path, key, depth)
+
+    def on_list(self, obj: List[Any], path: str, key: Any, depth: int) -> None:
+        self._visit(path, key, depth)
+        if self._stack[-1] != ROOT:
+            self.trie.note_list(self._stack[-1], len(obj))
+
+    def on_leaf(self, value: Any, path: str, key: Any, depth: int) -> None:
+        self._visit(path, key, depth)
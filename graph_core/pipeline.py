@@ -0,0 +1,136 @@
+"""
+Run several per-metric reports from one load and one graph build.
+
+Each ``make`` target used to download the meetings and rebuild the field graph
+on its own. ``run_pipeline`` opens the input once, builds every graph the
+chosen metrics need in a single ``build_graphs`` pass and hands each graph to
+the metric scripts, which write their usual reports:
+
+    python -m graph_core.pipeline --metrics degree centrality clustering components paths
+
+A metric script takes part by defining ``GRAPH`` (a ``graph_core.graphs``
+kind), ``DEFAULT_OUTPUT`` and ``run(graph, output_file)``; its own ``main``
+keeps working stand-alone.
+"""
+
+import argparse
+import importlib.util
+import os
+import time
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Sequence
+
+from graph_core.fetch import print_cache_stats
+from graph_core.graphs import build_graphs
+from graph_core.path_trie import PATH_MODES
+from graph_core.snapshot import Snapshot
+from graph_core.sources import DEFAULT_WORKERS, open_sources, print_source_report
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+METRICS: Dict[str, str] = {
+    "degree": "Graph Analysis/Degree_Analysis/degree_analysis_to_md.py",
+    "centrality": "Graph Analysis/Centrality_Analysis/json_centrality_analysis.py",
+    "clustering": "Graph Analysis/Clustering_Analysis/json_clustering_analysis.py",
+    "components": "Graph Analysis/Connected_Components/json_connected_components.py",
+    "paths": "Graph Analysis/Path_Analysis/path_analysis_report.py",
+}
+
+_modules: Dict[str, ModuleType] = {}
+
+
+def load_metric(name: str) -> ModuleType:
+    """Import the script behind metric ``name`` (script directories are not packages)."""
+    if name not in METRICS:
+        raise ValueError(f"Unknown metric {name!r}; choose from {', '.join(METRICS)}")
+    module = _modules.get(name)
+    if module is None:
+        path = os.path.join(REPO_ROOT, METRICS[name])
+        spec = importlib.util.spec_from_file_location(f"graph_metric_{name}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[name] = module
+    return module
+
+
+def run_pipeline(
+    records: Any,
+    metrics: Sequence[str],
+    output_dir: Optional[str] = None,
+    path_mode: str = "instance",
+) -> Dict[str, str]:
+    """Build the graphs ``metrics`` need from ``records`` once and write each metric's report.
+
+    Reports go to each script's ``DEFAULT_OUTPUT``, or under ``output_dir``
+    with the same file name. Returns metric name -> report path.
+    """
+    modules = {name: load_metric(name) for name in metrics}
+    kinds: List[str] = []
+    for module in modules.values():
+        if module.GRAPH not in kinds:
+            kinds.append(module.GRAPH)
+
+    print(f"🔍 Building {', '.join(kinds)} graph(s) in one pass...")
+    start = time.perf_counter()
+    graphs = build_graphs(records, kinds, is_array=getattr(records, "is_array", True), path_mode=path_mode)
+    print(f"📊 Graphs built in {time.perf_counter() - start:.2f}s")
+
+    outputs: Dict[str, str] = {}
+    for name, module in modules.items():
+        output_file = module.DEFAULT_OUTPUT
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+            output_file = os.path.join(output_dir, os.path.basename(output_file))
+        module.run(graphs[module.GRAPH], output_file)
+        outputs[name] = output_file
+    return outputs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run several graph metric reports from one load")
+    parser.add_argument(
+        "--metrics",
+        nargs="+",
+        choices=list(METRICS),
+        default=list(METRICS),
+        help="Metric reports to write (default: all)",
+    )
+    parser.add_argument(
+        "--input",
+        nargs="+",
+        default=["2025"],
+        help="Sources: local paths, URLs, years/year ranges or @manifest (see graph_core/sources.py)",
+    )
+    parser.add_argument("--source-template", default=None, help="URL template used to expand years")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent source fetches")
+    parser.add_argument("--offline", action="store_true", default=None, help="Use only the local HTTP cache")
+    parser.add_argument(
+        "--snapshot",
+        default=os.environ.get("GRAPH_SNAPSHOT"),
+        help="Read meetings from a binary snapshot instead of --input",
+    )
+    parser.add_argument("--path-mode", choices=PATH_MODES, default="instance", help="Path report mode")
+    parser.add_argument(
+        "--output-dir",
+        default=None,
+        help="Write every report into this directory (default: each script's usual location)",
+    )
+    args = parser.parse_args()
+
+    if args.snapshot:
+        print(f"📦 Reading meeting structure from snapshot {args.snapshot}")
+        with Snapshot(args.snapshot) as snap:
+            outputs = run_pipeline(snap, args.metrics, args.output_dir, args.path_mode)
+    else:
+        print("📡 Fetching JSON data...")
+        with open_sources(
+            args.input, template=args.source_template, workers=args.workers, offline=args.offline
+        ) as records:
+            outputs = run_pipeline(records, args.metrics, args.output_dir, args.path_mode)
+        print_source_report(records)
+    print(f"✅ {len(outputs)} report(s) written from one graph build")
+    print_cache_stats()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Per-workgroup shards of the meeting records and the merge of their aggregates.
+
+``--by-workgroup`` splits the records by their ``workgroup`` field, analyses
+every shard in its own process and writes one report per workgroup. The global
+report is then assembled from what the shards already counted instead of
+visiting every record again:
+
+- co-attendance: each shard's ``CoAttendanceMatrix``, plus the position
+  (record index, place in the participant list) where each person first
+  appeared; people are numbered by that position, as ``CoAttendanceMatrix``
+  numbers them in one pass, and the shards' ``BᵀB`` are summed, so pairs who
+  meet in several workgroups add up their counts,
+- fields: each shard's distinct key sets with their counts and the record
+  that first held them, fed to one ``FieldPairCounts`` in first-seen order,
+- components: the shards' ``DisjointSet``s, combined with ``merge``,
+- paths: the shards' ``PathTrie``s, replayed in record order by ``PathTrie.merge``,
+- the temporal timeline: the shards' dated meetings, interleaved by record index.
+
+Graphs, paths and components therefore come out exactly as a single pass over
+all records builds them. Measures that do not decompose over shards
+(centrality, clustering, spectral scores) still run once on the merged graphs.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import networkx as nx
+import numpy as np
+from scipy import sparse
+
+from graph_core.components import DisjointSet
+from graph_core.graphs import FieldPairCounts
+from graph_core.path_trie import PathTrie
+from graph_core.temporal import TimelineCollector
+from graph_core.visitor import Collector
+
+UNASSIGNED = "Unassigned"
+
+
+def workgroup_of(record: Any) -> str:
+    value = record.get("workgroup") if isinstance(record, dict) else None
+    return value.strip() if isinstance(value, str) and value.strip() else UNASSIGNED
+
+
+def split_by_workgroup(records: Iterable[Any]) -> Dict[str, List[Tuple[int, Any]]]:
+    """``(record index, record)`` lists per workgroup, workgroups in order of first appearance."""
+    shards: Dict[str, List[Tuple[int, Any]]] = {}
+    for index, record in enumerate(records):
+        shards.setdefault(workgroup_of(record), []).append((index, record))
+    return shards
+
+
+def shard_slug(name: str, taken: Set[str]) -> str:
+    """File-name-safe, unique slug for a workgroup's report."""
+    base = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-") or "workgroup"
+    slug, n = base, 2
+    while slug in taken:
+        slug, n = f"{base}-{n}", n + 1
+    taken.add(slug)
+    return slug
+
+
+class ShardCollector(Collector):
+    """What a shard hands back for the global merge, gathered in the shard's own visitor pass.
+
+    ``add_set`` is meant as the ``FieldSetCollector`` callback; ``trie`` is the
+    shard's ``PathTrie``, whose size is marked as every record begins.
+    """
+
+    def __init__(self, trie: PathTrie) -> None:
+        self.trie = trie
+        self.trie_marks: List[Tuple[int, int]] = []
+        # Distinct key set -> [record that first held it, keys, number of objects].
+        self.field_sets: Dict[frozenset, List[Any]] = {}
+        self._record = 0
+
+    def on_record(self, index: int, record: Any) -> None:
+        self._record = index
+        self.trie_marks.append((len(self.trie.parent), index))
+
+    def add_set(self, keys: Sequence[str]) -> None:
+        key_set = frozenset(keys)
+        entry = self.field_sets.get(key_set)
+        if entry is None:
+            self.field_sets[key_set] = [self._record, tuple(keys), 1]
+        else:
+            entry[2] += 1
+
+    def field_counts(self) -> FieldPairCounts:
+        """The shard's own field co-occurrence counts."""
+        counts = FieldPairCounts()
+        for _, keys, times in self.field_sets.values():
+            counts.add(keys, times)
+        return counts
+
+
+def first_appearances(indices: Sequence[int], participants: Sequence[Sequence[str]]) -> Dict[str, Tuple[int, int]]:
+    """(record index, position) where each person first appears, over meetings with two or more participants."""
+    first: Dict[str, Tuple[int, int]] = {}
+    for index, people in zip(indices, participants):
+        if len(people) < 2:
+            continue
+        for position, person in enumerate(people):
+            if person not in first:
+                first[person] = (index, position)
+    return first
+
+
+def merge_attendance(parts: Sequence[Dict[str, Any]]) -> nx.Graph:
+    """Co-attendance graph from the shards' ``people`` and ``attendance`` (``CoAttendanceMatrix``) entries.
+
+    Each shard's ``BᵀB`` is renumbered to the global people order and the
+    matrices are summed, so shared pairs add their counts without any per-pair loop.
+    """
+    first: Dict[str, Tuple[int, int]] = {}
+    for part in parts:
+        for person, seen in part["people"].items():
+            if person not in first or seen < first[person]:
+                first[person] = seen
+    people = sorted(first, key=first.__getitem__)
+    rank = {person: i for i, person in enumerate(people)}
+    rows, cols, weights = [], [], []
+    for part in parts:
+        matrix = part["attendance"]
+        ranks = np.array([rank[person] for person in matrix.people], dtype=np.int64)
+        upper = sparse.triu(matrix.adjacency, k=1, format="coo")
+        u, v = ranks[upper.row], ranks[upper.col]
+        rows.append(np.minimum(u, v))
+        cols.append(np.maximum(u, v))
+        weights.append(upper.data)
+    G = nx.Graph()
+    G.add_nodes_from(people)
+    if rows:
+        A = sparse.coo_matrix(
+            (np.concatenate(weights), (np.concatenate(rows), np.concatenate(cols))), shape=(len(people), len(people))
+        ).tocsr()
+        A.sum_duplicates()
+        A = A.tocoo()
+        G.add_weighted_edges_from(
+            (people[i], people[j], w) for i, j, w in zip(A.row.tolist(), A.col.tolist(), A.data.tolist())
+        )
+    return G
+
+
+def merge_field_sets(parts: Sequence[Dict[str, Any]]) -> FieldPairCounts:
+    """One ``FieldPairCounts`` from the shards' distinct key sets, in global first-seen order."""
+    merged: Dict[frozenset, List[Any]] = {}
+    for part in parts:
+        for position, (record, keys, times) in enumerate(part["field_sets"]):
+            key_set = frozenset(keys)
+            entry = merged.get(key_set)
+            if entry is None:
+                merged[key_set] = [(record, position), keys, times]
+            else:
+                if (record, position) < entry[0]:
+                    entry[0], entry[1] = (record, position), keys
+                entry[2] += times
+    counts = FieldPairCounts()
+    for _, keys, times in sorted(merged.values(), key=lambda entry: entry[0]):
+        counts.add(keys, times)
+    return counts
+
+
+def merge_components(keys: Iterable[str], parts: Sequence[Dict[str, Any]]) -> DisjointSet:
+    """Field components: ``keys`` in global first-seen order, joined by every shard's ``DisjointSet``."""
+    components = DisjointSet()
+    for key in keys:
+        components.add(key)
+    for part in parts:
+        components.merge(part["components"])
+    return components
+
+
+def merge_timelines(parts: Sequence[Dict[str, Any]]) -> Optional[TimelineCollector]:
+    """The shards' dated meetings back in record order, or ``None`` when no timeline was kept."""
+    if any(part.get("timeline") is None for part in parts):
+        return None
+    timeline = TimelineCollector()
+    entries = sorted(
+        (index, meeting) for part in parts for index, meeting in zip(part["timeline"].positions, part["timeline"].meetings)
+    )
+    for index, (day, participants) in entries:
+        timeline.add(day, participants, index)
+    timeline.undated = sum(part["timeline"].undated for part in parts)
+    return timeline
+
+
+def merge_paths(parts: Sequence[Dict[str, Any]], template: bool) -> PathTrie:
+    return PathTrie.merge([(part["trie"], part["trie_marks"]) for part in parts], template=template)
@@ -0,0 +1,227 @@
+"""
+All-pairs shortest-path statistics from one BFS per source.
+
+Exact betweenness and closeness each ran a BFS from every node, and path
+length statistics (average shortest path, diameter) would have run a third.
+``all_pairs_bfs`` runs one unweighted BFS per source and accumulates, in that
+pass:
+
+- Brandes dependencies (betweenness),
+- the distance sum and number of reached nodes (closeness),
+- the farthest distance (eccentricity within the source's component),
+- a histogram of distances over all ordered reachable pairs (average shortest
+  path length and diameter).
+
+The result, ``ShortestPaths``, turns these into the same numbers as
+``nx.betweenness_centrality``, ``nx.closeness_centrality`` and friends.
+Sources can be split across processes (``workers > 1``): the graph is sent to
+each worker once, as CSR ``array`` bytes through the pool initializer, and
+every task is just a range of source indices whose partial sums come back to
+be added up. ``shared_shortest_paths`` memoizes the result per graph so the
+centrality and component reports of one run share a single sweep.
+"""
+
+import math
+import time
+import weakref
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import networkx as nx
+
+# Adjacency lists of the graph in each worker process, set by _init_worker.
+_ADJ: List[List[int]] = []
+
+# Graph -> ((nodes, edges) when computed, ShortestPaths), see shared_shortest_paths.
+_SHARED: "weakref.WeakKeyDictionary[nx.Graph, Tuple[Tuple[int, int], ShortestPaths]]" = weakref.WeakKeyDictionary()
+
+
+def graph_to_csr(G: nx.Graph) -> Tuple[List[Any], array, array]:
+    """Node list plus CSR ``indptr``/``indices`` arrays over node positions."""
+    nodes = list(G)
+    index = {node: i for i, node in enumerate(nodes)}
+    indptr = array("i", [0])
+    indices = array("i")
+    for node in nodes:
+        indices.extend(index[nbr] for nbr in G.adj[node])
+        indptr.append(len(indices))
+    return nodes, indptr, indices
+
+
+def _init_worker(indptr_bytes: bytes, indices_bytes: bytes) -> None:
+    global _ADJ
+    indptr = array("i")
+    indptr.frombytes(indptr_bytes)
+    indices = array("i")
+    indices.frombytes(indices_bytes)
+    _ADJ = [indices[indptr[i] : indptr[i + 1]].tolist() for i in range(len(indptr) - 1)]
+
+
+def _sweep(sources: Sequence[int], adj: Optional[List[List[int]]] = None) -> Tuple[array, array, array, array, List[int]]:
+    """BFS from each of ``sources``: dependency sums, distance sums, reach, eccentricity, distance histogram."""
+    adj = _ADJ if adj is None else adj
+    n = len(adj)
+    bc = array("d", bytes(8 * n))
+    dist_sum = array("q", bytes(8 * n))
+    reach = array("i", bytes(4 * n))
+    ecc = array("i", bytes(4 * n))
+    histogram = [0]
+    for s in sources:
+        S: List[int] = []
+        P: List[List[int]] = [[] for _ in range(n)]
+        sigma = [0.0] * n
+        dist = [-1] * n
+        sigma[s] = 1.0
+        dist[s] = 0
+        queue = [s]
+        head = 0
+        total = 0
+        while head < len(queue):
+            v = queue[head]
+            head += 1
+            S.append(v)
+            dv = dist[v] + 1
+            sigmav = sigma[v]
+            for w in adj[v]:
+                if dist[w] < 0:
+                    queue.append(w)
+                    dist[w] = dv
+                    total += dv
+                if dist[w] == dv:
+                    sigma[w] += sigmav
+                    P[w].append(v)
+        farthest = dist[S[-1]]
+        while len(histogram) <= farthest:
+            histogram.append(0)
+        for w in S:
+            histogram[dist[w]] += 1
+        dist_sum[s] = total
+        reach[s] = len(S)
+        ecc[s] = farthest
+        delta = [0.0] * n
+        while S:
+            w = S.pop()
+            coeff = (1 + delta[w]) / sigma[w]
+            for v in P[w]:
+                delta[v] += sigma[v] * coeff
+            if w != s:
+                bc[w] += delta[w]
+    return bc, dist_sum, reach, ecc, histogram
+
+
+class ShortestPaths:
+    """Accumulated BFS results for every source of an undirected graph."""
+
+    def __init__(
+        self,
+        nodes: List[Any],
+        dependency: Sequence[float],
+        distance_sum: Sequence[int],
+        reach: Sequence[int],
+        eccentricity: Sequence[int],
+        histogram: Sequence[int],
+        seconds: float = 0.0,
+        workers: int = 1,
+    ) -> None:
+        self.nodes = nodes
+        self.dependency = dependency
+        self.distance_sum = distance_sum
+        self.reach = reach
+        self._eccentricity = eccentricity
+        # histogram[d]: ordered (source, target) pairs at distance d; d = 0 counts the sources.
+        self.histogram = list(histogram)
+        self.seconds = seconds
+        self.workers = workers
+
+    def betweenness(self, normalized: bool = True) -> Dict[Any, float]:
+        """As ``nx.betweenness_centrality(G, normalized=normalized)``."""
+        n = len(self.nodes)
+        if normalized:
+            scale = 1 / ((n - 1) * (n - 2)) if n > 2 else 1.0
+        else:
+            scale = 0.5
+        return {node: self.dependency[i] * scale for i, node in enumerate(self.nodes)}
+
+    def closeness(self) -> Dict[Any, float]:
+        """As ``nx.closeness_centrality(G)`` (Wasserman–Faust scaling for disconnected graphs)."""
+        n = len(self.nodes)
+        scores: Dict[Any, float] = {}
+        for i, node in enumerate(self.nodes):
+            total, reached = self.distance_sum[i], self.reach[i] - 1
+            scores[node] = (reached / total) * (reached / (n - 1)) if total and n > 1 else 0.0
+        return scores
+
+    def eccentricity(self) -> Dict[Any, int]:
+        """Farthest distance from each node within its own connected component."""
+        return {node: self._eccentricity[i] for i, node in enumerate(self.nodes)}
+
+    @property
+    def connected_pairs(self) -> int:
+        """Unordered pairs of distinct nodes joined by a path."""
+        return sum(self.histogram[1:]) // 2
+
+    @property
+    def diameter(self) -> int:
+        """Longest shortest path in any component."""
+        return len(self.histogram) - 1
+
+    def average_shortest_path_length(self) -> float:
+        """Mean distance over connected pairs; ``nx.average_shortest_path_length`` on a connected graph."""
+        pairs = sum(self.histogram[1:])
+        return sum(d * count for d, count in enumerate(self.histogram)) / pairs if pairs else 0.0
+
+    def distance_histogram(self) -> List[Tuple[int, int]]:
+        """(distance, unordered pairs at that distance) for every distance >= 1."""
+        return [(d, count // 2) for d, count in enumerate(self.histogram) if d and count]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "connected_pairs": self.connected_pairs,
+            "average_shortest_path_length": self.average_shortest_path_length(),
+            "diameter": self.diameter,
+            "distance_histogram": self.distance_histogram(),
+            "seconds": self.seconds,
+            "workers": self.workers,
+        }
+
+
+def all_pairs_bfs(G: nx.Graph, workers: int = 1, chunks_per_worker: int = 4) -> ShortestPaths:
+    """One BFS from every node of ``G`` (optionally over ``workers`` processes)."""
+    start = time.perf_counter()
+    nodes, indptr, indices = graph_to_csr(G)
+    n = len(nodes)
+    if workers <= 1 or n <= 2:
+        adj = [indices[indptr[i] : indptr[i + 1]].tolist() for i in range(n)]
+        bc, dist_sum, reach, ecc, histogram = _sweep(range(n), adj)
+        return ShortestPaths(nodes, bc, dist_sum, reach, ecc, histogram, time.perf_counter() - start)
+    step = max(1, math.ceil(n / (workers * chunks_per_worker)))
+    parts = [range(first, min(first + step, n)) for first in range(0, n, step)]
+    bc = [0.0] * n
+    dist_sum = [0] * n
+    reach = [0] * n
+    ecc = [0] * n
+    histogram: List[int] = []
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(indptr.tobytes(), indices.tobytes())
+    ) as pool:
+        for part, (p_bc, p_sum, p_reach, p_ecc, p_hist) in zip(parts, pool.map(_sweep, parts)):
+            for i, value in enumerate(p_bc):
+                bc[i] += value
+            for s in part:
+                dist_sum[s], reach[s], ecc[s] = p_sum[s], p_reach[s], p_ecc[s]
+            histogram.extend([0] * (len(p_hist) - len(histogram)))
+            for d, count in enumerate(p_hist):
+                histogram[d] += count
+    return ShortestPaths(nodes, bc, dist_sum, reach, ecc, histogram, time.perf_counter() - start, workers)
+
+
+def shared_shortest_paths(G: nx.Graph, workers: int = 1) -> ShortestPaths:
+    """``all_pairs_bfs(G)``, computed once per graph while its node and edge counts stay the same."""
+    shape = (G.number_of_nodes(), G.number_of_edges())
+    cached = _SHARED.get(G)
+    if cached is not None and cached[0] == shape:
+        return cached[1]
+    paths = all_pairs_bfs(G, workers)
+    _SHARED[G] = (shape, paths)
+    return paths
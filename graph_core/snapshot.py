@@ -0,0 +1,508 @@
+"""
+Compact binary snapshot of normalized meeting records, read through ``mmap``.
+
+``build_snapshot`` streams the meeting records once and writes:
+- an interned string table (UTF-8 blob + uint32 offsets); every name, workgroup,
+  tag and JSON key is stored once and referred to by its integer ID,
+- per-meeting uint32 columns (workgroup, workgroup_id, type, host, documenter,
+  raw date) and an int32 ``date`` column as YYYYMMDD,
+- CSR-style offset arrays for variable-length lists: normalized participants,
+  ``peoplePresent`` attendees, topics, emotions, working docs and agenda items
+  with their action/decision items,
+- a key-only "shape" token stream per record (dict/list/leaf markers and key
+  IDs), which is all that the path and field co-occurrence analyses need.
+
+File layout: ``MAGIC``, a uint32 header length, a JSON table of contents
+(section name -> offset, item count, array typecode) and 8-byte aligned
+sections. ``Snapshot`` maps the file read-only and exposes every section as a
+zero-copy ``memoryview``; strings are decoded on first use only.
+
+Build one with ``make snapshot`` or ``python -m graph_core.snapshot --input ...``.
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+MAGIC = b"MSNP0001"
+DEFAULT_SNAPSHOT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "meetings.snap"
+)
+
+MISSING = 0xFFFFFFFF
+TOK_DICT = 0xFFFFFFF0
+TOK_LIST = 0xFFFFFFF1
+TOK_LEAF = 0xFFFFFFF2
+
+_MEETING_COLUMNS = ("workgroup", "workgroup_id", "type", "host", "documenter", "date_str")
+
+
+def parse_date(value: Any) -> int:
+    """Encode a ``YYYY-MM-DD...`` string as the integer YYYYMMDD (0 if unparseable)."""
+    if not isinstance(value, str) or len(value) < 10:
+        return 0
+    try:
+        return int(datetime.strptime(value[:10], "%Y-%m-%d").strftime("%Y%m%d"))
+    except ValueError:
+        return 0
+
+
+def split_names(value: Any) -> List[str]:
+    if not isinstance(value, str):
+        return []
+    return [p.strip() for p in value.split(",") if p.strip()]
+
+
+def normalize_participants(meeting_info: Dict[str, Any]) -> List[str]:
+    """peoplePresent plus host and documenter, deduped in order (as in unified_analysis)."""
+    participants = split_names(meeting_info.get("peoplePresent", ""))
+    for key in ("host", "documenter"):
+        val = meeting_info.get(key)
+        if isinstance(val, str) and val.strip():
+            participants.append(val.strip())
+    seen = set()
+    return [p for p in participants if not (p in seen or seen.add(p))]
+
+
+# ---------------- Writer ----------------
+
+class _SnapshotWriter:
+    def __init__(self) -> None:
+        self.strings: Dict[str, int] = {}
+        self.blob = bytearray()
+        self.str_off = array("I", [0])
+        self.columns = {name: array("I") for name in _MEETING_COLUMNS}
+        self.date = array("i")
+        self.lists = {
+            name: (array("I", [0]), array("I"))
+            for name in ("part", "att", "topic", "emo", "doc", "agenda", "shape")
+        }
+        self.agenda_lists = {name: (array("I", [0]), array("I")) for name in ("act", "dec")}
+        self.count = 0
+
+    def intern(self, value: Any) -> int:
+        if not isinstance(value, str):
+            return MISSING
+        sid = self.strings.get(value)
+        if sid is None:
+            sid = len(self.strings)
+            self.strings[value] = sid
+            self.blob += value.encode("utf-8")
+            self.str_off.append(len(self.blob))
+        return sid
+
+    def _push(self, name: str, values: Iterable[int], table: Optional[Dict] = None) -> None:
+        off, vals = (table or self.lists)[name]
+        vals.extend(values)
+        off.append(len(vals))
+
+    def _shape(self, obj: Any, out: array) -> None:
+        """Pre-order tokens: ``DICT n key_1..key_n value_1..value_n``, ``LIST n values``, ``LEAF``."""
+        stack = [obj]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, dict):
+                out.append(TOK_DICT)
+                out.append(len(item))
+                out.extend(self.intern(k) for k in item)
+                stack.extend(reversed(list(item.values())))
+            elif isinstance(item, list):
+                out.append(TOK_LIST)
+                out.append(len(item))
+                stack.extend(reversed(item))
+            else:
+                out.append(TOK_LEAF)
+
+    def add(self, record: Any) -> None:
+        rec = record if isinstance(record, dict) else {}
+        info = rec.get("meetingInfo") or {}
+        if not isinstance(info, dict):
+            info = {}
+        tags = rec.get("tags") or {}
+        if not isinstance(tags, dict):
+            tags = {}
+
+        for name, value in zip(
+            _MEETING_COLUMNS,
+            (
+                rec.get("workgroup"),
+                rec.get("workgroup_id"),
+                info.get("typeOfMeeting"),
+                info.get("host"),
+                info.get("documenter"),
+                info.get("date"),
+            ),
+        ):
+            self.columns[name].append(self.intern(value))
+        self.date.append(parse_date(info.get("date")))
+
+        self._push("part", (self.intern(p) for p in normalize_participants(info)))
+        self._push("att", (self.intern(p) for p in split_names(info.get("peoplePresent", ""))))
+        self._push("topic", (self.intern(t) for t in split_names(tags.get("topicsCovered", ""))))
+        self._push("emo", (self.intern(t) for t in split_names(tags.get("emotions", ""))))
+
+        docs: List[int] = []
+        for doc in info.get("workingDocs") or []:
+            if isinstance(doc, dict):
+                docs.extend((self.intern(doc.get("title")), self.intern(doc.get("link"))))
+        self._push("doc", docs)
+
+        statuses: List[int] = []
+        for agenda in rec.get("agendaItems") or []:
+            if not isinstance(agenda, dict):
+                continue
+            statuses.append(self.intern(agenda.get("status")))
+            actions: List[int] = []
+            for a in agenda.get("actionItems") or []:
+                if isinstance(a, dict):
+                    actions.extend((self.intern(a.get("text")), self.intern(a.get("assignee")), self.intern(a.get("dueDate"))))
+            self._push("act", actions, self.agenda_lists)
+            decisions: List[int] = []
+            for d in agenda.get("decisionItems") or []:
+                if isinstance(d, dict):
+                    decisions.extend((self.intern(d.get("decision")), self.intern(d.get("effect")), self.intern(d.get("rationale"))))
+            self._push("dec", decisions, self.agenda_lists)
+        self._push("agenda", statuses)
+
+        shape = array("I")
+        self._shape(record, shape)
+        self._push("shape", shape)
+        self.count += 1
+
+    def sections(self) -> List[Tuple[str, Any, str]]:
+        out: List[Tuple[str, Any, str]] = [("str_off", self.str_off, "I"), ("str_blob", self.blob, "B")]
+        out += [(f"m_{name}", col, "I") for name, col in self.columns.items()]
+        out.append(("m_date", self.date, "i"))
+        for name, (off, vals) in list(self.lists.items()) + list(self.agenda_lists.items()):
+            out += [(f"{name}_off", off, "I"), (f"{name}_vals", vals, "I")]
+        return out
+
+    def write(self, path: str, meta: Dict[str, Any]) -> None:
+        sections = self.sections()
+        toc: Dict[str, Any] = {"meta": meta, "byteorder": sys.byteorder, "sections": {}}
+        # Lay out sections after a header whose size depends on the TOC itself;
+        # reserve generously and pad the TOC to the reserved size.
+        reserved = 4096 + 64 * len(sections)
+        offset = len(MAGIC) + 4 + reserved
+        payloads = []
+        for name, data, code in sections:
+            raw = bytes(data) if code == "B" else data.tobytes()
+            offset = (offset + 7) & ~7
+            toc["sections"][name] = [offset, len(data), code]
+            payloads.append((offset, raw))
+            offset += len(raw)
+        header = json.dumps(toc).encode("utf-8")
+        if len(header) > reserved:
+            raise ValueError("Snapshot table of contents too large")
+        header = header.ljust(reserved, b" ")
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<I", reserved))
+            f.write(header)
+            for off, raw in payloads:
+                f.write(b"\0" * (off - f.tell()))
+                f.write(raw)
+        os.replace(tmp_path, path)
+
+
+def build_snapshot(records: Any, path: str = DEFAULT_SNAPSHOT, sources: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Write a snapshot of ``records`` (a list or any record stream) to ``path``."""
+    writer = _SnapshotWriter()
+    for rec in records:
+        writer.add(rec)
+    meta = {
+        "records": writer.count,
+        "strings": len(writer.strings),
+        "is_array": bool(getattr(records, "is_array", isinstance(records, list))),
+        "sources": sources or [],
+        "built_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    writer.write(path, meta)
+    return meta
+
+
+# ---------------- Reader ----------------
+
+class Snapshot:
+    """Read-only, memory-mapped view of a snapshot file."""
+
+    def __init__(self, path: str = DEFAULT_SNAPSHOT) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a meeting snapshot (bad magic)")
+        (reserved,) = struct.unpack_from("<I", self._mm, len(MAGIC))
+        start = len(MAGIC) + 4
+        toc = json.loads(bytes(self._mm[start : start + reserved]))
+        if toc["byteorder"] != sys.byteorder:
+            self.close()
+            raise ValueError(f"{path} was built on a {toc['byteorder']}-endian machine; rebuild it")
+        self.meta: Dict[str, Any] = toc["meta"]
+        self.is_array: bool = self.meta.get("is_array", True)
+        base = memoryview(self._mm)
+        self._views: Dict[str, memoryview] = {}
+        for name, (off, count, code) in toc["sections"].items():
+            size = count * array(code).itemsize
+            self._views[name] = base[off : off + size].cast(code)
+        base.release()
+        self._strings: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._views["m_date"])
+
+    # -- strings --
+
+    def string(self, sid: int) -> Optional[str]:
+        if sid == MISSING:
+            return None
+        s = self._strings.get(sid)
+        if s is None:
+            off = self._views["str_off"]
+            s = str(self._views["str_blob"][off[sid] : off[sid + 1]], "utf-8")
+            self._strings[sid] = s
+        return s
+
+    def strings(self, ids: Iterable[int]) -> List[str]:
+        return [self.string(i) for i in ids]
+
+    # -- columns and lists --
+
+    def column(self, name: str) -> memoryview:
+        """Per-meeting string IDs (``workgroup``, ``host``, ...) or ``date`` as YYYYMMDD."""
+        return self._views[f"m_{name}"]
+
+    def _slice(self, name: str, i: int) -> memoryview:
+        off = self._views[f"{name}_off"]
+        return self._views[f"{name}_vals"][off[i] : off[i + 1]]
+
+    def participant_ids(self, m: int) -> memoryview:
+        return self._slice("part", m)
+
+    def participant_arrays(self) -> Tuple[memoryview, memoryview]:
+        """CSR-style participant lists of all meetings: (offsets, string IDs)."""
+        return self._views["part_off"], self._views["part_vals"]
+
+    def participants(self, m: int) -> List[str]:
+        return self.strings(self.participant_ids(m))
+
+    def attendee_ids(self, m: int) -> memoryview:
+        return self._slice("att", m)
+
+    def topic_ids(self, m: int) -> memoryview:
+        return self._slice("topic", m)
+
+    def emotion_ids(self, m: int) -> memoryview:
+        return self._slice("emo", m)
+
+    # -- structure (paths and field co-occurrence) --
+
+    def _walk(self, m: int, prefix: str, paths: Optional[List[str]], field_sets: Optional[List[List[str]]]) -> None:
+        tok = self._slice("shape", m)
+        pos = 0
+        # Frames: [children left, kind, path, child index, position of the key IDs]
+        stack: List[List[Any]] = []
+
+        def enter(path: str) -> None:
+            nonlocal pos
+            t = tok[pos]
+            if t == TOK_DICT:
+                n = tok[pos + 1]
+                if field_sets is not None and n > 1:
+                    field_sets.append(self.strings(tok[pos + 2 : pos + 2 + n]))
+                stack.append([n, TOK_DICT, path, 0, pos + 2])
+                pos += 2 + n
+            elif t == TOK_LIST:
+                stack.append([tok[pos + 1], TOK_LIST, path, 0, 0])
+                pos += 2
+            else:
+                pos += 1
+
+        enter(prefix)
+        while stack:
+            frame = stack[-1]
+            if frame[0] == 0:
+                stack.pop()
+                continue
+            frame[0] -= 1
+            if frame[1] == TOK_DICT:
+                key = self.string(tok[frame[4] + frame[3]])
+                path = f"{frame[2]}.{key}" if frame[2] else key
+            else:
+                path = f"{frame[2]}[{frame[3]}]"
+            frame[3] += 1
+            if paths is not None:
+                paths.append(path)
+            enter(path)
+
+    def paths(self, m: int, prefix: str = "") -> List[str]:
+        """JSON paths of record ``m`` in ``extract_json_paths`` order."""
+        out: List[str] = []
+        self._walk(m, prefix, out, None)
+        return out
+
+    def field_sets(self, m: int) -> List[List[str]]:
+        """Co-occurring keys of record ``m`` in ``find_field_combinations`` order."""
+        out: List[List[str]] = []
+        self._walk(m, "", None, out)
+        return out
+
+    def skeleton(self, m: int) -> Any:
+        """Rebuild record ``m`` as nested dicts/lists with ``None`` leaves (keys only)."""
+        return self._build_skeleton(self._slice("shape", m), 0)[0]
+
+    def _build_skeleton(self, tok: memoryview, pos: int) -> Tuple[Any, int]:
+        t = tok[pos]
+        if t == TOK_DICT:
+            n = tok[pos + 1]
+            keys = self.strings(tok[pos + 2 : pos + 2 + n])
+            pos += 2 + n
+            obj = {}
+            for key in keys:
+                obj[key], pos = self._build_skeleton(tok, pos)
+            return obj, pos
+        if t == TOK_LIST:
+            n = tok[pos + 1]
+            pos += 2
+            items = []
+            for _ in range(n):
+                item, pos = self._build_skeleton(tok, pos)
+                items.append(item)
+            return items, pos
+        return None, pos + 1
+
+    def iter_skeletons(self) -> Iterator[Any]:
+        """Key-only records for analyses that only look at JSON structure."""
+        for m in range(len(self)):
+            yield self.skeleton(m)
+
+    def __iter__(self) -> Iterator[Any]:
+        # Iterating a snapshot behaves like a RecordStream of key-only records.
+        return self.iter_skeletons()
+
+    # -- normalized records --
+
+    def record(self, m: int) -> Dict[str, Any]:
+        """Normalized meeting record with the fields the graph exports read."""
+        s = self.string
+        rec: Dict[str, Any] = {}
+        info: Dict[str, Any] = {}
+
+        def put(d: Dict[str, Any], key: str, sid: int) -> None:
+            if sid != MISSING:
+                d[key] = s(sid)
+
+        put(rec, "workgroup", self.column("workgroup")[m])
+        put(rec, "workgroup_id", self.column("workgroup_id")[m])
+        put(info, "typeOfMeeting", self.column("type")[m])
+        put(info, "date", self.column("date_str")[m])
+        put(info, "host", self.column("host")[m])
+        put(info, "documenter", self.column("documenter")[m])
+        info["peoplePresent"] = ", ".join(self.strings(self.attendee_ids(m)))
+        docs = self._slice("doc", m)
+        info["workingDocs"] = [
+            {k: v for k, v in (("title", s(docs[j])), ("link", s(docs[j + 1]))) if v is not None}
+            for j in range(0, len(docs), 2)
+        ]
+        rec["meetingInfo"] = info
+
+        agenda_off = self._views["agenda_off"]
+        statuses = self._slice("agenda", m)
+        items = []
+        for a, status in enumerate(statuses, start=agenda_off[m]):
+            acts = self._slice("act", a)
+            decs = self._slice("dec", a)
+            item: Dict[str, Any] = {}
+            put(item, "status", status)
+            item["actionItems"] = [
+                {k: v for k, v in zip(("text", "assignee", "dueDate"), self.strings(acts[j : j + 3])) if v is not None}
+                for j in range(0, len(acts), 3)
+            ]
+            item["decisionItems"] = [
+                {k: v for k, v in zip(("decision", "effect", "rationale"), self.strings(decs[j : j + 3])) if v is not None}
+                for j in range(0, len(decs), 3)
+            ]
+            items.append(item)
+        rec["agendaItems"] = items
+        rec["tags"] = {
+            "topicsCovered": ", ".join(self.strings(self.topic_ids(m))),
+            "emotions": ", ".join(self.strings(self.emotion_ids(m))),
+        }
+        return rec
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        for m in range(len(self)):
+            yield self.record(m)
+
+    def close(self) -> None:
+        for view in getattr(self, "_views", {}).values():
+            view.release()
+        self._views = {}
+        if getattr(self, "_mm", None) is not None:
+            try:
+                self._mm.close()
+            except BufferError:
+                # A caller still holds a view (e.g. from column()); the mapping
+                # is released when that view is garbage-collected.
+                pass
+            self._mm = None
+        self._file.close()
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def open_structure(source: str, snapshot: Optional[str] = None, **kwargs: Any) -> Any:
+    """Records for analyses that only need JSON structure (paths, field co-occurrence).
+
+    Reads key-only records from ``snapshot`` (default: ``$GRAPH_SNAPSHOT``) when
+    one is given, otherwise streams ``source`` with ``open_records``.
+    """
+    from graph_core.stream import open_records
+
+    snapshot = snapshot or os.environ.get("GRAPH_SNAPSHOT")
+    if snapshot:
+        print(f"📦 Reading meeting structure from snapshot {snapshot}")
+        return Snapshot(snapshot)
+    return open_records(source, **kwargs)
+
+
+def main() -> None:
+    from graph_core.sources import DEFAULT_WORKERS, expand_sources, open_sources, print_source_report
+
+    parser = argparse.ArgumentParser(description="Build a binary snapshot of normalized meetings")
+    parser.add_argument(
+        "--input",
+        nargs="+",
+        default=["2025"],
+        help="Sources: local paths, URLs, years/year ranges or @manifest (see graph_core/sources.py)",
+    )
+    parser.add_argument("--output", default=DEFAULT_SNAPSHOT, help="Snapshot output path")
+    parser.add_argument("--source-template", default=None, help="URL template used to expand years")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent source fetches")
+    parser.add_argument("--offline", action="store_true", default=None, help="Use only the local HTTP cache")
+    args = parser.parse_args()
+
+    sources = expand_sources(args.input, args.source_template)
+    with open_sources(sources, workers=args.workers, offline=args.offline) as records:
+        meta = build_snapshot(records, args.output, sources=sources)
+    print_source_report(records)
+    size = os.path.getsize(args.output)
+    print(f"✅ Snapshot with {meta['records']} meetings and {meta['strings']} strings written to {args.output} ({size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
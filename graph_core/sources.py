@@ -0,0 +1,238 @@
+"""
+Multi-source input for the analysis scripts.
+
+``--input`` may name several sources at once:
+- a URL or a local file path,
+- a year or year range such as ``2024`` or ``2023-2025``, expanded with
+  ``SOURCE_TEMPLATE`` (override with ``--source-template`` or
+  ``GRAPH_SOURCE_TEMPLATE``),
+- ``@manifest.txt``: a file listing one source per line (``#`` starts a comment;
+  relative paths are resolved against the manifest's directory).
+
+URLs are fetched concurrently by a bounded thread pool that shares a single
+keep-alive ``requests.Session``; its connection pool caps the number of
+simultaneous connections per host. Records from every source are merged into
+one stream in the order the sources were given, and the first source can be
+analysed while the others are still downloading. With the cache disabled,
+each response body is parsed as it arrives (``RecordStream`` over
+``resp.raw``), so memory does not grow with the file size; the pool then
+only opens the connections ahead of time and each body is read in turn.
+"""
+
+import os
+import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from graph_core.fetch import DEFAULT_TIMEOUT, cache_enabled, fetch_entry, is_url, record_download
+from graph_core.stream import RecordStream
+
+
+SOURCE_TEMPLATE = (
+    "https://raw.githubusercontent.com/SingularityNET-Archive/"
+    "SingularityNET-Archive/refs/heads/main/Data/Snet-Ambassador-Program/"
+    "Meeting-Summaries/{year}/meeting-summaries-array.json"
+)
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_PER_HOST = 4
+
+_YEAR_RANGE = re.compile(r"^(\d{4})(?:-(\d{4}))?$")
+
+
+def resolve_template(template: Optional[str] = None) -> str:
+    return template or os.environ.get("GRAPH_SOURCE_TEMPLATE") or SOURCE_TEMPLATE
+
+
+def read_manifest(path: str) -> List[str]:
+    """Read one source per line from a manifest file."""
+    base = os.path.dirname(os.path.abspath(path))
+    specs: List[str] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            spec = line.split("#", 1)[0].strip()
+            if not spec:
+                continue
+            if not (is_url(spec) or _YEAR_RANGE.match(spec) or spec.startswith("@") or os.path.isabs(spec)):
+                spec = os.path.join(base, spec)
+            specs.append(spec)
+    return specs
+
+
+def expand_sources(specs: Iterable[str], template: Optional[str] = None) -> List[str]:
+    """Expand URLs, paths, year ranges and ``@manifest`` entries into a de-duplicated source list."""
+    template = resolve_template(template)
+    sources: List[str] = []
+    for spec in specs:
+        spec = spec.strip()
+        if not spec:
+            continue
+        if spec.startswith("@"):
+            sources.extend(expand_sources(read_manifest(spec[1:]), template))
+            continue
+        m = _YEAR_RANGE.match(spec)
+        if m and not os.path.exists(spec):
+            start = int(m.group(1))
+            end = int(m.group(2) or start)
+            if end < start:
+                raise ValueError(f"Invalid year range: {spec}")
+            sources.extend(template.format(year=year) for year in range(start, end + 1))
+        else:
+            sources.append(spec)
+    seen = set()
+    return [s for s in sources if not (s in seen or seen.add(s))]
+
+
+def make_session(max_per_host: int = DEFAULT_MAX_PER_HOST) -> requests.Session:
+    """Create a keep-alive session allowing at most ``max_per_host`` connections per host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=max_per_host, pool_block=True)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _fetch_one(
+    source: str,
+    session: requests.Session,
+    cache_dir: Optional[str],
+    offline: Optional[bool],
+    use_cache: Optional[bool],
+    timeout: float,
+) -> Dict[str, Any]:
+    start = time.perf_counter()
+    if not is_url(source):
+        info = {"source": source, "status": "local", "path": source, "response": None, "bytes": os.path.getsize(source)}
+    elif cache_enabled(use_cache):
+        entry = fetch_entry(source, session=session, cache_dir=cache_dir, offline=offline, timeout=timeout)
+        info = {"source": source, "status": entry["status"], "path": entry["path"], "response": None, "bytes": entry["size"]}
+    else:
+        # Only the headers are read here; the body is parsed as it arrives (see module docstring).
+        resp = session.get(source, stream=True, timeout=timeout)
+        try:
+            resp.raise_for_status()
+        except requests.HTTPError:
+            resp.close()
+            raise
+        resp.raw.decode_content = True
+        info = {"source": source, "status": "stream", "path": None, "response": resp, "bytes": 0, "started": start}
+    info["seconds"] = time.perf_counter() - start
+    return info
+
+
+class MultiRecordStream:
+    """Fetch several sources concurrently and iterate their records as one stream.
+
+    ``is_array`` follows ``RecordStream``: it is True when the merged input
+    behaves like one top-level array (always, for more than one source).
+    After iteration, ``results`` holds per-source timing and record counts.
+    """
+
+    def __init__(
+        self,
+        sources: List[str],
+        workers: int = DEFAULT_WORKERS,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+        session: Optional[requests.Session] = None,
+        cache_dir: Optional[str] = None,
+        offline: Optional[bool] = None,
+        use_cache: Optional[bool] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        if not sources:
+            raise ValueError("No input sources given")
+        self.sources = sources
+        self.workers = max(1, min(workers, len(sources)))
+        self.results: List[Dict[str, Any]] = []
+        self._own_session = session is None
+        self._session = session or make_session(max_per_host)
+        self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        self._futures: List[Future] = [
+            self._pool.submit(_fetch_one, s, self._session, cache_dir, offline, use_cache, timeout)
+            for s in sources
+        ]
+        self._current: Optional[RecordStream] = None
+        self._started = False
+        try:
+            self._first = self._open(self._futures[0].result())
+        except BaseException:
+            self.close()
+            raise
+        self.is_array = len(sources) > 1 or self._first[1].is_array
+
+    def _open(self, info: Dict[str, Any]) -> Any:
+        resp = info.pop("response", None)
+        if resp is not None:
+            info["raw"] = resp.raw
+            return info, RecordStream(resp.raw, on_close=resp.close)
+        fp = open(info["path"], "rb")
+        return info, RecordStream(fp, on_close=fp.close)
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._started:
+            raise RuntimeError("MultiRecordStream can only be iterated once")
+        self._started = True
+        for i, future in enumerate(self._futures):
+            info, stream = self._first if i == 0 else self._open(future.result())
+            self._current = stream
+            with stream:
+                yield from stream
+                if "started" in info:
+                    # Streamed bodies are downloaded while they are parsed: count both.
+                    info["bytes"] = info.pop("raw").tell()
+                    info["seconds"] = time.perf_counter() - info.pop("started")
+                    record_download(info["bytes"])
+            info["records"] = stream.records_read
+            self.results.append(info)
+        self._current = None
+
+    def close(self) -> None:
+        first = getattr(self, "_first", None)
+        if first is not None and not self._started:
+            first[1].close()
+        if self._current is not None:
+            self._current.close()
+            self._current = None
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        for future in self._futures:
+            # Responses opened ahead of time but never read.
+            if future.done() and not future.cancelled() and future.exception() is None:
+                resp = future.result().pop("response", None)
+                if resp is not None:
+                    resp.close()
+        if self._own_session:
+            self._session.close()
+
+    def __enter__(self) -> "MultiRecordStream":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def open_sources(specs: Iterable[str], template: Optional[str] = None, **kwargs: Any) -> MultiRecordStream:
+    """Expand ``specs`` and open them as one merged record stream."""
+    return MultiRecordStream(expand_sources(specs, template), **kwargs)
+
+
+def format_source_report(results: List[Dict[str, Any]]) -> List[str]:
+    """One line per source: status, size, fetch latency, throughput and record count."""
+    lines = []
+    for info in results:
+        seconds = info.get("seconds", 0.0)
+        transferred = info["status"] in ("miss", "stream")
+        throughput = f"{info['bytes'] / seconds / 1e6:.2f} MB/s" if transferred and seconds > 0 else "-"
+        lines.append(
+            f"- {info['source']} | {info['status']} | {info['bytes']:,} bytes | "
+            f"{seconds * 1000:.0f} ms | {throughput} | {info.get('records', 0)} records"
+        )
+    return lines
+
+
+def print_source_report(stream: MultiRecordStream) -> None:
+    print(f"📥 Read {len(stream.results)} source(s) with {stream.workers} fetch worker(s):")
+    for line in format_source_report(stream.results):
+        print(line)
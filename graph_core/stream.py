@@ -0,0 +1,185 @@
+"""
+Incremental reader for the meeting-summaries array.
+
+``json.load`` builds the whole document before any record can be analysed.
+``RecordStream`` instead reads the source in chunks and decodes one element of
+the top-level array at a time with ``json.JSONDecoder.raw_decode``, so peak
+memory depends on the largest record rather than on the size of the file.
+
+A top-level object is yielded as a single record and a top-level scalar yields
+nothing.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, BinaryIO, Callable, Iterator, Optional
+
+import requests
+
+from graph_core.fetch import DEFAULT_TIMEOUT, cache_enabled, fetch_to_path, is_url
+
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class RecordStream:
+    """Iterate the records of a JSON document without materializing it.
+
+    ``fp`` may be a binary or text file-like object. ``is_array`` tells whether
+    the document's top level is an array; it is known as soon as the stream is
+    constructed, before iteration starts.
+    """
+
+    def __init__(
+        self,
+        fp: Any,
+        chunk_size: int = CHUNK_SIZE,
+        on_close: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._on_close = on_close
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._started = False
+        self.records_read = 0
+
+        first = self._peek()
+        self.is_array = first == "["
+        self.is_object = first == "{"
+        if self.is_array:
+            self._pos += 1
+
+    # -- buffer management --
+
+    def _fill(self, size: int) -> None:
+        if self._pos:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        chunk = self._fp.read(size)
+        if not chunk:
+            if isinstance(chunk, bytes):
+                self._buf += self._text_decoder.decode(b"", final=True)
+            self._eof = True
+            return
+        if isinstance(chunk, bytes):
+            chunk = self._text_decoder.decode(chunk)
+        self._buf += chunk
+
+    def _peek(self) -> Optional[str]:
+        """Skip whitespace and return the next character (None at end of input)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if self._eof:
+                return None
+            self._fill(self._chunk_size)
+
+    def _decode_value(self) -> Any:
+        """Decode the value starting at the cursor, reading more input as needed.
+
+        Each failed attempt at least doubles the buffer, so a record of size R
+        costs O(R) decode work overall.
+        """
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            else:
+                # A value that ends exactly at the buffer edge may be a truncated
+                # number or literal; only trust it once more input (or EOF) follows.
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            self._fill(max(self._chunk_size, len(self._buf) - self._pos))
+
+    # -- iteration --
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._started:
+            raise RuntimeError("RecordStream can only be iterated once")
+        self._started = True
+        if self.is_object:
+            self.records_read = 1
+            yield self._decode_value()
+            return
+        if not self.is_array:
+            return
+        first = True
+        while True:
+            c = self._peek()
+            if c is None:
+                raise ValueError("Unterminated JSON array: missing ']'")
+            if c == "]":
+                self._pos += 1
+                return
+            if not first:
+                if c != ",":
+                    raise ValueError(f"Expected ',' or ']' in JSON array, found {c!r}")
+                self._pos += 1
+                self._peek()
+            first = False
+            record = self._decode_value()
+            self.records_read += 1
+            yield record
+
+    def close(self) -> None:
+        if self._on_close is not None:
+            self._on_close()
+            self._on_close = None
+
+    def __enter__(self) -> "RecordStream":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def iter_json_array(fp: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """Yield the elements of the top-level JSON array in ``fp`` one at a time."""
+    yield from RecordStream(fp, chunk_size=chunk_size)
+
+
+def open_records(
+    source: str,
+    session: Optional[requests.Session] = None,
+    cache_dir: Optional[str] = None,
+    offline: Optional[bool] = None,
+    use_cache: Optional[bool] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    chunk_size: int = CHUNK_SIZE,
+) -> RecordStream:
+    """Open a local file or URL as a ``RecordStream``.
+
+    URLs go through the on-disk cache (and are then streamed from the cached
+    file) unless caching is disabled, in which case the HTTP response body is
+    parsed as it arrives.
+    """
+    if not is_url(source):
+        fp = open(source, "rb")
+        return RecordStream(fp, chunk_size=chunk_size, on_close=fp.close)
+
+    if cache_enabled(use_cache):
+        path = fetch_to_path(source, session=session, cache_dir=cache_dir, offline=offline, timeout=timeout)
+        fp = open(path, "rb")
+        return RecordStream(fp, chunk_size=chunk_size, on_close=fp.close)
+
+    getter = session.get if session is not None else requests.get
+    resp = getter(source, stream=True, timeout=timeout)
+    resp.raise_for_status()
+    resp.raw.decode_content = True
+    return RecordStream(resp.raw, chunk_size=chunk_size, on_close=resp.close)
+
+
+def iter_records(source: str, **kwargs: Any) -> Iterator[Any]:
+    """Yield meeting records from a local file or URL, closing the source when done."""
+    with open_records(source, **kwargs) as records:
+        yield from records
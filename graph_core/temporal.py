@@ -0,0 +1,233 @@
+"""
+Co-attendance metrics over time windows, slid by adding and subtracting meetings.
+
+The co-attendance graph flattens every meeting of the input into one static
+graph. ``temporal_series`` instead reports, per weekly, monthly or
+rolling N-day window of ``meetingInfo.date``, the people and edges present,
+the density, the number of connected components and the degree leaders.
+
+Windows are not rebuilt one by one. Meetings are sorted by day and
+``SlidingCoAttendance`` keeps the pair counts of the current window: moving to
+the next window adds the pairs of the meetings that enter it and subtracts the
+pairs of those that leave, as ``graph_core/incremental.py`` does for edited
+records. Degrees and the edge count change only when a pair count moves
+between 0 and 1, so they are updated in the same step; every meeting is added
+and removed at most once over the whole series, and a window that shares no
+meeting with the previous one starts empty instead of subtracting all of them.
+Overlapping rolling windows thus cost the pairs that changed, not the pairs of
+the whole window.
+
+A union-find cannot split, so components are counted with a fresh
+``DisjointSet`` over the participant lists of the meetings in the window,
+which is linear in attendance rather than in pairs. Meetings without a
+parseable date are left out of the series and counted.
+"""
+
+import heapq
+import time
+from collections import deque
+from datetime import date, timedelta
+from itertools import combinations
+from operator import itemgetter
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from graph_core.components import DisjointSet
+from graph_core.snapshot import normalize_participants, parse_date
+from graph_core.visitor import Collector
+
+WINDOW_KINDS = ("weekly", "monthly", "rolling")
+DEFAULT_WINDOW_DAYS = 28
+DEFAULT_WINDOW_STEP = 7
+
+# (day ordinal, participants) for one meeting.
+Meeting = Tuple[int, List[str]]
+
+
+def day_ordinal(yyyymmdd: int) -> Optional[int]:
+    """``date.toordinal()`` of a ``parse_date`` value, or ``None`` for 0 (no date)."""
+    if not yyyymmdd:
+        return None
+    return date(yyyymmdd // 10000, yyyymmdd // 100 % 100, yyyymmdd % 100).toordinal()
+
+
+class TimelineCollector(Collector):
+    """Meeting day and participants of each record; records without a date are only counted."""
+
+    def __init__(self) -> None:
+        self.meetings: List[Meeting] = []
+        # Record index of each dated meeting, to interleave timelines of separate shards.
+        self.positions: List[int] = []
+        self.undated = 0
+
+    def add(self, day: Optional[int], participants: List[str], index: int = -1) -> None:
+        if day is None:
+            self.undated += 1
+        else:
+            self.meetings.append((day, participants))
+            self.positions.append(index)
+
+    def on_record(self, index: int, record: Any) -> None:
+        meeting_info = (record.get("meetingInfo", {}) or {}) if isinstance(record, dict) else {}
+        self.add(day_ordinal(parse_date(meeting_info.get("date"))), normalize_participants(meeting_info), index)
+
+    def tap(self, records: Iterable[Any]) -> Iterator[Any]:
+        """Yield ``records`` unchanged, collecting each one on the way (for consumers other than ``visit_records``)."""
+        for index, record in enumerate(records):
+            self.on_record(index, record)
+            yield record
+
+
+def iter_windows(
+    first: int, last: int, kind: str, days: int = DEFAULT_WINDOW_DAYS, step: int = DEFAULT_WINDOW_STEP
+) -> Iterator[Tuple[str, int, int]]:
+    """``(label, start, end)`` day ordinals (inclusive) of every window covering ``first``..``last``.
+
+    ``weekly``: ISO weeks (Monday to Sunday); ``monthly``: calendar months;
+    ``rolling``: ``days``-long windows whose end advances by ``step`` days, the
+    first ending ``days - 1`` days after ``first`` and the last on or after ``last``.
+    """
+    if kind == "weekly":
+        start = first - date.fromordinal(first).weekday()
+        while start <= last:
+            year, week, _ = date.fromordinal(start).isocalendar()
+            yield f"{year}-W{week:02d}", start, start + 6
+            start += 7
+    elif kind == "monthly":
+        month = date.fromordinal(first).replace(day=1)
+        while month.toordinal() <= last:
+            following = (month + timedelta(days=32)).replace(day=1)
+            yield f"{month:%Y-%m}", month.toordinal(), following.toordinal() - 1
+            month = following
+    elif kind == "rolling":
+        if days < 1 or step < 1:
+            raise ValueError("Rolling windows need days >= 1 and step >= 1")
+        end = min(first + days - 1, last)
+        while True:
+            yield f"{date.fromordinal(end):%Y-%m-%d}", end - days + 1, end
+            if end >= last:
+                break
+            end += step
+    else:
+        raise ValueError(f"Unknown window kind: {kind} (expected one of {', '.join(WINDOW_KINDS)})")
+
+
+class SlidingCoAttendance:
+    """Co-attendance pair counts, degrees and edge count of the meetings currently in a window."""
+
+    def __init__(self) -> None:
+        self.pair_updates = 0
+        self.clear()
+
+    def clear(self) -> None:
+        """Empty the window (cheaper than removing every meeting when consecutive windows do not overlap)."""
+        self.meetings: Dict[str, int] = {}
+        self.pairs: Dict[Tuple[str, str], int] = {}
+        self.degree: Dict[str, int] = {}
+        self.edges = 0
+        # Pairs of the meetings in the window, i.e. what rebuilding it from scratch would cost.
+        self.meeting_pairs = 0
+
+    def _apply(self, participants: Sequence[str], sign: int) -> None:
+        if len(participants) < 2:
+            return
+        for p in participants:
+            n = self.meetings.get(p, 0) + sign
+            if n:
+                self.meetings[p] = n
+            else:
+                del self.meetings[p]
+        k = len(participants)
+        self.meeting_pairs += sign * k * (k - 1) // 2
+        self.pair_updates += k * (k - 1) // 2
+        pairs, degree = self.pairs, self.degree
+        for u, v in combinations(participants, 2):
+            key = (u, v) if u < v else (v, u)
+            n = pairs.get(key, 0) + sign
+            if n:
+                pairs[key] = n
+                if n == 1 and sign > 0:
+                    degree[u] = degree.get(u, 0) + 1
+                    degree[v] = degree.get(v, 0) + 1
+                    self.edges += 1
+                continue
+            del pairs[key]
+            for p in (u, v):
+                if degree[p] == 1:
+                    del degree[p]
+                else:
+                    degree[p] -= 1
+            self.edges -= 1
+
+    def add(self, participants: Sequence[str]) -> None:
+        self._apply(participants, 1)
+
+    def remove(self, participants: Sequence[str]) -> None:
+        self._apply(participants, -1)
+
+
+def temporal_series(
+    meetings: Iterable[Meeting],
+    kind: str = "monthly",
+    days: int = DEFAULT_WINDOW_DAYS,
+    step: int = DEFAULT_WINDOW_STEP,
+    top: int = 3,
+    undated: int = 0,
+) -> Dict[str, Any]:
+    """Per-window co-attendance metrics of dated ``meetings`` (see module docstring)."""
+    start_time = time.perf_counter()
+    ordered = sorted(meetings, key=itemgetter(0))
+    window = SlidingCoAttendance()
+    active: Deque[Meeting] = deque()
+    series: List[Dict[str, Any]] = []
+    rebuild_pairs = 0
+    entering = 0
+    if ordered:
+        for label, start, end in iter_windows(ordered[0][0], ordered[-1][0], kind, days, step):
+            if active and active[-1][0] < start:
+                active.clear()
+                window.clear()
+            while active and active[0][0] < start:
+                window.remove(active.popleft()[1])
+            while entering < len(ordered) and ordered[entering][0] <= end:
+                # Rolling windows with step > days skip the meetings between them.
+                if ordered[entering][0] >= start:
+                    window.add(ordered[entering][1])
+                    active.append(ordered[entering])
+                entering += 1
+            components = DisjointSet()
+            for _, participants in active:
+                if len(participants) >= 2:
+                    components.union_all(participants)
+            people = len(window.meetings)
+            rebuild_pairs += window.meeting_pairs
+            series.append(
+                {
+                    "label": label,
+                    "start": date.fromordinal(start).isoformat(),
+                    "end": date.fromordinal(end).isoformat(),
+                    "meetings": len(active),
+                    "people": people,
+                    "edges": window.edges,
+                    "density": 2 * window.edges / (people * (people - 1)) if people > 1 else 0.0,
+                    "components": components.count,
+                    "leaders": heapq.nlargest(top, window.degree.items(), key=itemgetter(1)),
+                }
+            )
+    return {
+        "kind": kind,
+        "days": days,
+        "step": step,
+        "windows": series,
+        "dated_meetings": len(ordered),
+        "undated_meetings": undated,
+        "pair_updates": window.pair_updates,
+        "rebuild_pairs": rebuild_pairs,
+        "seconds": time.perf_counter() - start_time,
+    }
+
+
+def describe_window(series: Dict[str, Any]) -> str:
+    """Human-readable window setting, e.g. ``rolling 28-day windows every 7 days``."""
+    if series["kind"] == "rolling":
+        return f"rolling {series['days']}-day windows every {series['step']} days"
+    return f"{series['kind']} windows"
@@ -0,0 +1,92 @@
+"""
+Triangle counts, clustering coefficients and transitivity from sparse products.
+
+``nx.clustering``, ``nx.average_clustering`` and ``nx.transitivity`` each walk
+every node's neighbour sets in Python. ``triangle_stats`` counts triangles
+once on the SciPy sparse adjacency instead: the number of closed 2-walks
+through node ``u`` is the row sum of ``(A @ A) ∘ A`` (twice the triangles at
+``u``), and the same masked product on ``Ŵ = (W / max w)^(1/3)`` gives the
+weighted (Onnela) triangle sums ``nx.clustering(G, weight=...)`` uses. The
+products run in blocks of rows, so memory stays at one block of ``A @ A``
+even on dense co-attendance graphs, and both products share one loop.
+
+From those counts and the degrees it returns, for every node, the triangle
+count and the unweighted and weighted local clustering, plus both average
+clustering coefficients and the transitivity.
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+import networkx as nx
+import numpy as np
+from scipy import sparse
+
+# Upper bound on the entries of one block of A @ A (rows x nodes).
+BLOCK_ENTRIES = 1 << 24
+
+
+def _without_loops(M: sparse.csr_array) -> sparse.csr_array:
+    if M.diagonal().any():
+        M = (M - sparse.diags_array(M.diagonal())).tocsr()
+        M.eliminate_zeros()
+    return M
+
+
+def _closed_walks(A: sparse.csr_array, W: Optional[sparse.csr_array]) -> tuple:
+    """Row sums of ``(A @ A) ∘ A`` (and of the same on ``W``), block by block."""
+    n = A.shape[0]
+    step = max(1, BLOCK_ENTRIES // max(n, 1))
+    walks = np.zeros(n)
+    weighted = np.zeros(n) if W is not None else None
+    for start in range(0, n, step):
+        stop = min(start + step, n)
+        rows = A[start:stop]
+        walks[start:stop] = np.asarray((rows @ A).multiply(rows).sum(axis=1)).ravel()
+        if W is not None:
+            wrows = W[start:stop]
+            weighted[start:stop] = np.asarray((wrows @ W).multiply(wrows).sum(axis=1)).ravel()
+    return walks, weighted
+
+
+def triangle_stats(G: nx.Graph, weight: Optional[str] = "weight") -> Dict[str, Any]:
+    """Triangles, clustering (unweighted and, with ``weight``, weighted) and transitivity of ``G``.
+
+    Values match ``nx.triangles``, ``nx.clustering(G)``,
+    ``nx.clustering(G, weight=weight)``, ``nx.average_clustering`` (zeros
+    counted) and ``nx.transitivity``; self-loops are ignored, as there.
+    """
+    start = time.perf_counter()
+    nodes = list(G)
+    n = len(nodes)
+    if n == 0:
+        empty: Dict[str, Any] = {"triangles": {}, "clustering": {}, "average_clustering": 0.0, "transitivity": 0.0}
+        if weight is not None:
+            empty.update(weighted_clustering={}, average_weighted_clustering=0.0)
+        empty["seconds"] = 0.0
+        return empty
+    A = _without_loops(nx.to_scipy_sparse_array(G, nodelist=nodes, weight=None, dtype=float, format="csr"))
+    degree = np.diff(A.indptr).astype(float)
+    W = None
+    if weight is not None and A.nnz:
+        W = _without_loops(nx.to_scipy_sparse_array(G, nodelist=nodes, weight=weight, dtype=float, format="csr"))
+        W.data = np.cbrt(W.data / W.data.max())
+    walks, weighted = _closed_walks(A, W)
+    pairs = degree * (degree - 1)
+    local = np.divide(walks, pairs, out=np.zeros(n), where=pairs > 0)
+    stats: Dict[str, Any] = {
+        "triangles": dict(zip(nodes, (walks / 2).round().astype(int).tolist())),
+        "clustering": dict(zip(nodes, local.tolist())),
+        "average_clustering": float(local.mean()),
+        "transitivity": float(walks.sum() / pairs.sum()) if pairs.sum() else 0.0,
+    }
+    if weighted is not None:
+        weighted_local = np.divide(weighted, pairs, out=np.zeros(n), where=pairs > 0)
+        stats["weighted_clustering"] = dict(zip(nodes, weighted_local.tolist()))
+        stats["average_weighted_clustering"] = float(weighted_local.mean())
+    elif weight is not None:
+        # No edges: every coefficient is zero, as in the unweighted case.
+        stats["weighted_clustering"] = dict(stats["clustering"])
+        stats["average_weighted_clustering"] = stats["average_clustering"]
+    stats["seconds"] = time.perf_counter() - start
+    return stats
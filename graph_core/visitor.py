@@ -0,0 +1,302 @@
+"""
+Single-pass traversal of meeting records with pluggable collectors.
+
+The analyses used to walk the same document once each: ``extract_json_paths``,
+``find_field_combinations``, ``extract_participants``, ``find_workgroups`` and
+``infer_schema``. ``visit_records`` walks every record once, depth first in
+document order, and dispatches each node to the registered collectors:
+
+- ``on_record(index, record)`` once per top-level record, before its nodes,
+- ``on_dict(obj, path, key, depth)`` / ``on_list(obj, path, key, depth)`` for
+  containers, ``on_leaf(value, path, key, depth)`` for everything else.
+
+``path`` is the node's JSON path in ``extract_json_paths`` notation, ``key`` is
+the dict key or list index that led to the node (None for the record itself)
+and ``depth`` is 0 for the record. Only hooks a collector overrides are called,
+so a collector that needs records only costs nothing per node.
+
+``iter_json_paths`` and ``iter_field_combinations`` are the equivalent
+stand-alone generators for callers that need just one analysis.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from graph_core.snapshot import normalize_participants
+
+
+class Collector:
+    """Base class for visitor plug-ins; override the hooks you need."""
+
+    #: Set to True once the collector needs no more input; it is then skipped
+    #: for the remaining records.
+    done = False
+
+    def on_record(self, index: int, record: Any) -> None:
+        pass
+
+    def on_dict(self, obj: Dict[str, Any], path: str, key: Any, depth: int) -> None:
+        pass
+
+    def on_list(self, obj: List[Any], path: str, key: Any, depth: int) -> None:
+        pass
+
+    def on_leaf(self, value: Any, path: str, key: Any, depth: int) -> None:
+        pass
+
+
+def _hooks(collectors: Sequence[Collector], name: str) -> List[Callable]:
+    base = getattr(Collector, name)
+    return [getattr(c, name) for c in collectors if getattr(type(c), name) is not base]
+
+
+def visit_records(
+    records: Iterable[Any], collectors: Sequence[Collector], is_array: bool = True, indices: Optional[Iterable[int]] = None
+) -> int:
+    """Walk ``records`` once, feeding every collector; return the number of records.
+
+    With ``is_array`` each record's path is ``[i]``, as when the whole
+    top-level array is walked; otherwise records are visited with an empty prefix.
+    ``indices`` gives each record's position instead of 0, 1, ... (e.g. the
+    positions of one shard's records in the full input).
+    """
+    count = 0
+    active: Optional[List[Collector]] = None
+    for index, record in enumerate(records) if indices is None else zip(indices, records):
+        count += 1
+        if active is None or any(c.done for c in active):
+            active = [c for c in collectors if not c.done]
+            on_record = _hooks(active, "on_record")
+            on_dict = _hooks(active, "on_dict")
+            on_list = _hooks(active, "on_list")
+            on_leaf = _hooks(active, "on_leaf")
+            if not active:
+                continue
+        for hook in on_record:
+            hook(index, record)
+        if not (on_dict or on_list or on_leaf):
+            continue
+
+        # Explicit stack of (child iterator, path, is_dict, child depth) frames:
+        # leaves are dispatched inline, and a container child suspends its
+        # parent's frame until its own subtree is done.
+        stack: List[Tuple[Iterator, str, bool, int]] = []
+        path = f"[{index}]" if is_array else ""
+        if isinstance(record, dict):
+            for hook in on_dict:
+                hook(record, path, None, 0)
+            stack.append((iter(record.items()), path, True, 1))
+        elif isinstance(record, list):
+            for hook in on_list:
+                hook(record, path, None, 0)
+            stack.append((enumerate(record), path, False, 1))
+        else:
+            for hook in on_leaf:
+                hook(record, path, None, 0)
+        while stack:
+            children, parent, is_dict, depth = stack[-1]
+            for key, node in children:
+                if is_dict:
+                    path = f"{parent}.{key}" if parent else key
+                else:
+                    path = f"{parent}[{key}]"
+                if isinstance(node, dict):
+                    for hook in on_dict:
+                        hook(node, path, key, depth)
+                    stack.append((iter(node.items()), path, True, depth + 1))
+                    break
+                if isinstance(node, list):
+                    for hook in on_list:
+                        hook(node, path, key, depth)
+                    stack.append((enumerate(node), path, False, depth + 1))
+                    break
+                for hook in on_leaf:
+                    hook(node, path, key, depth)
+            else:
+                stack.pop()
+    return count
+
+
+# ---------------- Single-analysis walks ----------------
+
+def iter_json_paths(obj: Any, prefix: str = "") -> Iterator[str]:
+    """Yield every JSON path below ``obj`` lazily, in ``extract_json_paths`` order.
+
+    Uses an explicit stack of child iterators, so depth is not limited by the
+    recursion limit and no per-level lists are built or concatenated.
+    """
+    stack: List[Tuple[Iterator, str, bool]] = []
+    if isinstance(obj, dict):
+        stack.append((iter(obj.items()), prefix, True))
+    elif isinstance(obj, list):
+        stack.append((enumerate(obj), prefix, False))
+    while stack:
+        children, parent, is_dict = stack[-1]
+        for key, value in children:
+            if is_dict:
+                path = f"{parent}.{key}" if parent else key
+            else:
+                path = f"{parent}[{key}]"
+            yield path
+            if isinstance(value, dict) and value:
+                stack.append((iter(value.items()), path, True))
+                break
+            if isinstance(value, list) and value:
+                stack.append((enumerate(value), path, False))
+                break
+        else:
+            stack.pop()
+
+
+def iter_field_combinations(obj: Any) -> Iterator[List[str]]:
+    """Yield the keys of every dict with more than one key, in ``find_field_combinations`` order.
+
+    Keys come in the dict's own order rather than as a ``set``, so graphs
+    built from them do not depend on the hash seed.
+    """
+    stack: List[Iterator] = [iter((obj,))]
+    while stack:
+        for value in stack[-1]:
+            if isinstance(value, dict):
+                if len(value) > 1:
+                    yield list(value)
+                stack.append(iter(value.values()))
+                break
+            if isinstance(value, list):
+                stack.append(iter(value))
+                break
+        else:
+            stack.pop()
+
+
+# ---------------- Collectors ----------------
+
+class PathCollector(Collector):
+    """Every JSON path, in ``extract_json_paths`` order (record roots included for arrays)."""
+
+    def __init__(self) -> None:
+        self.paths: List[str] = []
+
+    def on_dict(self, obj: Dict[str, Any], path: str, key: Any, depth: int) -> None:
+        if depth or path:
+            self.paths.append(path)
+
+    def on_list(self, obj: List[Any], path: str, key: Any, depth: int) -> None:
+        if depth or path:
+            self.paths.append(path)
+
+    def on_leaf(self, value: Any, path: str, key: Any, depth: int) -> None:
+        if depth or path:
+            self.paths.append(path)
+
+
+class FieldSetCollector(Collector):
+    """Keys of every dict with more than one key, as ``iter_field_combinations``.
+
+    Key lists are passed to ``on_set`` when given (e.g. to update a graph in place),
+    otherwise accumulated in ``field_sets``.
+    """
+
+    def __init__(self, on_set: Optional[Callable[[List[str]], None]] = None) -> None:
+        self.field_sets: List[List[str]] = []
+        self._emit = on_set or self.field_sets.append
+
+    def on_dict(self, obj: Dict[str, Any], path: str, key: Any, depth: int) -> None:
+        if len(obj) > 1:
+            self._emit(list(obj))
+
+
+class ParticipantCollector(Collector):
+    """Participants of each meeting (peoplePresent, host, documenter), as ``extract_participants``."""
+
+    def __init__(self, on_participants: Optional[Callable[[List[str]], None]] = None) -> None:
+        self.participants: List[List[str]] = []
+        self._emit = on_participants or self.participants.append
+
+    def on_record(self, index: int, record: Any) -> None:
+        meeting_info = (record.get("meetingInfo", {}) or {}) if isinstance(record, dict) else {}
+        self._emit(normalize_participants(meeting_info))
+
+
+class WorkgroupCollector(Collector):
+    """Workgroup mentions under any ``workgroup``/``workgroups`` key, as ``find_workgroups``.
+
+    Like ``find_workgroups``, values of a matching key are not searched further.
+    """
+
+    def __init__(self, workgroup_keys: Sequence[str] = ("workgroup", "workgroups")) -> None:
+        self.workgroup_keys = tuple(workgroup_keys)
+        self.found: List[str] = []
+        # Keys already known not to match, so most dicts are rejected by one
+        # C-level subset test instead of lower-casing every key.
+        self._other_keys: Set[str] = set()
+        self._blocked: Tuple[str, ...] = ()
+
+    def on_record(self, index: int, record: Any) -> None:
+        self._blocked = ()
+
+    def on_dict(self, obj: Dict[str, Any], path: str, key: Any, depth: int) -> None:
+        if obj.keys() <= self._other_keys:
+            return
+        if isinstance(key, str) and key.lower() in self.workgroup_keys:
+            return
+        if self._blocked and path.startswith(self._blocked):
+            return
+        for k, value in obj.items():
+            if k.lower() not in self.workgroup_keys:
+                self._other_keys.add(k)
+                continue
+            if isinstance(value, str):
+                self.found.append(value.strip())
+            elif isinstance(value, list):
+                self.found.extend(v.strip() for v in value if isinstance(v, str))
+            if isinstance(value, (dict, list)):
+                value_path = f"{path}.{k}" if path else k
+                self._blocked += (f"{value_path}.", f"{value_path}[")
+
+
+class SchemaCollector(Collector):
+    """Schema of the first record, as ``infer_schema`` (lists described by their first element)."""
+
+    def __init__(self) -> None:
+        self.schema: Any = None
+        self._stack: List[Any] = []
+        self._skip_depth: Optional[int] = None
+
+    def on_record(self, index: int, record: Any) -> None:
+        if index > 0 or self.schema is not None:
+            self.done = True
+
+    def _attach(self, value: Any, key: Any, depth: int) -> bool:
+        if self.done:
+            return False
+        if self._skip_depth is not None:
+            if depth > self._skip_depth:
+                return False
+            self._skip_depth = None
+        if depth == 0:
+            self.schema = value
+            self._stack = [value]
+            return True
+        del self._stack[depth:]
+        parent = self._stack[-1]
+        if isinstance(parent, dict):
+            parent[key] = value
+        elif key == 0:
+            parent.append(value)
+        else:
+            self._skip_depth = depth
+            return False
+        return True
+
+    def on_dict(self, obj: Dict[str, Any], path: str, key: Any, depth: int) -> None:
+        schema: Dict[str, Any] = {}
+        if self._attach(schema, key, depth):
+            self._stack.append(schema)
+
+    def on_list(self, obj: List[Any], path: str, key: Any, depth: int) -> None:
+        schema: List[Any] = [] if obj else ["empty_list"]
+        if self._attach(schema, key, depth):
+            self._stack.append(schema)
+
+    def on_leaf(self, value: Any, path: str, key: Any, depth: int) -> None:
+        self._attach(type(value).__name__, key, depth)
@@ -0,0 +1,140 @@
+"""
+Warm starts for iterative centralities, carried over between runs.
+
+Eigenvector centrality and PageRank are power iterations. Started from a
+uniform vector they need tens (sometimes hundreds) of iterations, although
+the nightly report runs on data that barely changes and the previous run's
+scores are already almost the fixed point. ``WarmStart`` keeps the final
+vector of every measure in a JSON file (``--warm-start`` or
+``GRAPH_WARM_START``; ``<state-dir>/centrality.json`` with ``--state-dir``),
+keyed by graph, measure and node label:
+
+- ``start`` returns the stored scores for the current graph's nodes. Nodes
+  added since then start at the mean score of their already-known neighbours
+  (a newcomer tied into a well-connected group starts high), or at the mean
+  of all stored scores when none of their neighbours is known. The solvers
+  renormalize the vector, so removed nodes simply drop out.
+- Eigenvector centrality on a disconnected graph also depends on how the
+  start is spread across components, and that balance is what takes a cold
+  start longest to settle. Its entry therefore keeps each node's component
+  too, and ``start`` lists the nodes whose component has exactly the same
+  members as last time (``settled``): the solver keeps their values as they
+  are and only rescales the components that changed.
+- ``record`` stores the new scores and the iteration count. The count of the
+  last cold (uniform) start is kept as the baseline, and warm runs report
+  ``iterations_saved`` against it together with the baseline's node count,
+  since the graph may have changed since.
+"""
+
+import json
+import os
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+import networkx as nx
+
+WARM_START_VERSION = 1
+
+
+def resolve_warm_start(path: Optional[str] = None, state_dir: Optional[str] = None) -> Optional[str]:
+    """Explicit path, then ``GRAPH_WARM_START``, then ``centrality.json`` in the state directory."""
+    path = path or os.environ.get("GRAPH_WARM_START")
+    if path:
+        return path
+    if state_dir:
+        return os.path.join(state_dir, "centrality.json")
+    return None
+
+
+def seed_vector(G: nx.Graph, previous: Dict[str, float]) -> Tuple[Dict[Any, float], int]:
+    """Start vector for ``G`` from ``previous`` scores, and the number of nodes that had none."""
+    known = {node: previous[str(node)] for node in G if str(node) in previous}
+    fallback = sum(known.values()) / len(known) if known else 0.0
+    vector: Dict[Any, float] = {}
+    new_nodes = 0
+    for node in G:
+        value = known.get(node)
+        if value is None:
+            new_nodes += 1
+            neighbours = [known[v] for v in G[node] if v in known]
+            value = sum(neighbours) / len(neighbours) if neighbours else fallback
+        vector[node] = value
+    return vector, new_nodes
+
+
+def component_ids(G: nx.Graph) -> Dict[str, int]:
+    """Component number of every node of ``G``, keyed by node label."""
+    return {str(node): i for i, component in enumerate(nx.connected_components(G)) for node in component}
+
+
+def settled_nodes(G: nx.Graph, previous: Dict[str, int]) -> List[Any]:
+    """Nodes of ``G`` in components whose members are exactly those of a component in ``previous``."""
+    sizes = Counter(previous.values())
+    settled: List[Any] = []
+    for component in nx.connected_components(G):
+        ids = {previous.get(str(node)) for node in component}
+        if len(ids) == 1:
+            (label,) = ids
+            if label is not None and sizes[label] == len(component):
+                settled.extend(component)
+    return settled
+
+
+class WarmStart:
+    """Final centrality vectors of the previous run, keyed by graph, measure and node label."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.graphs: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == WARM_START_VERSION:
+            self.graphs = data["graphs"]
+
+    def start(self, graph: str, measure: str, G: nx.Graph) -> Optional[Dict[str, Any]]:
+        """``{"vector": ..., "new_nodes": ..., "settled": ...}`` for the solver, or ``None`` for a cold start."""
+        entry = self.graphs.get(graph, {}).get(measure)
+        if not entry or not G.number_of_nodes():
+            return None
+        vector, new_nodes = seed_vector(G, entry["scores"])
+        if not any(vector.values()):
+            return None
+        settled = settled_nodes(G, entry["components"]) if "components" in entry else []
+        return {"vector": vector, "new_nodes": new_nodes, "settled": settled}
+
+    def record(
+        self,
+        graph: str,
+        measure: str,
+        scores: Dict[Any, float],
+        diagnostics: Dict[str, Any],
+        G: Optional[nx.Graph] = None,
+    ) -> None:
+        """Keep ``scores`` (and ``G``'s components, when given) for the next run; add ``iterations_saved`` to warm ``diagnostics``."""
+        previous = self.graphs.get(graph, {}).get(measure, {})
+        cold, cold_nodes = previous.get("cold_iterations"), previous.get("cold_nodes")
+        if diagnostics["start"] == "uniform":
+            cold, cold_nodes = diagnostics["iterations"], len(scores)
+        elif cold is not None:
+            diagnostics["iterations_saved"] = cold - diagnostics["iterations"]
+            diagnostics["baseline_nodes"] = cold_nodes
+        self.graphs.setdefault(graph, {})[measure] = {
+            "scores": {str(node): value for node, value in scores.items()},
+            "iterations": diagnostics["iterations"],
+            "cold_iterations": cold,
+            "cold_nodes": cold_nodes,
+        }
+        if G is not None:
+            self.graphs[graph][measure]["components"] = component_ids(G)
+
+    def save(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": WARM_START_VERSION, "graphs": self.graphs}, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, self.path)